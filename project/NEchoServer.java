@@ -5,12 +5,17 @@
  * 이 프로그램은 여러 클라이언트의 연결을 동시에 처리할 수 있는 멀티스레드 서버입니다.
  * 각 클라이언트로부터 에코 횟수와 메시지를 받아 해당 메시지를 n번 반복하여 응답합니다.
  * 
+ * 연결의 첫 바이트가 0xFF이고 바이너리 시작 인사(necho_protocol.BINARY_HELLO)가 오면
+ * 그 연결은 바이너리 프로토콜(12바이트 헤더 + 메시지 바이트)로 처리하고, 그 밖에는 JSON으로 처리합니다.
+ * 
  * 컴파일: javac NEchoServer.java
  * 실행: java NEchoServer [포트번호]
  */
 
 // 입출력 관련 클래스들 (스트림, 리더, 라이터 등)
 import java.io.*;
+// 바이너리 프로토콜의 메시지/에러 메시지 인코딩 (UTF-8)
+import java.nio.charset.StandardCharsets;
 // 네트워크 통신 관련 클래스들 (소켓, 서버소켓 등)
 import java.net.*;
 // 유틸리티 클래스들 (컬렉션 등)
@@ -26,6 +31,16 @@ import org.json.*;
  * 각 클라이언트를 별도의 스레드에서 처리합니다.
  */
 public class NEchoServer {
+    // 바이너리 프로토콜 시작 인사 - 0xFF, 'NEB', 버전 1, 줄바꿈 (necho_protocol.BINARY_HELLO와 같은 값)
+    private static final byte[] BINARY_HELLO = {(byte) 0xFF, 'N', 'E', 'B', 1, '\n'};
+    // 바이너리 프레임의 op 값 - N-Echo 요청/응답
+    private static final int OP_ECHO = 1;
+    // 바이너리 응답의 status 값
+    private static final int STATUS_OK = 0;
+    private static final int STATUS_ERROR = 1;
+    // 바이너리 요청 본문의 최대 크기 (바이트) - Python 서버와 같은 값
+    private static final long MAX_REQUEST_SIZE = 1024 * 1024;
+    
     // 서버가 바인딩할 주소 (0.0.0.0은 모든 네트워크 인터페이스)
     private String host;
     // 서버가 사용할 포트 번호
@@ -174,26 +189,14 @@ public class NEchoServer {
         public void run() {
             // try-with-resources: 자동으로 리소스를 닫아줌
             try (
-                // 클라이언트로부터 데이터를 읽기 위한 BufferedReader
-                // UTF-8 인코딩으로 텍스트 데이터 읽기
-                BufferedReader in = new BufferedReader(
-                    new InputStreamReader(clientSocket.getInputStream(), "UTF-8"));
-                // 클라이언트에게 데이터를 쓰기 위한 PrintWriter
-                // 두 번째 파라미터 true: 자동 flush (즉시 전송)
-                PrintWriter out = new PrintWriter(
-                    new OutputStreamWriter(clientSocket.getOutputStream(), "UTF-8"), true)
+                // 첫 바이트로 프로토콜을 판별한 뒤 되돌릴 수 있도록 mark()/reset()을 지원하는 버퍼 스트림
+                BufferedInputStream in = new BufferedInputStream(clientSocket.getInputStream());
+                OutputStream out = clientSocket.getOutputStream()
             ) {
-                String line;
-                // 클라이언트가 보낸 각 줄을 읽음 (null이면 연결 종료)
-                while ((line = in.readLine()) != null) {
-                    System.out.println("[수신] " + clientAddress + ": " + line);
-                    
-                    // 받은 요청 데이터를 처리하여 응답 생성
-                    String response = processRequest(line);
-                    
-                    // 응답을 클라이언트에게 전송
-                    // println()은 줄바꿈 문자를 자동으로 추가
-                    out.println(response);
+                if (isBinaryHello(in)) {
+                    serveBinary(in, out);
+                } else {
+                    serveJson(in, out);
                 }
                 
                 System.out.println("[연결 종료] " + clientAddress);
@@ -213,6 +216,164 @@ public class NEchoServer {
             }
         }
         
+        /**
+         * 연결의 첫 데이터가 바이너리 시작 인사인지 확인하는 메서드
+         * 
+         * 첫 바이트가 0xFF일 때만 인사 전체를 읽어 비교하므로 JSON 클라이언트는 기다리게 하지 않습니다.
+         * 인사가 아니면 읽은 바이트를 되돌려 JSON 처리에서 그대로 읽을 수 있게 합니다.
+         * 
+         * @param in 클라이언트 입력 스트림 (mark/reset 지원)
+         * @return 바이너리 시작 인사를 읽었으면 true (인사는 스트림에서 소비됨)
+         * @throws IOException 읽기 중 오류가 발생한 경우
+         */
+        private boolean isBinaryHello(BufferedInputStream in) throws IOException {
+            in.mark(BINARY_HELLO.length);
+            byte[] hello = new byte[BINARY_HELLO.length];
+            int read = 0;
+            // 첫 바이트를 먼저 읽고, 0xFF일 때만 나머지를 끝까지 읽음
+            while (read < hello.length && (read == 0 || hello[0] == BINARY_HELLO[0])) {
+                int count = in.read(hello, read, read == 0 ? 1 : hello.length - read);
+                if (count == -1) {
+                    break;
+                }
+                read += count;
+            }
+            if (read == hello.length && Arrays.equals(hello, BINARY_HELLO)) {
+                return true;
+            }
+            in.reset();
+            return false;
+        }
+        
+        /**
+         * JSON 프로토콜로 요청을 처리하는 메서드 (요청/응답 한 줄씩)
+         * 
+         * @param rawIn 클라이언트 입력 스트림
+         * @param rawOut 클라이언트 출력 스트림
+         * @throws IOException 통신 중 오류가 발생한 경우
+         */
+        private void serveJson(InputStream rawIn, OutputStream rawOut) throws IOException {
+            // 클라이언트로부터 데이터를 읽기 위한 BufferedReader
+            // UTF-8 인코딩으로 텍스트 데이터 읽기
+            BufferedReader in = new BufferedReader(new InputStreamReader(rawIn, "UTF-8"));
+            // 클라이언트에게 데이터를 쓰기 위한 PrintWriter
+            // 두 번째 파라미터 true: 자동 flush (즉시 전송)
+            PrintWriter out = new PrintWriter(new OutputStreamWriter(rawOut, "UTF-8"), true);
+            
+            String line;
+            // 클라이언트가 보낸 각 줄을 읽음 (null이면 연결 종료)
+            while ((line = in.readLine()) != null) {
+                System.out.println("[수신] " + clientAddress + ": " + line);
+                
+                // 받은 요청 데이터를 처리하여 응답 생성
+                String response = processRequest(line);
+                
+                // 응답을 클라이언트에게 전송
+                // println()은 줄바꿈 문자를 자동으로 추가
+                out.println(response);
+            }
+        }
+        
+        /**
+         * 바이너리 프로토콜로 요청을 처리하는 메서드
+         * 
+         * 요청은 12바이트 헤더(op, status, flags, n, length) 뒤에 length바이트 메시지가 오는 형식입니다.
+         * JSON 파싱과 문자열 변환 없이 받은 메시지 바이트를 그대로 한 번만 돌려보내고,
+         * 반복 횟수는 헤더의 n으로 전달합니다.
+         * 
+         * @param rawIn 클라이언트 입력 스트림 (시작 인사는 이미 읽은 상태)
+         * @param rawOut 클라이언트 출력 스트림
+         * @throws IOException 통신 중 오류가 발생한 경우
+         */
+        private void serveBinary(InputStream rawIn, OutputStream rawOut) throws IOException {
+            DataInputStream in = new DataInputStream(rawIn);
+            // 응답을 모아서 보내기 위한 버퍼 (파이프라이닝된 요청의 응답을 한 번에 전송)
+            DataOutputStream out = new DataOutputStream(new BufferedOutputStream(rawOut, 65536));
+            
+            // 시작 인사를 그대로 돌려보내 바이너리 프로토콜 사용을 알림
+            out.write(BINARY_HELLO);
+            out.flush();
+            
+            while (true) {
+                // 헤더의 첫 바이트 (-1이면 연결 종료)
+                int op = in.read();
+                if (op == -1) {
+                    break;
+                }
+                in.readUnsignedByte();  // status (요청에서는 사용하지 않음)
+                in.readUnsignedShort();  // flags (예약)
+                // n과 length는 부호 없는 32비트 정수
+                long n = in.readInt() & 0xFFFFFFFFL;
+                long length = in.readInt() & 0xFFFFFFFFL;
+                
+                // 너무 큰 요청은 본문을 읽지 않고 에러 응답 후 연결 종료
+                if (length > MAX_REQUEST_SIZE) {
+                    writeBinaryFrame(out, op, STATUS_ERROR, 0,
+                        "프레임 크기가 최대 허용 크기(" + MAX_REQUEST_SIZE + "바이트)를 넘었습니다.");
+                    out.flush();
+                    break;
+                }
+                byte[] message = new byte[(int) length];
+                in.readFully(message);
+                System.out.println("[수신] " + clientAddress + ": 바이너리 op=" + op +
+                                 " n=" + n + ", " + length + "바이트");
+                
+                // JSON 프로토콜과 같은 유효성 검사
+                if (op != OP_ECHO) {
+                    writeBinaryFrame(out, op, STATUS_ERROR, 0, "지원하지 않는 요청입니다.");
+                } else if (n == 0) {
+                    writeBinaryFrame(out, op, STATUS_ERROR, 0, "n은 양의 정수여야 합니다.");
+                } else if (length == 0) {
+                    writeBinaryFrame(out, op, STATUS_ERROR, 0, "message는 비어있을 수 없습니다.");
+                } else {
+                    writeBinaryFrame(out, op, STATUS_OK, n, message);
+                    System.out.println("[응답] " + clientAddress +
+                                     "에게 메시지를 " + n + "번 전송 (바이너리)");
+                }
+                
+                // 이미 도착한 다음 요청이 없을 때만 전송 (있으면 응답을 모아서 한 번에 보냄)
+                if (in.available() == 0) {
+                    out.flush();
+                }
+            }
+            out.flush();
+        }
+        
+        /**
+         * 바이너리 응답 프레임(헤더 + 본문)을 쓰는 메서드
+         * 
+         * @param out 응답을 쓸 스트림
+         * @param op 요청의 op 값
+         * @param status STATUS_OK 또는 STATUS_ERROR
+         * @param n 에코 횟수 (에러 응답은 0)
+         * @param body 본문 (성공 응답은 메시지 한 번)
+         * @throws IOException 쓰기 중 오류가 발생한 경우
+         */
+        private void writeBinaryFrame(DataOutputStream out, int op, int status, long n, byte[] body)
+                throws IOException {
+            out.writeByte(op);
+            out.writeByte(status);
+            out.writeShort(0);  // flags (예약)
+            out.writeInt((int) n);
+            out.writeInt(body.length);
+            out.write(body);
+        }
+        
+        /**
+         * 바이너리 에러 응답 프레임을 쓰는 메서드
+         * 
+         * @param out 응답을 쓸 스트림
+         * @param op 요청의 op 값
+         * @param status STATUS_ERROR
+         * @param n 0
+         * @param errorMessage 클라이언트에게 전달할 에러 메시지
+         * @throws IOException 쓰기 중 오류가 발생한 경우
+         */
+        private void writeBinaryFrame(DataOutputStream out, int op, int status, long n, String errorMessage)
+                throws IOException {
+            writeBinaryFrame(out, op, status, n, errorMessage.getBytes(StandardCharsets.UTF_8));
+        }
+        
         /**
          * 클라이언트 요청을 처리하는 메서드
          * 
@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+N-Echo 벤치마크 도구 (Python)
+여러 개의 동시 연결로 N-Echo 서버에 부하를 주고 처리량과 지연 시간을 측정하는 프로그램
+
+이 프로그램은 asyncio를 사용해 하나의 프로세스에서 수천 개의 연결을 동시에 열고,
+각 연결에서 요청/응답을 주고받으며 요청마다 응답까지 걸린 시간을 기록합니다.
+끝나면 처리량(req/s, MB/s)과 지연 시간 백분위수(p50/p90/p99/p99.9)를 출력합니다.
+
+- 부하 크기: 연결당 요청 수(-r) 또는 측정 시간(-d) 중 하나로 지정
+- 요청 구성: --mix로 여러 (n, 메시지 크기) 조합을 비율에 맞춰 섞어 보냄
+- 프로토콜: --protocol binary로 바이너리 프로토콜을 협상해 JSON과 비교 (기본값: json)
+- 파이프라이닝: -w로 연결당 응답을 기다리지 않고 보내는 요청 수를 지정 (여러 값이면 차례로 측정)
+- 대상: 프로토콜이 같으므로 Python 서버, Java 서버, 임의의 host:port 모두 측정 가능
+        host 자리에 'unix:/경로'를 주면 유닉스 도메인 소켓으로 연결 (TCP와 비교용)
+  --spawn python/java를 주면 서버를 직접 띄워 같은 조건으로 측정한 뒤 종료합니다.
+- 튜닝 비교: --sweep으로 소켓 튜닝 프로필 목록을 주면 프로필마다 서버를 다시 띄워 같은 부하로 측정하고
+  처리량, 지연 시간, 연결 실패를 표로 비교 (--spawn python 필요)
+
+사용 예:
+    python3 bench.py localhost 5000 -c 1000 -r 10
+    python3 bench.py localhost 5000 -c 1 -r 20000 -w 1 4 16 64 256
+    python3 bench.py localhost 5000 -c 64 -d 10 --mix 1:16:70 100:64:25 10000:16:5
+    python3 bench.py localhost 5100 -c 64 -d 10 --spawn java
+    python3 bench.py unix:/tmp/necho.sock -c 32 -d 10
+    python3 bench.py localhost 5000 -c 8 -d 10 --mix 3:65536 --protocol binary
+    python3 bench.py -c 1000 -r 1 --spawn python --sweep default backlog=128 latency burst
+"""
+
+# asyncio: 여러 연결을 하나의 이벤트 루프에서 동시에 다루기 위한 라이브러리
+import asyncio
+# time: 경과 시간 측정을 위한 라이브러리
+import time
+# argparse: 명령줄 옵션 파싱을 위한 라이브러리
+import argparse
+# random: 요청 구성(mix) 비율에 맞춰 요청 순서를 섞기 위한 라이브러리
+import random
+# socket: 직접 띄운 서버가 연결을 받을 준비가 되었는지 확인하기 위한 라이브러리
+import socket
+# subprocess: --spawn 옵션으로 서버 프로세스를 띄우기 위한 라이브러리
+import subprocess
+# sys: 현재 파이썬 실행 파일 경로를 얻기 위한 라이브러리
+import sys
+# os: 서버 스크립트 경로 계산을 위한 라이브러리
+import os
+# collections.deque: 먼저 도착한 응답 프레임과 전송 시각을 순서대로 보관하기 위한 큐
+from collections import deque
+# necho_protocol: 요청/응답 프레이밍 (줄바꿈으로 구분된 JSON 또는 바이너리 프레임)
+from necho_protocol import (FrameBuffer, encode_frame, decode_frame, parse_address,
+                            format_address, BinaryFrameBuffer, encode_binary_frame,
+                            BINARY_HELLO, BINARY_HEADER, STATUS_OK, RECV_SIZE, ENCODING_REPEAT)
+# necho_async: 주소 형식에 맞는 연결 (TCP 또는 유닉스 도메인 소켓)
+from necho_async import open_necho_connection
+# necho_tuning: --sweep 프로필을 서버를 띄우기 전에 검사
+from necho_tuning import load_tuning
+
+# 이 파일이 있는 디렉터리 (서버 스크립트와 Java 클래스 파일 위치)
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# --spawn 옵션으로 띄울 수 있는 서버 실행 명령 (포트 번호는 뒤에 붙음)
+SERVER_COMMANDS = {
+    'python': [sys.executable, os.path.join(PROJECT_DIR, 'python_server.py')],
+    'java': ['java', '-cp', os.pathsep.join(['.', 'json-20231013.jar']), 'NEchoServer'],
+}
+
+# 연결마다 미리 섞어 두는 요청 순서의 길이 (요청마다 난수를 뽑지 않기 위함)
+SCHEDULE_LENGTH = 1024
+
+# 보고할 지연 시간 백분위수
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def parse_mix(specs):
+    """
+    --mix 옵션 값을 (n, 메시지 크기, 비율) 목록으로 변환하는 함수
+    
+    Args:
+        specs (list): 'n:크기:비율' 형식의 문자열 목록 (비율은 생략 가능, 기본값 1)
+    
+    Returns:
+        list: (n, size, weight) 튜플의 목록
+    
+    Raises:
+        ValueError: 형식이 올바르지 않은 경우
+    """
+    mix = []
+    for spec in specs:
+        parts = spec.split(':')
+        if len(parts) not in (2, 3):
+            raise ValueError(f"mix 형식이 올바르지 않습니다: {spec} (예: 100:64:25)")
+        n, size = int(parts[0]), int(parts[1])
+        weight = float(parts[2]) if len(parts) == 3 else 1.0
+        if n <= 0 or size <= 0 or weight <= 0:
+            raise ValueError(f"mix 값은 모두 양수여야 합니다: {spec}")
+        mix.append((n, size, weight))
+    return mix
+
+
+def build_requests(mix, message, encoding=None, protocol='json'):
+    """
+    요청 구성(mix)마다 보낼 요청 프레임을 미리 만드는 함수
+    
+    Args:
+        mix (list): (n, size, weight) 튜플의 목록
+        message (str): 메시지의 기본 문자열 (size 글자가 되도록 반복하거나 자름)
+        encoding (str): 요청할 응답 인코딩 (기본값: None - 기존 echoes 배열)
+        protocol (str): 'json' 또는 'binary' (바이너리 응답은 항상 메시지를 한 번만 담음)
+    
+    Returns:
+        tuple: (요청 프레임 목록, 비율 목록)
+    """
+    frames, weights = [], []
+    for n, size, weight in mix:
+        text = (message * (size // len(message) + 1))[:size]
+        if protocol == 'binary':
+            frames.append(encode_binary_frame(n, text.encode('utf-8')))
+            weights.append(weight)
+            continue
+        request = {'n': n, 'message': text}
+        if encoding:
+            request['encoding'] = encoding
+        frames.append(encode_frame(request))
+        weights.append(weight)
+    return frames, weights
+
+
+async def read_frame(reader, buffer, frames):
+    """
+    스트림에서 응답 프레임 하나를 읽는 코루틴
+    
+    Args:
+        reader (asyncio.StreamReader): 서버로부터 데이터를 읽는 스트림
+        buffer (FrameBuffer): 연결별 증분 수신 버퍼
+        frames (deque): 수신했지만 아직 꺼내지 않은 프레임
+    
+    Returns:
+        bytes: 구분자를 제외한 응답 프레임
+    """
+    while not frames:
+        data = await reader.read(RECV_SIZE)
+        if not data:
+            raise ConnectionError("서버가 연결을 종료했습니다.")
+        frames.extend(buffer.feed(data))
+    return frames.popleft()
+
+
+async def run_connection(host, port, schedule, results, window=1, requests=None, deadline=None,
+                         protocol='json'):
+    """
+    연결 하나를 열어 요청/응답을 주고받으며 요청별 지연 시간을 기록하는 코루틴
+    
+    window가 1보다 크면 응답을 기다리지 않고 최대 window개의 요청을 연달아 보냅니다.
+    서버는 요청 순서대로 응답하므로, 보낸 시각을 큐에 넣어 두었다가
+    응답이 올 때마다 가장 오래된 시각을 꺼내 지연 시간을 계산합니다.
+    
+    Args:
+        host (str): 서버 주소 ('unix:/경로'면 유닉스 도메인 소켓)
+        port (int): 서버 포트 번호
+        schedule (list): 이 연결이 차례로 보낼 요청 프레임 목록 (끝나면 처음부터 반복)
+        results (dict): 성공/실패 횟수, 지연 시간 목록, 수신 바이트를 누적할 딕셔너리
+        window (int): 파이프라이닝 윈도 크기 (기본값: 1 - 요청마다 응답 대기)
+        requests (int): 보낼 요청 수 (기본값: None - deadline까지 계속 보냄)
+        deadline (float): 새 요청을 그만 보낼 시각 (time.perf_counter() 기준)
+        protocol (str): 'json' 또는 'binary' (schedule의 프레임 형식과 같아야 함)
+    """
+    binary = protocol == 'binary'
+    try:
+        # TCP 또는 유닉스 도메인 소켓 (주소 형식으로 결정)
+        reader, writer = await open_necho_connection(host, port)
+    except OSError:
+        # 연결 자체가 실패한 경우 (백로그 초과, 파일 디스크립터 부족 등)
+        results['connect_errors'] += 1
+        return
+    
+    if binary:
+        # 바이너리 프로토콜 협상 - 지원하지 않는 서버는 연결 실패로 셈
+        try:
+            writer.write(BINARY_HELLO)
+            reply = await reader.readexactly(len(BINARY_HELLO))
+        except (OSError, asyncio.IncompleteReadError):
+            reply = None
+        if reply != BINARY_HELLO:
+            results['connect_errors'] += 1
+            writer.close()
+            return
+    
+    buffer, frames = (BinaryFrameBuffer() if binary else FrameBuffer()), deque()
+    sent_at = deque()  # 응답을 기다리는 요청들의 전송 시각
+    latencies = results['latencies']
+    sent = received = 0
+    position = 0
+    try:
+        while True:
+            in_flight = sent - received
+            more = sent < requests if requests is not None else time.perf_counter() < deadline
+            if not more and in_flight == 0:
+                break
+            # 대기 중인 요청이 윈도의 절반 이하로 줄면 윈도를 다시 채움
+            if more and in_flight <= window // 2:
+                count = window - in_flight
+                if requests is not None:
+                    count = min(count, requests - sent)
+                batch = []
+                for _ in range(count):
+                    batch.append(schedule[position])
+                    position = (position + 1) % len(schedule)
+                sent_at.extend([time.perf_counter()] * count)
+                writer.write(b''.join(batch))
+                await writer.drain()
+                sent += count
+            
+            frame = await read_frame(reader, buffer, frames)
+            latencies.append(time.perf_counter() - sent_at.popleft())
+            received += 1
+            if binary:
+                results['bytes_in'] += BINARY_HEADER.size + len(frame.body)
+                success = frame.status == STATUS_OK
+            else:
+                results['bytes_in'] += len(frame) + 1
+                success = decode_frame(frame).get('status') == 'success'
+            if success:
+                results['ok'] += 1
+            else:
+                results['errors'] += 1
+    except (OSError, ValueError):
+        # 연결이 끊기거나 응답을 해석할 수 없는 경우 (응답을 받지 못한 요청은 모두 실패)
+        results['errors'] += max(1, sent - received)
+    finally:
+        writer.close()
+
+
+async def run_benchmark(host, port, connections, frames, weights, window=1,
+                        requests=None, duration=None, seed=0, protocol='json'):
+    """
+    여러 연결을 동시에 실행하고 결과를 모아 반환하는 코루틴
+    
+    Args:
+        host (str): 서버 주소
+        port (int): 서버 포트 번호
+        connections (int): 동시 연결 수
+        frames (list): 요청 구성별 요청 프레임
+        weights (list): 요청 구성별 비율
+        window (int): 파이프라이닝 윈도 크기
+        requests (int): 연결당 요청 수 (duration과 둘 중 하나만 지정)
+        duration (float): 측정 시간 (초)
+        seed (int): 요청 순서를 섞을 난수 시드 (같은 시드면 같은 부하)
+        protocol (str): 'json' 또는 'binary'
+    
+    Returns:
+        dict: ok, errors, connect_errors, latencies(초 단위 목록), bytes_in, elapsed(초)
+    """
+    rng = random.Random(seed)
+    results = {'ok': 0, 'errors': 0, 'connect_errors': 0, 'latencies': [], 'bytes_in': 0}
+    started = time.perf_counter()
+    deadline = started + duration if duration is not None else None
+    await asyncio.gather(*(
+        run_connection(host, port, rng.choices(frames, weights, k=SCHEDULE_LENGTH),
+                       results, window, requests, deadline, protocol)
+        for _ in range(connections)
+    ))
+    results['elapsed'] = time.perf_counter() - started
+    return results
+
+
+def percentile(sorted_values, p):
+    """
+    정렬된 값 목록에서 p 백분위수를 구하는 함수 (nearest-rank 방식)
+    
+    Args:
+        sorted_values (list): 오름차순으로 정렬된 값
+        p (float): 백분위 (0~100)
+    
+    Returns:
+        float: 백분위수 (값이 없으면 0.0)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = -(-len(sorted_values) * p // 100)  # 올림 나눗셈
+    return sorted_values[max(1, int(rank)) - 1]
+
+
+def summarize(results):
+    """
+    벤치마크 결과에서 처리량과 지연 시간 백분위수를 계산하는 함수
+    
+    Args:
+        results (dict): run_benchmark()의 반환값
+    
+    Returns:
+        dict: throughput(req/s), mbps(수신 MB/s), max_ms, 백분위별 지연 시간(ms)
+    """
+    latencies = sorted(results['latencies'])
+    elapsed = results['elapsed'] or 1e-9
+    summary = {
+        'throughput': results['ok'] / elapsed,
+        'mbps': results['bytes_in'] / elapsed / 1e6,
+        'max_ms': latencies[-1] * 1000 if latencies else 0.0,
+    }
+    for p in PERCENTILES:
+        summary[p] = percentile(latencies, p) * 1000
+    return summary
+
+
+def spawn_server(kind, port, extra_args=()):
+    """
+    측정할 서버 프로세스를 띄우고 연결을 받을 준비가 될 때까지 기다리는 함수
+    
+    Args:
+        kind (str): 'python' 또는 'java'
+        port (int): 서버 포트 번호
+        extra_args (list): 서버 명령에 덧붙일 인자 (예: ['--engine', 'asyncio'])
+    
+    Returns:
+        subprocess.Popen: 실행 중인 서버 프로세스
+    
+    Raises:
+        RuntimeError: 서버가 10초 안에 준비되지 않은 경우
+    """
+    command = SERVER_COMMANDS[kind] + [str(port)] + list(extra_args)
+    # 서버의 콘솔 출력은 측정에 영향을 주지 않도록 버림
+    process = subprocess.Popen(command, cwd=PROJECT_DIR,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    give_up = time.monotonic() + 10
+    while time.monotonic() < give_up:
+        if process.poll() is not None:
+            raise RuntimeError(f"서버가 시작하자마자 종료되었습니다: {' '.join(command)}")
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.5).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError(f"서버가 준비되지 않았습니다: {' '.join(command)}")
+
+
+def run_windows(args, host, target, frames, weights, mix, requests, profile, summary):
+    """
+    윈도 크기마다 벤치마크를 실행하고 결과를 출력하는 함수
+    
+    Args:
+        args (argparse.Namespace): 명령줄 인자
+        host (str): 서버 주소
+        target (str): 출력할 대상 이름
+        frames (list): 요청 구성별 요청 프레임
+        weights (list): 요청 구성별 비율
+        mix (list): 요청 구성 (출력용)
+        requests (int): 연결당 요청 수 (None이면 args.duration 동안 측정)
+        profile (str): 서버에 적용한 튜닝 프로필 (None이면 출력하지 않음)
+        summary (list): (프로필, 윈도, 요약, 결과)를 덧붙일 목록
+    """
+    for window in args.window:
+        results = asyncio.run(run_benchmark(
+            host, args.port, args.connections, frames, weights, window,
+            requests, args.duration, args.seed, args.protocol))
+        stats = summarize(results)
+        summary.append((profile, window, stats, results))
+        
+        print("=" * 50)
+        print(f"대상       : {target}")
+        if profile is not None:
+            print(f"서버 튜닝  : {profile}")
+        print(f"프로토콜   : {args.protocol}")
+        print(f"동시 연결  : {args.connections}")
+        if requests is not None:
+            print(f"연결당 요청: {requests}")
+        else:
+            print(f"측정 시간  : {args.duration:g}초")
+        print("요청 구성  : " + ", ".join(f"n={n}/{size}자 x{weight:g}" for n, size, weight in mix))
+        print(f"윈도       : {window}")
+        print(f"성공 요청  : {results['ok']}")
+        print(f"실패 요청  : {results['errors']}")
+        print(f"연결 실패  : {results['connect_errors']}")
+        print(f"경과 시간  : {results['elapsed']:.2f}초")
+        print(f"처리량     : {stats['throughput']:.0f} req/s (수신 {stats['mbps']:.1f} MB/s)")
+        print("지연 시간  : " + ", ".join(f"p{p:g}={stats[p]:.2f}ms" for p in PERCENTILES)
+              + f", max={stats['max_ms']:.2f}ms")
+        print("=" * 50)
+
+
+def main():
+    """
+    메인 함수 - 프로그램의 진입점
+    
+    명령줄 인자를 처리하고 벤치마크를 실행한 뒤 결과를 출력합니다.
+    """
+    parser = argparse.ArgumentParser(description='N-Echo 벤치마크 도구')
+    parser.add_argument('host', nargs='?', default='localhost', help='서버 주소 (기본값: localhost)')
+    parser.add_argument('port', nargs='?', type=int, default=5000, help='서버 포트 번호 (기본값: 5000)')
+    parser.add_argument('-c', '--connections', type=int, default=100, help='동시 연결 수 (기본값: 100)')
+    parser.add_argument('-r', '--requests', type=int, default=10, help='연결당 요청 수 (기본값: 10)')
+    parser.add_argument('-d', '--duration', type=float, default=None,
+                        help='측정 시간(초) - 지정하면 -r 대신 이 시간 동안 계속 요청')
+    parser.add_argument('-n', type=int, default=3, help='요청의 에코 횟수 (기본값: 3, --mix가 없을 때)')
+    parser.add_argument('-m', '--message', default='Hello, World!', help='요청 메시지 (--mix의 기본 문자열)')
+    parser.add_argument('--mix', nargs='+', default=None,
+                        help="요청 구성 'n:메시지크기:비율' 목록 (예: 1:16:70 100:64:25 10000:16:5)")
+    parser.add_argument('--encoding', choices=[ENCODING_REPEAT], default=None,
+                        help='압축 응답 인코딩 요청 (기본값: 기존 echoes 배열)')
+    parser.add_argument('--protocol', choices=['json', 'binary'], default='json',
+                        help='전송 프로토콜 (기본값: json, binary는 --encoding과 관계없이 메시지를 한 번만 받음)')
+    parser.add_argument('-w', '--window', type=int, nargs='+', default=[1],
+                        help='파이프라이닝 윈도 크기 - 여러 값을 주면 차례로 측정 (기본값: 1)')
+    parser.add_argument('--seed', type=int, default=0, help='요청 순서를 섞을 난수 시드 (기본값: 0)')
+    parser.add_argument('--spawn', choices=sorted(SERVER_COMMANDS), default=None,
+                        help='측정 전에 서버를 직접 띄움 (python 또는 java, 주소는 127.0.0.1 사용)')
+    parser.add_argument('--sweep', nargs='+', default=None, metavar='PROFILE',
+                        help="비교할 소켓 튜닝 프로필 - 프리셋 이름, JSON 파일 또는 'backlog=128,nodelay=off' 형식 "
+                             "(프로필마다 서버를 다시 띄워 측정, --spawn python 필요)")
+    parser.add_argument('--server-args', nargs=argparse.REMAINDER, default=[],
+                        help='--spawn으로 띄울 서버에 넘길 인자 (맨 마지막에 지정)')
+    args = parser.parse_args()
+    
+    try:
+        mix = parse_mix(args.mix) if args.mix else [(args.n, len(args.message), 1.0)]
+        for profile in args.sweep or ():
+            load_tuning(profile)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    if args.sweep and args.spawn != 'python':
+        parser.error('--sweep은 --spawn python과 함께 사용해야 합니다 (프로필마다 서버를 다시 띄움).')
+    frames, weights = build_requests(mix, args.message, args.encoding, args.protocol)
+    requests = None if args.duration is not None else args.requests
+    host = '127.0.0.1' if args.spawn else args.host
+    target = format_address(*parse_address(host, args.port)) + (f" ({args.spawn} 서버)" if args.spawn else "")
+    
+    summary = []
+    # 튜닝 프로필마다 서버를 새로 띄워 측정 (--sweep이 없으면 한 번만)
+    for profile in args.sweep or [None]:
+        server_args = (['--tuning', profile] if profile else []) + args.server_args
+        server = spawn_server(args.spawn, args.port, server_args) if args.spawn else None
+        try:
+            run_windows(args, host, target, frames, weights, mix, requests, profile, summary)
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+    
+    if args.sweep:
+        # 튜닝 프로필별 비교표
+        width = max(len('프로필'), *(len(profile) for profile in args.sweep))
+        print(f"{'프로필':<{width}} | {'윈도':>4} | {'처리량 (req/s)':>14} | {'p50 (ms)':>9} | {'p99 (ms)':>9}"
+              f" | {'max (ms)':>9} | {'연결 실패':>6}")
+        for profile, window, stats, results in summary:
+            print(f"{profile:<{width}} | {window:>4} | {stats['throughput']:>14.0f} | {stats[50]:>9.2f}"
+                  f" | {stats[99]:>9.2f} | {stats['max_ms']:>9.2f} | {results['connect_errors']:>6}")
+    elif len(summary) > 1:
+        # 윈도 크기별 처리량 비교표 (윈도 1이 있으면 윈도 1, 없으면 처음 측정한 윈도 기준)
+        base_window, base_stats = next(((window, stats) for _, window, stats, _ in summary if window == 1),
+                                       summary[0][1:3])
+        base = base_stats['throughput'] or 1.0
+        ratio_label = f"윈도 {base_window} 대비"
+        print(f"{'윈도':>6} | {'처리량 (req/s)':>14} | {ratio_label:>8} | {'p50 (ms)':>9} | {'p99 (ms)':>9}")
+        for _, window, stats, _ in summary:
+            print(f"{window:>6} | {stats['throughput']:>14.0f} | {stats['throughput'] / base:>7.1f}x"
+                  f" | {stats[50]:>9.2f} | {stats[99]:>9.2f}")
+
+
+# 이 파일이 직접 실행될 때만 main() 함수 호출
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,696 @@
+#!/usr/bin/env python3
+"""
+통합 서버 (Python)
+Time, Echo, Number, N-Echo 네 가지 서비스를 하나의 프로세스, 하나의 이벤트 루프에서 제공하는 서버
+
+기존에는 time_server.py, echo_server.py, number_server.py, python_server.py를
+각각 별도의 프로세스로 실행해야 했습니다. 이 서버는 asyncio 이벤트 루프 하나에
+네 서비스의 서버 소켓을 모두 등록하고, 설정, 로그, 메트릭, 종료 처리를 함께 사용합니다.
+
+프로토콜은 기존 서버와 같으므로 기존 클라이언트를 그대로 사용할 수 있습니다.
+  - time   (기본 9001) : 접속하면 현재 시간 메시지를 보내고 연결 종료, 같은 포트의 UDP 요청에도 응답
+  - echo   (기본 9002) : 받은 데이터를 "Echo: " 뒤에 붙여 돌려줌, quit/exit이면 인사 후 종료
+  - number (기본 9003) : 숫자 맞추기 게임
+  - necho  (기본 5000) : N-Echo JSON 프로토콜 (NEchoServer의 asyncio 엔진 처리 코드를 그대로 사용)
+                         --necho-unix 경로를 주면 같은 서비스를 유닉스 도메인 소켓으로도 제공
+
+설정은 명령줄 옵션 또는 JSON 설정 파일(--config)로 지정하며, 명령줄 옵션이 우선합니다.
+포트를 0으로 지정한 서비스는 실행하지 않습니다.
+
+SIGTERM 또는 Ctrl+C를 받으면 모든 서비스가 함께 종료 절차를 밟습니다.
+  1. 새 연결 수락 중단 (서버 소켓 닫기)
+  2. Echo/Number 연결은 보내던 응답을 마저 보낸 뒤 종료 (Number는 종료 안내 메시지 전송)
+  3. N-Echo 연결은 이미 받은 요청까지 응답한 뒤 종료, --drain-timeout초 안에 끝나지 않으면 정리
+
+사용 예:
+    python3 multi_server.py
+    python3 multi_server.py --necho-port 5000 --number-port 0 --metrics-port 9100
+    python3 multi_server.py --config multi_server.json
+    python3 multi_server.py --necho-unix /tmp/necho.sock
+"""
+
+# asyncio: 네 서비스를 하나의 이벤트 루프에서 처리하기 위한 라이브러리
+import asyncio
+# argparse: 명령줄 옵션 파싱을 위한 라이브러리
+import argparse
+# json: 설정 파일을 읽기 위한 라이브러리
+import json
+# os: tcp_socket_programming 폴더 경로 계산을 위한 라이브러리
+import os
+# signal: SIGTERM/SIGINT 종료 처리를 위한 라이브러리
+import signal
+# sys: 모듈 검색 경로에 기존 서버 폴더를 추가하기 위한 라이브러리
+import sys
+# time: 유휴 연결 판단 및 통계 출력 주기 계산을 위한 라이브러리
+import time
+# collections.OrderedDict: 마지막 수신 순서로 정렬된 연결 목록 (유휴 연결을 앞에서부터 정리)
+from collections import OrderedDict
+# python_server: N-Echo 서버 (asyncio 엔진의 연결 처리 코루틴과 카운터를 그대로 사용)
+from python_server import NEchoServer, STAT_NAMES, bind_unix_socket
+# necho_metrics: 메트릭 조회 서버
+from necho_metrics import MetricsServer
+# necho_log: 백그라운드 스레드에서 출력하는 레벨별 로거
+from necho_log import log, setup_logging, LOG_LEVELS, LOG_FORMATS
+# necho_tuning: 백로그와 TCP 소켓 옵션 프로필 (모든 서비스의 서버 소켓에 적용)
+from necho_tuning import (DEFAULT_TUNING, load_tuning, tune_listen_socket, tune_connection, describe_tuning,
+                          add_tuning_arguments)
+
+# 기존 Time/Echo/Number 서버의 프로토콜 상수와 게임 로직을 그대로 사용하기 위해 폴더를 검색 경로에 추가
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COURSE_DIR = os.path.join(REPO_DIR, 'tcp_socket_programming')
+COURSE_FOLDERS = ('1_time_server', '2_echo_server', '3_number_server')
+for _folder in COURSE_FOLDERS:
+    sys.path.insert(0, os.path.join(COURSE_DIR, _folder))
+
+try:
+    # time_server: 초 단위 시간 메시지 캐시와 UDP 고해상도 응답 형식
+    from time_server import TimeMessageCache, NS_REQUEST, NS_HEADER
+    # echo_server: 종료 명령, 응답 접두어, 종료 인사
+    from echo_server import QUIT_COMMANDS, ECHO_PREFIX, GOODBYE_MESSAGE
+    # number_server: 게임 상태와 안내 메시지
+    from number_server import (GameSession, WELCOME_MESSAGE, BUSY_MESSAGE, IDLE_MESSAGE,
+                               RESULT_WIN, RESULT_LOSE, RESULT_QUIT)
+except ImportError as e:
+    # 폴더가 없거나 이름이 바뀐 경우 - 어떤 폴더가 필요한지 알려 줌
+    _missing = [folder for folder in COURSE_FOLDERS if not os.path.isdir(os.path.join(COURSE_DIR, folder))]
+    raise ImportError(f"multi_server.py는 {COURSE_DIR}의 Time/Echo/Number 서버 모듈을 사용합니다 "
+                      f"(필요한 폴더: {', '.join(COURSE_FOLDERS)}"
+                      f"{', 없는 폴더: ' + ', '.join(_missing) if _missing else ''}): {e}") from e
+
+# 서비스 이름 (시작 순서)
+SERVICES = ('time', 'echo', 'number', 'necho')
+
+# 기본 설정 (설정 파일의 키, 명령줄 옵션 이름과 같음)
+DEFAULT_CONFIG = {
+    'host': '0.0.0.0',
+    'time_port': 9001,
+    'echo_port': 9002,
+    'number_port': 9003,
+    'necho_port': 5000,
+    'necho_unix': None,         # N-Echo 유닉스 도메인 소켓 경로 (None이면 사용 안 함)
+    'time_udp': True,           # Time 서비스 포트에서 UDP 요청도 받을지 여부
+    'backlog': 1024,            # 서비스별 연결 대기열 크기 (tuning 프로필에 backlog가 있으면 그 값)
+    'tuning': None,             # 소켓 튜닝 프로필 (프리셋 이름, JSON 파일, 'key=value,...' 또는 항목 딕셔너리)
+    'max_connections': 10000,   # Echo/Number 서비스별 최대 동시 연결 수
+    'idle_timeout': 300.0,      # Echo/Number 연결의 수신 없는 최대 시간 (초, 0이면 제한 없음)
+    'drain_timeout': 5.0,       # 종료 시 N-Echo 연결이 끝나기를 기다리는 최대 시간 (초)
+    'max_n': None,              # N-Echo 최대 에코 횟수
+    'max_response_bytes': None, # N-Echo 최대 응답 크기 (바이트)
+    'metrics_port': None,       # 메트릭 조회 포트 (None이면 사용 안 함)
+    'report_interval': 60.0,    # 통계 로그 출력 주기 (초, 0이면 출력하지 않음)
+    'log_level': 'info',
+    'log_sample': 100,
+    'log_format': 'plain',
+}
+
+# 서버 종료 시 진행 중인 Number 게임에 보내는 메시지
+SHUTDOWN_MESSAGE = "\n[알림] 서버가 종료되어 게임을 끝냅니다.\n".encode('utf-8')
+
+# 클라이언트가 읽지 않아 쌓인 응답이 이 크기를 넘으면 그 연결의 입력을 잠시 읽지 않음 (흐름 제어)
+WRITE_HIGH_WATER = 256 * 1024
+
+
+def load_config(path=None, overrides=None):
+    """
+    기본 설정에 설정 파일과 명령줄 옵션을 차례로 덮어써서 최종 설정을 만드는 함수
+    
+    Args:
+        path (str): JSON 설정 파일 경로 (기본값: None - 설정 파일 없음)
+        overrides (dict): 명령줄에서 지정한 설정 (값이 None인 항목은 무시)
+    
+    Returns:
+        dict: 최종 설정
+    
+    Raises:
+        ValueError: 설정 파일이 올바른 JSON 객체가 아니거나 알 수 없는 키가 있는 경우
+        OSError: 설정 파일을 읽을 수 없는 경우
+    """
+    config = dict(DEFAULT_CONFIG)
+    if path:
+        with open(path, encoding='utf-8') as f:
+            try:
+                loaded = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"설정 파일이 올바른 JSON이 아닙니다: {path} ({e})") from None
+        if not isinstance(loaded, dict):
+            raise ValueError(f"설정 파일의 최상위 값은 JSON 객체여야 합니다: {path}")
+        unknown = set(loaded) - set(DEFAULT_CONFIG)
+        if unknown:
+            raise ValueError(f"알 수 없는 설정 키입니다: {', '.join(sorted(unknown))}")
+        config.update(loaded)
+    for key, value in (overrides or {}).items():
+        if value is not None:
+            config[key] = value
+    return config
+
+
+class TimeService(asyncio.Protocol):
+    """
+    Time 서비스 클래스
+    
+    연결마다 하는 일이 "캐시된 메시지 전송 후 종료"뿐이고 연결별 상태가 없으므로,
+    프로토콜 객체 하나(self)를 모든 연결이 함께 사용합니다 (연결마다 객체를 만들지 않음).
+    """
+    
+    name = 'time'
+    
+    def __init__(self):
+        self.cache = TimeMessageCache()  # 초 단위 시간 메시지 캐시
+        self.counters = {'connections': 0, 'udp_requests': 0, 'errors': 0}
+    
+    def __call__(self):
+        """
+        새 연결마다 이벤트 루프가 호출하는 프로토콜 팩토리 (항상 같은 객체를 반환)
+        """
+        return self
+    
+    def stats(self):
+        """
+        메트릭용 카운터를 반환하는 메서드
+        """
+        return dict(self.counters)
+    
+    def connection_made(self, transport):
+        self.counters['connections'] += 1
+        transport.write(self.cache.get())
+        # 보낼 데이터를 모두 보낸 뒤 연결 종료
+        transport.close()
+
+
+class TimeDatagramService(asyncio.DatagramProtocol):
+    """
+    Time 서비스의 UDP 요청 처리 클래스 (time_server.py --udp와 같은 형식)
+    """
+    
+    def __init__(self, service):
+        self.service = service  # 캐시와 카운터를 함께 쓰는 TimeService
+        self.transport = None
+    
+    def connection_made(self, transport):
+        self.transport = transport
+    
+    def datagram_received(self, data, address):
+        service = self.service
+        service.counters['udp_requests'] += 1
+        if data == NS_REQUEST:
+            now_ns = time.time_ns()
+            self.transport.sendto(NS_HEADER.pack(now_ns) + service.cache.get(now_ns // 1_000_000_000), address)
+        else:
+            self.transport.sendto(service.cache.get(), address)
+    
+    def error_received(self, exc):
+        # 이전 응답에 대한 ICMP 오류(포트 닫힘 등)
+        self.service.counters['errors'] += 1
+
+
+class ConnectionService:
+    """
+    연결을 유지하는 서비스(Echo, Number)의 공용 기반 클래스
+    
+    동시 연결 수 제한, 마지막 수신 순서로 정렬된 연결 목록, 유휴 연결 정리, 종료 시 연결 정리를 담당합니다.
+    하위 클래스는 protocol_class와 카운터 이름을 지정합니다.
+    """
+    
+    name = None
+    protocol_class = None
+    counter_names = ('connections', 'rejected', 'expired')
+    
+    def __init__(self, max_connections=10000, idle_timeout=300.0, tuning=None):
+        """
+        Args:
+            max_connections (int): 최대 동시 연결 수 (넘으면 안내 후 연결 종료)
+            idle_timeout (float): 수신 없이 연결을 유지하는 최대 시간 (초, 0이면 제한 없음)
+            tuning (dict): 소켓 튜닝 설정 - 연결마다 다시 설정할 옵션(nodelay=off)에 사용 (기본값: None)
+        """
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.tuning = tuning or {}
+        # 프로토콜 객체 -> None (마지막 수신이 오래된 순서로 정렬)
+        self.connections = OrderedDict()
+        self.counters = dict.fromkeys(self.counter_names, 0)
+    
+    def __call__(self):
+        """
+        새 연결마다 이벤트 루프가 호출하는 프로토콜 팩토리
+        """
+        return self.protocol_class(self)
+    
+    def stats(self):
+        """
+        메트릭용 카운터를 반환하는 메서드 (active는 현재 연결 목록의 크기)
+        """
+        stats = dict(self.counters)
+        stats['active'] = len(self.connections)
+        return stats
+    
+    def expire_idle(self, now):
+        """
+        수신 없이 idle_timeout이 지난 연결을 정리하는 메서드 (가장 오래된 연결부터 확인)
+        """
+        if not self.idle_timeout:
+            return
+        deadline = now - self.idle_timeout
+        connections = self.connections
+        while connections:
+            protocol = next(iter(connections))
+            if protocol.last_active > deadline:
+                break
+            # 닫히기 전에 목록에서 먼저 빼서 다음 확인 때 다시 나오지 않게 함
+            del connections[protocol]
+            self.counters['expired'] += 1
+            protocol.close(protocol.idle_message)
+    
+    def close_all(self):
+        """
+        모든 연결에 종료 절차를 시작하는 메서드 (보내던 응답은 마저 보낸 뒤 닫힘)
+        """
+        for protocol in list(self.connections):
+            protocol.close(protocol.shutdown_message)
+    
+    def abort_all(self):
+        """
+        종료 대기 시간이 지나도 닫히지 않은 연결을 즉시 끊는 메서드
+        """
+        for protocol in list(self.connections):
+            protocol.transport.abort()
+
+
+class ServiceProtocol(asyncio.Protocol):
+    """
+    ConnectionService에 속한 연결 하나의 공용 기반 프로토콜 클래스
+    
+    연결 등록/해제와 흐름 제어(송신 버퍼가 차면 읽기 중단)를 담당합니다.
+    """
+    
+    __slots__ = ('service', 'transport', 'last_active')
+    
+    idle_message = None      # 유휴 시간 초과로 닫을 때 보낼 메시지
+    shutdown_message = None  # 서버 종료로 닫을 때 보낼 메시지
+    busy_message = None      # 최대 동시 연결 수를 넘었을 때 보낼 메시지
+    
+    def __init__(self, service):
+        self.service = service
+        self.transport = None
+        self.last_active = time.monotonic()
+    
+    def connection_made(self, transport):
+        service = self.service
+        self.transport = transport
+        if len(service.connections) >= service.max_connections:
+            service.counters['rejected'] += 1
+            if self.busy_message:
+                transport.write(self.busy_message)
+            transport.close()
+            return
+        service.counters['connections'] += 1
+        service.connections[self] = None
+        if service.tuning:
+            # asyncio가 켜는 TCP_NODELAY처럼 서버 소켓에서 물려받지 못하는 옵션을 다시 설정
+            tune_connection(transport.get_extra_info('socket'), service.tuning)
+        # 송신 버퍼가 WRITE_HIGH_WATER를 넘으면 pause_writing()이 호출됨
+        transport.set_write_buffer_limits(high=WRITE_HIGH_WATER)
+        self.started()
+    
+    def started(self):
+        """
+        연결이 등록된 직후 호출되는 메서드 (하위 클래스에서 환영 메시지 등 전송)
+        """
+    
+    def touch(self):
+        """
+        수신 시각을 갱신하고 연결 목록의 맨 뒤로 옮기는 메서드
+        """
+        self.last_active = time.monotonic()
+        connections = self.service.connections
+        if self in connections:
+            connections.move_to_end(self)
+    
+    def close(self, message=None):
+        """
+        마지막 메시지를 보내고 연결을 닫는 메서드 (송신 버퍼에 남은 데이터는 모두 보낸 뒤 닫힘)
+        """
+        if self.transport.is_closing():
+            return
+        if message:
+            self.transport.write(message)
+        self.transport.close()
+    
+    def pause_writing(self):
+        # 클라이언트가 응답을 읽지 않아 송신 버퍼가 가득 참 - 더 이상 입력을 읽지 않음
+        self.transport.pause_reading()
+    
+    def resume_writing(self):
+        self.transport.resume_reading()
+    
+    def connection_lost(self, exc):
+        self.service.connections.pop(self, None)
+
+
+class EchoProtocol(ServiceProtocol):
+    """
+    Echo 연결 하나의 프로토콜 (echo_server.py와 같은 동작)
+    """
+    
+    __slots__ = ()
+    
+    def data_received(self, data):
+        self.touch()
+        counters = self.service.counters
+        counters['messages'] += 1
+        counters['bytes_in'] += len(data)
+        if data.strip().lower() in QUIT_COMMANDS:
+            counters['bytes_out'] += len(GOODBYE_MESSAGE)
+            self.close(GOODBYE_MESSAGE)
+            return
+        # 받은 메시지를 그대로 돌려보냄 (Echo)
+        self.transport.write(ECHO_PREFIX + data)
+        counters['bytes_out'] += len(ECHO_PREFIX) + len(data)
+
+
+class EchoService(ConnectionService):
+    """
+    Echo 서비스 클래스
+    """
+    
+    name = 'echo'
+    protocol_class = EchoProtocol
+    counter_names = ConnectionService.counter_names + ('messages', 'bytes_in', 'bytes_out')
+
+
+class NumberProtocol(ServiceProtocol):
+    """
+    Number 게임 연결 하나의 프로토콜 (number_server.py와 같은 게임 진행)
+    """
+    
+    __slots__ = ('session',)
+    
+    idle_message = IDLE_MESSAGE
+    shutdown_message = SHUTDOWN_MESSAGE
+    busy_message = BUSY_MESSAGE
+    
+    def __init__(self, service):
+        super().__init__(service)
+        self.session = None
+    
+    def started(self):
+        self.session = GameSession()
+        self.transport.write(WELCOME_MESSAGE)
+    
+    def data_received(self, data):
+        session = self.session
+        if session is None or session.finished:
+            return
+        self.touch()
+        msg, result = session.play(data.decode('utf-8', 'replace'))
+        self.transport.write(msg.encode('utf-8'))
+        if session.finished:
+            counters = self.service.counters
+            if result == RESULT_WIN:
+                counters['wins'] += 1
+            elif result == RESULT_LOSE:
+                counters['losses'] += 1
+            elif result == RESULT_QUIT:
+                counters['quits'] += 1
+            self.close()
+
+
+class NumberService(ConnectionService):
+    """
+    Number 게임 서비스 클래스
+    """
+    
+    name = 'number'
+    protocol_class = NumberProtocol
+    counter_names = ConnectionService.counter_names + ('wins', 'losses', 'quits')
+
+
+class MultiServer:
+    """
+    통합 서버 클래스
+    
+    asyncio 이벤트 루프 하나에서 설정된 서비스의 서버 소켓을 모두 열고,
+    메트릭 조회, 주기적 통계 로그, 유휴 연결 정리, 종료 처리를 모든 서비스에 함께 적용합니다.
+    """
+    
+    def __init__(self, config):
+        """
+        Args:
+            config (dict): load_config()로 만든 설정
+        """
+        self.config = config
+        self.host = config['host']
+        # 모든 서비스의 TCP 서버 소켓에 적용할 튜닝 설정 (바꿀 항목만)
+        self.tuning = load_tuning(config['tuning'])
+        self.time = TimeService()
+        self.echo = EchoService(config['max_connections'], config['idle_timeout'], self.tuning)
+        self.number = NumberService(config['max_connections'], config['idle_timeout'], self.tuning)
+        # N-Echo 서비스는 NEchoServer의 연결 처리 코루틴과 카운터, 히스토그램을 그대로 사용
+        self.necho = NEchoServer(host=self.host, port=config['necho_port'], engine='asyncio',
+                                 max_n=config['max_n'], max_response_bytes=config['max_response_bytes'],
+                                 tuning=self.tuning)
+        self._necho_tasks = {}  # 진행 중인 N-Echo 연결 처리 태스크 -> (reader, writer)
+        self.metrics_server = None
+        self._listeners = []  # (서비스 이름, asyncio 서버 또는 UDP 트랜스포트)
+        self._stop_event = None
+        self._loop = None
+    
+    def ports(self):
+        """
+        실행할 서비스와 포트 목록을 반환하는 메서드 (포트가 0이거나 None인 서비스 제외)
+        
+        Returns:
+            dict: 서비스 이름 -> 포트 번호
+        """
+        return {name: self.config[f'{name}_port'] for name in SERVICES if self.config[f'{name}_port']}
+    
+    def metrics(self):
+        """
+        메트릭 조회 서버가 사용할 카운터와 히스토그램을 반환하는 메서드
+        
+        N-Echo 카운터는 python_server.py와 같은 이름을 사용하고,
+        다른 서비스의 카운터는 이름 앞에 서비스 이름을 붙입니다 (예: echo_messages).
+        
+        Returns:
+            tuple: (카운터 이름 -> 값 딕셔너리, N-Echo 요청 처리 시간 히스토그램)
+        """
+        counters = dict(zip(STAT_NAMES, self.necho.stats))
+        for service in (self.time, self.echo, self.number):
+            for name, value in service.stats().items():
+                counters[f'{service.name}_{name}'] = value
+        return counters, self.necho.latency
+    
+    def start(self):
+        """
+        서버를 시작하는 메서드 (종료될 때까지 반환하지 않음)
+        """
+        try:
+            asyncio.run(self._serve())
+        except KeyboardInterrupt:
+            # 시그널 핸들러를 등록할 수 없는 환경(Windows)에서 Ctrl+C
+            log.info("[중단] Ctrl+C 감지")
+        except Exception as e:
+            log.error("[오류] 서버 시작 실패: %s", e)
+        finally:
+            if self.metrics_server is not None:
+                self.metrics_server.stop()
+    
+    def stop(self):
+        """
+        종료 절차를 시작하는 메서드 (다른 스레드에서도 호출 가능)
+        """
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+    
+    async def _serve(self):
+        """
+        모든 서비스의 서버 소켓을 열고 종료 신호가 올 때까지 대기하는 코루틴
+        """
+        loop = self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, self._stop_event.set)
+            except (NotImplementedError, RuntimeError):
+                # Windows 등 시그널 핸들러를 지원하지 않는 이벤트 루프
+                pass
+        
+        host, backlog = self.host, self.tuning.get('backlog') or self.config['backlog']
+        unsupported = set()
+        for name, port in self.ports().items():
+            if name == 'necho':
+                server = await asyncio.start_server(self._handle_necho, host, port,
+                                                    backlog=backlog, reuse_address=True)
+            else:
+                server = await loop.create_server(getattr(self, name), host, port,
+                                                  backlog=backlog, reuse_address=True)
+            # 튜닝 옵션 설정 (Linux는 listen 이후에 설정해도 이후 수락하는 연결에 적용됨)
+            # Time/Number는 서버가 먼저 보내므로 첫 데이터를 기다리는 defer_accept를 쓰지 않음
+            for sock in server.sockets:
+                unsupported.update(tune_listen_socket(sock, self.tuning, server_first=name in ('time', 'number')))
+            self._listeners.append((name, server))
+            log.info("[서비스 시작] %s - %s:%s", name, host, port)
+            if name == 'time' and self.config['time_udp']:
+                transport, _ = await loop.create_datagram_endpoint(
+                    lambda: TimeDatagramService(self.time), local_addr=(host, port))
+                self._listeners.append(('time/udp', transport))
+                log.info("[서비스 시작] time/udp - %s:%s", host, port)
+        if self.config['necho_unix']:
+            # 같은 호스트의 클라이언트를 위한 N-Echo 유닉스 도메인 소켓 (TCP와 같은 처리 코루틴 사용)
+            path = self.config['necho_unix']
+            server = await asyncio.start_unix_server(self._handle_necho,
+                                                     sock=bind_unix_socket(path, backlog))
+            self._listeners.append(('necho/unix', server))
+            log.info("[서비스 시작] necho/unix - %s", path)
+        if self.tuning:
+            log.info("[튜닝] %s", describe_tuning({'backlog': backlog, **self.tuning}))
+        if unsupported:
+            log.warning("[튜닝] 이 플랫폼에서 설정할 수 없는 옵션: %s", ", ".join(sorted(unsupported)))
+        self.necho.running = True
+        
+        if self.config['metrics_port'] is not None:
+            self.metrics_server = MetricsServer(self.metrics, port=self.config['metrics_port'])
+            self.metrics_server.start()
+        log.info("[통합 서버] 서비스 %d개 실행 중 - 종료하려면 Ctrl+C를 누르세요", len(self.ports()))
+        
+        housekeeping = asyncio.create_task(self._housekeeping())
+        try:
+            await self._stop_event.wait()
+        finally:
+            housekeeping.cancel()
+            await self._shutdown()
+    
+    async def _handle_necho(self, reader, writer):
+        """
+        N-Echo 연결 하나를 처리하는 코루틴 (종료 시 기다리거나 취소할 수 있도록 태스크를 기록)
+        """
+        task = asyncio.current_task()
+        self._necho_tasks[task] = (reader, writer)
+        try:
+            await self.necho.handle_client_async(reader, writer)
+        finally:
+            self._necho_tasks.pop(task, None)
+    
+    async def _housekeeping(self):
+        """
+        1초마다 유휴 연결을 정리하고, report_interval마다 통계 로그를 출력하는 코루틴
+        """
+        report_interval = self.config['report_interval']
+        next_report = time.monotonic() + report_interval
+        while True:
+            await asyncio.sleep(1.0)
+            now = time.monotonic()
+            self.echo.expire_idle(now)
+            self.number.expire_idle(now)
+            if report_interval and now >= next_report:
+                log.info("[통계] %s", self.summary())
+                next_report = now + report_interval
+    
+    def summary(self):
+        """
+        서비스별 주요 카운터를 한 줄로 만드는 메서드 (통계 로그용)
+        """
+        necho = dict(zip(STAT_NAMES, self.necho.stats))
+        echo, number = self.echo.stats(), self.number.stats()
+        return (f"time={self.time.counters['connections']}+{self.time.counters['udp_requests']}udp, "
+                f"echo={echo['connections']}(활성 {echo['active']}), "
+                f"number={number['connections']}(활성 {number['active']}), "
+                f"necho={necho['connections']}(활성 {necho['active']}, 요청 {necho['requests']}, "
+                f"p99={self.necho.latency.percentile(99) / 1000:.2f}ms)")
+    
+    async def _shutdown(self):
+        """
+        모든 서비스를 함께 종료하는 코루틴
+        
+        새 연결 수락을 멈추고, Echo/Number 연결은 남은 응답을 보낸 뒤 닫고,
+        N-Echo 연결은 이미 받은 요청까지 응답하게 한 뒤 drain_timeout초 안에 끝나지 않으면 취소합니다.
+        """
+        log.info("[통합 서버] 종료를 시작합니다...")
+        # 1. 새 연결 수락 중단
+        for name, listener in self._listeners:
+            listener.close()
+        if self.config['necho_unix'] and any(name == 'necho/unix' for name, _ in self._listeners):
+            try:
+                os.unlink(self.config['necho_unix'])
+            except OSError:
+                pass
+        self.necho.running = False
+        
+        # 2. Echo/Number 연결 종료 시작 (송신 버퍼를 비운 뒤 닫힘)
+        self.echo.close_all()
+        self.number.close_all()
+        # N-Echo 연결은 더 읽지 않고 수신 스트림에 EOF를 넣음
+        # 요청을 기다리던 연결은 바로 끝나고, 처리 중인 연결은 이미 받은 요청까지 응답한 뒤 끝남
+        for reader, writer in self._necho_tasks.values():
+            writer.transport.pause_reading()
+            reader.feed_eof()
+        
+        # 3. 모든 연결이 닫히거나 drain_timeout이 지날 때까지 대기
+        deadline = time.monotonic() + self.config['drain_timeout']
+        while ((self._necho_tasks or self.echo.connections or self.number.connections)
+               and time.monotonic() < deadline):
+            await asyncio.sleep(0.05)
+        
+        # 4. 남은 연결 정리
+        self.echo.abort_all()
+        self.number.abort_all()
+        remaining = list(self._necho_tasks)
+        for task in remaining:
+            task.cancel()
+        if remaining:
+            await asyncio.gather(*remaining, return_exceptions=True)
+            log.warning("[통합 서버] 대기 시간 안에 끝나지 않은 N-Echo 연결 %d개를 닫았습니다.", len(remaining))
+        log.info("[통합 서버 종료] %s", self.summary())
+
+
+def main():
+    """
+    메인 함수 - 프로그램의 진입점
+    """
+    parser = argparse.ArgumentParser(description='Time/Echo/Number/N-Echo 통합 서버')
+    parser.add_argument('--config', default=None,
+                        help='JSON 설정 파일 경로 - 키는 아래 옵션 이름과 같음 (예: "echo_port": 9002)')
+    parser.add_argument('--host', default=None, help='바인딩할 주소 (기본값: 0.0.0.0)')
+    for name in SERVICES:
+        parser.add_argument(f'--{name}-port', type=int, default=None,
+                            help=f'{name} 서비스 포트, 0이면 실행 안 함 (기본값: {DEFAULT_CONFIG[name + "_port"]})')
+    parser.add_argument('--necho-unix', default=None,
+                        help='N-Echo 서비스를 함께 제공할 유닉스 도메인 소켓 경로 (기본값: 사용 안 함)')
+    parser.add_argument('--no-time-udp', dest='time_udp', action='store_const', const=False, default=None,
+                        help='Time 서비스의 UDP 요청 처리를 끔')
+    parser.add_argument('--backlog', type=int, default=None, help='서비스별 연결 대기열 크기 (기본값: 1024)')
+    parser.add_argument('--max-connections', type=int, default=None,
+                        help='Echo/Number 서비스별 최대 동시 연결 수 (기본값: 10000)')
+    parser.add_argument('--idle-timeout', type=float, default=None,
+                        help='Echo/Number 연결의 수신 없는 최대 시간(초), 0이면 제한 없음 (기본값: 300)')
+    parser.add_argument('--drain-timeout', type=float, default=None,
+                        help='종료 시 N-Echo 연결이 끝나기를 기다리는 최대 시간(초) (기본값: 5)')
+    parser.add_argument('--max-n', type=int, default=None, help='N-Echo 최대 에코 횟수 (기본값: 제한 없음)')
+    parser.add_argument('--max-response-bytes', type=int, default=None,
+                        help='N-Echo 최대 응답 크기(바이트) (기본값: 제한 없음)')
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help='메트릭 조회 포트 - 모든 서비스의 카운터 (기본값: 사용 안 함)')
+    parser.add_argument('--report-interval', type=float, default=None,
+                        help='통계 로그 출력 주기(초), 0이면 출력 안 함 (기본값: 60)')
+    parser.add_argument('--log-level', choices=list(LOG_LEVELS), default=None, help='로그 레벨 (기본값: info)')
+    parser.add_argument('--log-sample', type=int, default=None,
+                        help='N-Echo 요청 로그를 N개 중 1개만 기록 (기본값: 100)')
+    parser.add_argument('--log-format', choices=LOG_FORMATS, default=None, help='로그 형식 (기본값: plain)')
+    # --backlog는 위에서 정의했으므로 나머지 튜닝 옵션만 추가
+    add_tuning_arguments(parser, exclude=('backlog',))
+    args = vars(parser.parse_args())
+    # 항목별 튜닝 옵션은 설정의 tuning 프로필 위에 덮어씀 (명령줄 --backlog는 프로필의 백로그보다 우선)
+    tuning_options = {key: args.pop(key) for key in DEFAULT_TUNING if key != 'backlog'}
+    tuning_options['backlog'] = args['backlog']
+    
+    try:
+        config = load_config(args.pop('config'), args)
+        config['tuning'] = load_tuning(config['tuning'], tuning_options)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    setup_logging(config['log_level'], sample=config['log_sample'], fmt=config['log_format'])
+    MultiServer(config).start()
+
+
+# 이 파일이 직접 실행될 때만 main() 함수 호출
+if __name__ == "__main__":
+    main()
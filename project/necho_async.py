@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+N-Echo asyncio 클라이언트 (Python)
+asyncio 애플리케이션에서 await로 N-Echo 요청을 보내는 클라이언트
+
+NEchoClient.send_request()는 응답이 올 때까지 스레드를 막는(blocking) 함수라서,
+asyncio 애플리케이션에서 쓰려면 run_in_executor()로 스레드 풀에 넘겨야 했습니다.
+AsyncNEchoClient는 이벤트 루프 안에서 바로 동작합니다.
+
+- await client.send_request(n, message): 요청 하나를 보내고 파싱된 응답을 반환
+- 동시 요청: 여러 코루틴이 동시에 send_request()를 호출하면 응답을 기다리지 않고 연달아 보냄 (파이프라이닝)
+  서버는 연결마다 요청 순서대로 응답하므로, 연결별로 보낸 순서대로 Future를 큐에 넣어 두고
+  응답 수신 태스크가 도착한 응답을 가장 오래된 Future에 차례로 넘겨줍니다.
+- 여러 연결: connections=N이면 연결 N개에 요청을 나누어 보냄 (대기 중인 요청이 가장 적은 연결 선택)
+- 요청/응답 형식은 NEchoClient와 같음 (compact이면 "repeat" 인코딩 요청, echoes는 지연 시퀀스)
+
+사용 예:
+    import asyncio
+    from necho_async import AsyncNEchoClient
+    
+    async def main():
+        async with AsyncNEchoClient('127.0.0.1', 5000, connections=2) as client:
+            response = await client.send_request(3, 'Hello')
+            responses = await asyncio.gather(*(client.send_request(1, f'msg{i}') for i in range(100)))
+    
+    asyncio.run(main())
+"""
+
+# asyncio: 이벤트 루프 기반 비동기 입출력 라이브러리
+import asyncio
+# socket: 주소 체계 상수와 유닉스 도메인 소켓 연결을 위한 라이브러리
+import socket
+# time: 유닉스 도메인 소켓 연결 재시도 제한 시간 계산
+import time
+# collections.deque: 응답을 기다리는 Future를 요청 순서대로 보관하는 큐
+from collections import deque
+# necho_protocol: 요청/응답 프레이밍과 주소 해석
+from necho_protocol import (FrameBuffer, encode_frame, decode_frame, expand_echoes,
+                            parse_address, format_address, RECV_SIZE, ENCODING_REPEAT)
+
+
+async def open_unix_connection(path, timeout=3.0):
+    """
+    유닉스 도메인 소켓 서버에 연결하고 (reader, writer)를 반환하는 코루틴
+    
+    TCP는 서버 대기열(backlog)이 가득 차면 SYN을 다시 보내며 기다리지만, 유닉스 도메인 소켓의
+    논블로킹 connect()는 바로 EAGAIN으로 실패합니다. asyncio.open_unix_connection()은 이를
+    '연결 진행 중'으로 보고 기다리다가 연결되지 않은 소켓을 돌려주므로, 여기서 직접 connect()를
+    재시도해 TCP와 같은 조건으로 연결합니다.
+    
+    Args:
+        path (str): 서버 소켓 파일 경로
+        timeout (float): 대기열이 비기를 기다릴 최대 시간 (초)
+    
+    Returns:
+        tuple: (asyncio.StreamReader, asyncio.StreamWriter)
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.setblocking(False)
+    give_up = time.perf_counter() + timeout
+    try:
+        while True:
+            try:
+                sock.connect(path)
+                break
+            except BlockingIOError:
+                # 대기열이 가득 참 - 잠시 후 다시 시도
+                if time.perf_counter() >= give_up:
+                    raise ConnectionRefusedError(f"연결 대기열이 가득 찼습니다: {path}")
+                await asyncio.sleep(0.001)
+        return await asyncio.open_unix_connection(sock=sock)
+    except BaseException:
+        sock.close()
+        raise
+
+
+async def open_necho_connection(host, port=5000):
+    """
+    주소 문자열에 맞는 방식(TCP 또는 유닉스 도메인 소켓)으로 서버에 연결하는 코루틴
+    
+    Args:
+        host (str): 서버 주소 ('host', 'host:port', 'unix:/경로' - NEchoClient와 같음)
+        port (int): 서버 포트 번호 (host에 포트가 없을 때 사용)
+    
+    Returns:
+        tuple: (asyncio.StreamReader, asyncio.StreamWriter)
+    """
+    family, address = parse_address(host, port)
+    if family in (socket.AF_INET, socket.AF_INET6):
+        return await asyncio.open_connection(*address[:2])
+    # 유닉스 도메인 소켓: 같은 프로토콜을 파일 경로로 연결
+    return await open_unix_connection(address)
+
+
+def _abandon(future):
+    """
+    더 이상 기다리지 않는 Future를 정리하는 함수
+    
+    아직 응답이 없으면 취소해서 수신 태스크가 응답을 버리게 하고, 이미 예외가 들어 있으면
+    꺼내 두어 'exception was never retrieved' 경고가 나지 않게 합니다.
+    """
+    if not future.cancel() and not future.cancelled():
+        future.exception()
+
+
+class _PipelinedConnection:
+    """
+    요청을 파이프라이닝하는 연결 하나를 나타내는 클래스
+    
+    요청을 보낼 때 Future를 pending 큐에 넣고, 응답 수신 태스크가 응답 프레임이 도착할 때마다
+    가장 오래된 Future에 결과를 넣습니다. 큐에 넣는 것과 전송 버퍼에 쓰는 것 사이에 await가 없으므로
+    여러 코루틴이 동시에 요청해도 큐 순서와 전송 순서가 항상 같습니다.
+    """
+    
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.pending = deque()  # 응답을 기다리는 Future (요청 순서)
+        self.closed = False
+        self.receiver = asyncio.create_task(self._receive())  # 응답 수신 태스크
+    
+    def send(self, frame):
+        """
+        요청 프레임을 전송 버퍼에 쓰고 응답을 받을 Future를 반환하는 메서드
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append(future)
+        self.writer.write(frame)
+        return future
+    
+    async def _receive(self):
+        """
+        응답 프레임을 읽어 요청 순서대로 Future에 넘겨주는 코루틴
+        
+        연결이 끊어지면 응답을 기다리던 모든 Future에 ConnectionError를 넣습니다.
+        제한 시간이 지나 취소된 Future의 응답은 버립니다 (순서는 그대로 유지됨).
+        """
+        buffer = FrameBuffer()
+        error = ConnectionError("연결이 닫혔습니다.")
+        try:
+            while True:
+                data = await self.reader.read(RECV_SIZE)
+                if not data:
+                    raise ConnectionError("서버가 연결을 종료했습니다.")
+                for frame in buffer.feed(data):
+                    if not self.pending:
+                        raise ConnectionError("요청하지 않은 응답을 받았습니다.")
+                    future = self.pending.popleft()
+                    if future.done():
+                        continue
+                    try:
+                        future.set_result(expand_echoes(decode_frame(frame)))
+                    except ValueError as e:
+                        # 이 응답만 잘못된 경우 - 연결은 계속 사용
+                        future.set_exception(e)
+        except OSError as e:
+            error = e if isinstance(e, ConnectionError) else ConnectionError(str(e))
+        finally:
+            self.closed = True
+            self.writer.close()
+            while self.pending:
+                future = self.pending.popleft()
+                if not future.done():
+                    future.set_exception(error)
+    
+    async def close(self):
+        """
+        연결을 닫고 응답 수신 태스크가 끝날 때까지 기다리는 코루틴
+        """
+        self.receiver.cancel()
+        try:
+            await self.receiver
+        except asyncio.CancelledError:
+            pass
+        try:
+            await self.writer.wait_closed()
+        except OSError:
+            pass
+
+
+class AsyncNEchoClient:
+    """
+    N-Echo asyncio 클라이언트 클래스
+    
+    한 이벤트 루프 안에서 여러 코루틴이 함께 사용할 수 있으며, 화면에 출력하지 않습니다.
+    연결은 처음 필요할 때 만들고, 끊어진 연결은 다음 요청 때 다시 만듭니다.
+    """
+    
+    def __init__(self, host='localhost', port=5000, connections=1, timeout=None, compact=True):
+        """
+        클라이언트 초기화 메서드
+        
+        Args:
+            host (str): 서버 주소 ('host', 'host:port', 'unix:/경로' - NEchoClient와 같음)
+            port (int): 서버 포트 번호 (기본값: 5000)
+            connections (int): 요청을 나누어 보낼 최대 연결 수 (기본값: 1)
+            timeout (float): send_request()의 기본 제한 시간 (초, 기본값: None - 제한 없음)
+            compact (bool): "repeat" 압축 응답을 요청할지 여부 (기본값: True)
+        """
+        if connections < 1:
+            raise ValueError("connections는 1 이상이어야 합니다.")
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.compact = compact
+        self._slots = [None] * connections  # 연결 슬롯 (None이면 아직 연결하지 않음)
+        self._connecting = [None] * connections  # 슬롯별 연결 중인 태스크 (같은 슬롯을 두 번 연결하지 않도록)
+        self._waiters = [0] * connections  # 슬롯별 연결이 끝나기를 기다리는 요청 수
+    
+    async def connect(self):
+        """
+        모든 연결 슬롯을 미리 연결하는 코루틴 (호출하지 않으면 첫 요청 때 필요한 만큼 연결)
+        
+        Raises:
+            OSError: 서버에 연결할 수 없는 경우
+        """
+        for index in range(len(self._slots)):
+            await self._open_slot(index)
+    
+    def build_request(self, n, message):
+        """
+        요청 딕셔너리를 만드는 메서드 (NEchoClient.build_request와 같은 형식)
+        """
+        request = {'n': n, 'message': message}
+        if self.compact:
+            request['encoding'] = ENCODING_REPEAT
+        return request
+    
+    async def send_request(self, n, message, timeout=None):
+        """
+        N-Echo 요청 하나를 보내고 응답을 기다리는 코루틴
+        
+        여러 코루틴이 동시에 호출하면 응답을 기다리지 않고 연달아 보내며,
+        각 호출은 자기 요청의 응답을 받습니다.
+        
+        Args:
+            n (int): 메시지를 몇 번 반복할지 (에코 횟수)
+            message (str): 에코할 메시지 내용
+            timeout (float): 응답 제한 시간 (초, 기본값: None - 클라이언트 설정 사용)
+        
+        Returns:
+            dict: 서버 응답 (status가 'error'인 응답도 그대로 반환)
+        
+        Raises:
+            TimeoutError: 제한 시간 안에 응답을 받지 못한 경우
+            ConnectionError: 서버에 연결할 수 없거나, 응답을 받기 전에 연결이 끊어진 경우
+            ValueError: 응답이 올바른 JSON이 아닌 경우
+        """
+        timeout = self.timeout if timeout is None else timeout
+        frame = encode_frame(self.build_request(n, message))
+        conn = await self._choose()
+        future = conn.send(frame)
+        try:
+            # 송신 버퍼가 쌓이면 서버가 읽어 갈 때까지 대기 (흐름 제어)
+            await conn.writer.drain()
+            if timeout is None:
+                return await future
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            # 응답은 나중에 도착해도 수신 태스크가 버리므로 연결은 계속 사용할 수 있음
+            raise TimeoutError(f"{timeout}초 안에 응답을 받지 못했습니다.") from None
+        except OSError as e:
+            _abandon(future)
+            if isinstance(e, ConnectionError):
+                raise
+            raise ConnectionError(str(e)) from e
+        except asyncio.CancelledError:
+            _abandon(future)
+            raise
+    
+    async def send_many(self, requests, timeout=None):
+        """
+        여러 요청을 한꺼번에 보내고 요청 순서대로 응답 목록을 반환하는 코루틴
+        
+        Args:
+            requests: (n, message) 튜플의 목록 (또는 반복 가능한 객체)
+            timeout (float): 요청별 응답 제한 시간 (초)
+        
+        Returns:
+            list: 요청 순서대로 정렬된 응답 딕셔너리 목록
+        """
+        return await asyncio.gather(*(self.send_request(n, message, timeout) for n, message in requests))
+    
+    async def _choose(self):
+        """
+        요청을 보낼 연결을 고르는 코루틴
+        
+        대기 중인 요청이 없는 연결이 있으면 그 연결을, 없으면 아직 열지 않은 슬롯을 새로 연결하고,
+        모든 슬롯이 사용 중이면 대기 중인 요청이 가장 적은 연결을 사용합니다.
+        연결 중인 슬롯은 연결을 기다리는 요청 수를 대기 중인 요청 수로 보므로, connect() 없이
+        동시에 들어온 첫 요청들도 한 슬롯에 몰리지 않고 모든 슬롯에 나뉩니다.
+        """
+        best, best_load, empty = None, None, None
+        for index, conn in enumerate(self._slots):
+            if conn is not None and not conn.closed:
+                load = len(conn.pending)
+                if not load:
+                    return conn
+            elif self._connecting[index] is not None:
+                load = self._waiters[index]
+            else:
+                if empty is None:
+                    empty = index
+                continue
+            if best is None or load < best_load:
+                best, best_load = index, load
+        return await self._open_slot(empty if empty is not None else best)
+    
+    async def _open_slot(self, index):
+        """
+        슬롯 하나를 연결하는 코루틴 (이미 연결되어 있으면 그 연결을, 연결 중이면 그 결과를 반환)
+        
+        연결 태스크는 await하기 전에 슬롯에 등록하므로 다른 코루틴은 이 슬롯을 연결 중으로 봅니다.
+        기다리던 요청 하나가 취소되어도 같은 슬롯을 기다리는 다른 요청의 연결은 계속됩니다.
+        """
+        conn = self._slots[index]
+        if conn is not None and not conn.closed:
+            return conn
+        task = self._connecting[index]
+        if task is None:
+            task = self._connecting[index] = asyncio.ensure_future(self._connect_slot(index))
+            # 기다리던 요청이 모두 취소되어도 연결 실패 예외가 'never retrieved' 경고를 내지 않도록
+            task.add_done_callback(_abandon)
+        self._waiters[index] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[index] -= 1
+    
+    async def _connect_slot(self, index):
+        """
+        서버에 연결해 슬롯에 넣는 코루틴 (_open_slot()이 슬롯마다 하나만 실행)
+        """
+        connecting = self._connecting
+        try:
+            reader, writer = await open_necho_connection(self.host, self.port)
+        except OSError as e:
+            address = format_address(*parse_address(self.host, self.port))
+            raise ConnectionError(f"서버 {address}에 연결할 수 없습니다: {e}") from e
+        finally:
+            connecting[index] = None
+        if connecting is not self._connecting:
+            # 연결하는 동안 close()가 호출됨 - 닫힌 클라이언트에 연결을 남기지 않음
+            writer.close()
+            raise ConnectionError("클라이언트가 닫혔습니다.")
+        conn = self._slots[index] = _PipelinedConnection(reader, writer)
+        return conn
+    
+    def in_flight(self):
+        """
+        응답을 기다리는 요청 수를 반환하는 메서드
+        """
+        return sum(len(conn.pending) for conn in self._slots if conn is not None)
+    
+    async def close(self):
+        """
+        모든 연결을 닫는 코루틴 (응답을 기다리던 요청은 ConnectionError로 끝남)
+        """
+        slots, self._slots = self._slots, [None] * len(self._slots)
+        self._connecting = [None] * len(slots)
+        for conn in slots:
+            if conn is not None:
+                await conn.close()
+    
+    async def __aenter__(self):
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+        return False
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+N-Echo 응답 캐시 모듈 (Python)
+같은 요청에 대해 인코딩이 끝난 응답 바이트를 재사용하기 위한 LRU 캐시
+
+N-Echo 응답은 요청(n, message, encoding)과 서버 설정만으로 정해지므로,
+같은 요청 프레임이 다시 오면 JSON 파싱, 유효성 검사, 응답 생성, 인코딩을 모두 건너뛰고
+저장해 둔 응답 바이트를 그대로 소켓에 보낼 수 있습니다.
+
+- 키: 요청 프레임 바이트 그대로 (구분자 제외) - 적중 시 JSON 파싱도 하지 않음
+- 크기 제한: 항목 수가 아니라 바이트 예산(max_bytes)으로 제한하며, 키와 값의 크기를 함께 셈
+- 교체 정책: 예산을 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+- 큰 응답: max_entry_bytes보다 큰 항목은 저장하지 않음 (큰 응답 하나가 캐시 전체를 비우지 않도록)
+- 스레드 안전: thread/pool 엔진의 여러 스레드가 함께 사용 (잠금 하나)
+
+사용 예:
+    cache = ResponseCache(64 * 1024 * 1024)
+    data = cache.get(frame)
+    if data is None:
+        data = encode(...)
+        evicted = cache.put(frame, data)
+"""
+
+# threading: 여러 스레드가 캐시를 안전하게 함께 쓰기 위한 잠금
+import threading
+# collections.OrderedDict: 사용 순서를 유지하는 딕셔너리 (맨 앞이 가장 오래 사용하지 않은 항목)
+from collections import OrderedDict
+
+# max_entry_bytes를 지정하지 않았을 때 항목 하나가 차지할 수 있는 예산의 비율 (1/16)
+DEFAULT_ENTRY_FRACTION = 16
+
+
+class ResponseCache:
+    """
+    바이트 예산으로 크기를 제한하는 LRU 응답 캐시 클래스
+    
+    적중/실패/제거 횟수는 캐시를 사용하는 쪽(서버의 카운터 배열)이 기록하도록
+    get()은 값 또는 None을, put()은 제거한 항목 수를 돌려줍니다.
+    """
+    
+    def __init__(self, max_bytes, max_entry_bytes=None):
+        """
+        캐시 초기화 메서드
+        
+        Args:
+            max_bytes (int): 캐시 전체가 사용할 수 있는 최대 바이트 (키 + 값)
+            max_entry_bytes (int): 항목 하나의 최대 바이트 (기본값: None - max_bytes의 1/16)
+        
+        Raises:
+            ValueError: max_bytes가 양수가 아닌 경우
+        """
+        if max_bytes <= 0:
+            raise ValueError("캐시 크기는 양수여야 합니다.")
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = (max_entry_bytes if max_entry_bytes is not None
+                                else max(1, max_bytes // DEFAULT_ENTRY_FRACTION))
+        self._entries = OrderedDict()  # 키 -> 값 (사용 순서대로 정렬)
+        self._size = 0  # 현재 사용 중인 바이트 (키 + 값)
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        """
+        현재 저장된 항목 수
+        """
+        return len(self._entries)
+    
+    @property
+    def size(self):
+        """
+        현재 사용 중인 바이트 (키 + 값)
+        """
+        return self._size
+    
+    def get(self, key):
+        """
+        저장된 값을 꺼내고 가장 최근에 사용한 항목으로 표시하는 메서드
+        
+        Args:
+            key (bytes): 요청 프레임
+        
+        Returns:
+            bytes: 저장된 응답 (없으면 None)
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+    
+    def put(self, key, value):
+        """
+        값을 저장하고, 예산을 넘으면 오래 사용하지 않은 항목부터 제거하는 메서드
+        
+        Args:
+            key (bytes): 요청 프레임
+            value (bytes): 인코딩된 응답
+        
+        Returns:
+            int: 예산을 맞추기 위해 제거한 항목 수 (항목이 max_entry_bytes보다 커서 저장하지 않은 경우 0)
+        """
+        cost = len(key) + len(value)
+        if cost > self.max_entry_bytes:
+            return 0
+        evicted = 0
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(key) + len(old)
+            self._entries[key] = value
+            self._size += cost
+            while self._size > self.max_bytes:
+                old_key, old_value = self._entries.popitem(last=False)
+                self._size -= len(old_key) + len(old_value)
+                evicted += 1
+        return evicted
+    
+    def clear(self):
+        """
+        모든 항목을 제거하는 메서드
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
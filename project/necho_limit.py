@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+N-Echo 클라이언트별 제한 모듈 (Python)
+클라이언트 IP마다 초당 요청 수, 초당 응답 바이트, 동시 연결 수를 제한하는 토큰 버킷 표
+
+한 클라이언트가 큰 n 요청을 쏟아부어 다른 클라이언트의 처리 시간을 빼앗지 않도록
+IP마다 토큰 버킷을 두고, 토큰이 모자라면 서버가 요청을 처리하지 않고 미리 인코딩한 에러 응답을 보냅니다.
+
+- 요청 수: 요청마다 토큰 1개 (초당 requests_per_sec개 충전, 최대 burst초 분량까지 모음)
+- 응답 바이트: 보낸 만큼 나중에 토큰을 씀 (응답 크기를 미리 계산하지 않음). 토큰이 음수(빚)가 되면
+  빚을 갚을 때까지 다음 요청이 거절되어 평균 속도가 지켜짐
+- 동시 연결 수: 연결할 때 늘리고 끊을 때 줄이는 카운터
+- 표 크기: 연결이 없고 버킷이 다시 가득 찬 항목은 없는 것과 같으므로 주기적으로 지움
+- 비용: 한 번에 도착한 요청 묶음마다 잠금 한 번과 부동소수점 계산 몇 번
+  (버킷 충전은 접근할 때 경과 시간으로 계산)
+- 스레드 안전: thread/pool 엔진의 여러 스레드가 함께 사용 (잠금 하나)
+
+사용 예:
+    limiter = ClientLimiter(requests_per_sec=100, max_connections=8)
+    if not limiter.connect(ip):
+        ...  # 연결 거절
+    if limiter.allow(ip):
+        ...  # 응답 전송
+        limiter.charge(ip, sent)
+    limiter.disconnect(ip)
+"""
+
+# threading: 여러 스레드가 표를 안전하게 함께 쓰기 위한 잠금
+import threading
+# time: 버킷 충전량 계산을 위한 단조 시계
+import time
+
+# 버킷에 모을 수 있는 토큰의 기본 양 (초 단위 - 1이면 1초 분량까지 한꺼번에 허용)
+DEFAULT_BURST = 1.0
+# 다 쓴 항목을 지우는 주기 (초)
+SWEEP_INTERVAL = 10.0
+# 항목 수가 이 값을 넘으면 주기와 관계없이 다 쓴 항목을 지움
+DEFAULT_MAX_ENTRIES = 65536
+
+
+class _Client:
+    """
+    클라이언트 IP 하나의 버킷 상태 (메모리를 줄이기 위해 __slots__ 사용)
+    """
+    __slots__ = ('requests', 'bytes', 'updated', 'connections')
+    
+    def __init__(self, requests, nbytes, now):
+        self.requests = requests  # 남은 요청 토큰
+        self.bytes = nbytes  # 남은 응답 바이트 토큰 (음수면 빚)
+        self.updated = now  # 마지막으로 충전한 시각
+        self.connections = 0  # 현재 연결 수
+
+
+class ClientLimiter:
+    """
+    클라이언트 IP별 토큰 버킷 표 클래스
+    
+    제한을 None으로 준 항목은 검사하지 않습니다. 거절 횟수는 표를 사용하는 쪽(서버의 카운터 배열)이
+    기록하도록 각 메서드는 허용 여부만 돌려줍니다.
+    """
+    
+    def __init__(self, requests_per_sec=None, bytes_per_sec=None, max_connections=None,
+                 burst=DEFAULT_BURST, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        제한 표 초기화 메서드
+        
+        Args:
+            requests_per_sec (float): IP당 초당 요청 수 (기본값: None - 제한 없음)
+            bytes_per_sec (float): IP당 초당 응답 바이트 (기본값: None - 제한 없음)
+            max_connections (int): IP당 동시 연결 수 (기본값: None - 제한 없음)
+            burst (float): 버킷에 모을 수 있는 토큰의 양 (초 단위, 기본값: 1.0)
+            max_entries (int): 다 쓴 항목을 바로 지우기 시작하는 항목 수 (기본값: 65536)
+        
+        Raises:
+            ValueError: 제한 값이나 burst가 양수가 아닌 경우
+        """
+        for value in (requests_per_sec, bytes_per_sec, max_connections):
+            if value is not None and value <= 0:
+                raise ValueError("제한 값은 양수여야 합니다.")
+        if burst <= 0:
+            raise ValueError("burst는 양수여야 합니다.")
+        self.requests_per_sec = requests_per_sec
+        self.bytes_per_sec = bytes_per_sec
+        self.max_connections = max_connections
+        # 버킷 크기 (토큰 최대량) - 요청 버킷은 최소 1개는 담을 수 있어야 함
+        self.request_capacity = max(1.0, requests_per_sec * burst) if requests_per_sec else 0.0
+        self.byte_capacity = bytes_per_sec * burst if bytes_per_sec else 0.0
+        self.max_entries = max_entries
+        self._clients = {}  # IP -> _Client
+        self._next_sweep = time.monotonic() + SWEEP_INTERVAL
+        self._sweep_size = max_entries  # 항목 수가 이만큼 되면 주기 전에 지움
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        """
+        현재 표에 있는 클라이언트 수
+        """
+        return len(self._clients)
+    
+    def _client(self, key, now):
+        """
+        IP의 항목을 찾아(없으면 가득 찬 버킷으로 만들어) 경과 시간만큼 충전하는 메서드 (잠금 안에서 호출)
+        """
+        client = self._clients.get(key)
+        if client is None:
+            if now >= self._next_sweep or len(self._clients) >= self._sweep_size:
+                self._sweep(now)
+            client = self._clients[key] = _Client(self.request_capacity, self.byte_capacity, now)
+            return client
+        elapsed = now - client.updated
+        if elapsed > 0:
+            if self.requests_per_sec:
+                client.requests = min(self.request_capacity,
+                                      client.requests + elapsed * self.requests_per_sec)
+            if self.bytes_per_sec:
+                client.bytes = min(self.byte_capacity, client.bytes + elapsed * self.bytes_per_sec)
+            client.updated = now
+        return client
+    
+    def _sweep(self, now):
+        """
+        연결이 없고 버킷이 다시 가득 찼을 항목을 지우는 메서드 (잠금 안에서 호출)
+        
+        주기(SWEEP_INTERVAL)마다 또는 항목 수가 _sweep_size에 닿았을 때만 실행하고,
+        남은 항목이 많으면 다음 기준을 두 배로 올려 표 전체 검사 비용을 요청 수에 대해 상수로 유지합니다.
+        """
+        expired = []
+        for key, client in self._clients.items():
+            if client.connections:
+                continue
+            elapsed = now - client.updated
+            if (self.requests_per_sec
+                    and client.requests + elapsed * self.requests_per_sec < self.request_capacity):
+                continue
+            if self.bytes_per_sec and client.bytes + elapsed * self.bytes_per_sec < self.byte_capacity:
+                continue
+            expired.append(key)
+        for key in expired:
+            del self._clients[key]
+        self._next_sweep = now + SWEEP_INTERVAL
+        self._sweep_size = max(self.max_entries, 2 * len(self._clients))
+    
+    def connect(self, key):
+        """
+        새 연결을 허용할지 확인하고, 허용하면 연결 수를 늘리는 메서드
+        
+        Args:
+            key (str): 클라이언트 IP
+        
+        Returns:
+            bool: 동시 연결 수 제한 안이면 True (True일 때만 disconnect()를 호출해야 함)
+        """
+        with self._lock:
+            client = self._client(key, time.monotonic())
+            if self.max_connections is not None and client.connections >= self.max_connections:
+                return False
+            client.connections += 1
+            return True
+    
+    def disconnect(self, key):
+        """
+        connect()로 허용한 연결이 끝났을 때 연결 수를 줄이는 메서드
+        
+        Args:
+            key (str): 클라이언트 IP
+        """
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None and client.connections > 0:
+                client.connections -= 1
+    
+    def allow(self, key, count=1):
+        """
+        도착한 요청 count개 중 앞에서부터 몇 개를 처리할지 정하고, 그만큼 요청 토큰을 쓰는 메서드
+        
+        파이프라이닝으로 한 번에 도착한 요청들을 한 번의 호출(잠금 한 번)로 검사합니다.
+        응답 바이트 버킷이 빚(0 이하) 상태이면 모두 거절하므로, 큰 응답을 받은 클라이언트의 다음 요청은
+        요청을 해석하기 전에 거절됩니다.
+        
+        Args:
+            key (str): 클라이언트 IP
+            count (int): 도착한 요청 수 (기본값: 1)
+        
+        Returns:
+            int: 처리해도 되는 요청 수 (앞에서부터, 0 ~ count)
+        """
+        with self._lock:
+            client = self._client(key, time.monotonic())
+            if self.bytes_per_sec and client.bytes <= 0:
+                return 0
+            if self.requests_per_sec:
+                count = min(count, int(client.requests))
+                client.requests -= count
+            return count
+    
+    def in_debt(self, key):
+        """
+        응답 바이트 토큰이 빚(0 이하) 상태인지 확인하는 메서드
+        
+        파이프라이닝된 요청 묶음을 처리하는 도중에 큰 응답을 보낸 뒤 남은 요청을 계속 처리할지 정할 때 씁니다.
+        묶음 안의 짧은 시간 동안만 쓰므로 잠금과 충전 없이 마지막 값을 읽습니다.
+        
+        Args:
+            key (str): 클라이언트 IP
+        
+        Returns:
+            bool: 빚 상태이면 True
+        """
+        client = self._clients.get(key)
+        return client is not None and client.bytes <= 0
+    
+    def charge(self, key, nbytes):
+        """
+        보낸 응답 바이트만큼 바이트 토큰을 쓰는 메서드 (토큰이 음수가 될 수 있음)
+        
+        Args:
+            key (str): 클라이언트 IP
+            nbytes (int): 보낸 바이트 수
+        """
+        if not self.bytes_per_sec:
+            return
+        with self._lock:
+            self._client(key, time.monotonic()).bytes -= nbytes
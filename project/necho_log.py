@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+N-Echo 서버 로깅 모듈 (Python)
+요청 처리 스레드를 막지 않는 레벨별 로거
+
+print()는 호출한 스레드에서 바로 표준 출력에 쓰므로, 부하가 걸리면 모든 요청 처리 스레드가
+stdout 잠금과 터미널 출력 속도를 기다리게 됩니다. 이 모듈은 표준 logging 모듈의
+QueueHandler/QueueListener를 사용해 요청 처리 스레드에서는 로그 레코드를 큐에 넣기만 하고,
+실제 문자열 포맷과 출력은 백그라운드 스레드 하나가 담당하게 합니다.
+
+- 레벨: debug, info, warning, error (--log-level)
+- 요청 로그 샘플링: [수신]/[응답] 같은 요청마다 생기는 로그는 N개 중 1개만 기록 (--log-sample)
+- 페이로드: 기본적으로 요청 내용은 로그에 넣지 않고 크기만 기록 (--log-payloads로 켬)
+- 형식: plain(기존 print와 같은 한 줄) 또는 json(한 줄에 JSON 객체 하나)
+
+사용 예:
+    from necho_log import log, setup_logging, sample_request
+    setup_logging('info', sample=100)
+    log.info("[연결] 클라이언트 접속: %s", client_address)  # 인자는 출력할 때만 포맷됨
+"""
+
+# logging: 표준 로깅 라이브러리 (레벨, 핸들러, 큐 핸들러)
+import logging
+# logging.handlers: 큐 기반 비동기 출력을 위한 QueueHandler/QueueListener
+import logging.handlers
+# queue: 로그 레코드를 백그라운드 스레드로 넘기기 위한 큐
+import queue
+# itertools: 스레드 간에 안전한 요청 로그 샘플링 카운터
+import itertools
+# json: json 형식 로그 출력을 위한 라이브러리
+import json
+# atexit: 프로그램 종료 시 큐에 남은 로그를 모두 출력하기 위한 라이브러리
+import atexit
+# os: fork 후 자식 프로세스에서 출력 스레드를 다시 만들기 위한 라이브러리
+import os
+# sys: 표준 출력 스트림
+import sys
+# time: json 로그의 시각 표시
+import time
+
+# 서버 전체가 사용하는 로거
+log = logging.getLogger('necho')
+
+# --log-level 옵션 값과 logging 레벨의 대응
+LOG_LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+}
+
+# 로그 출력 형식
+LOG_FORMATS = ('plain', 'json')
+
+# 큐에 쌓아 둘 수 있는 최대 로그 레코드 수 (출력이 밀리면 새 레코드는 버림)
+LOG_QUEUE_SIZE = 10000
+
+# 현재 설정 (fork 후 자식 프로세스에서 같은 설정으로 다시 만들기 위해 보관)
+_config = {'level': 'info', 'sample': 100, 'payloads': False, 'fmt': 'plain', 'stream': None}
+_listener = None  # 로그를 실제로 출력하는 백그라운드 스레드
+_request_counter = itertools.count(1)  # 요청 로그 샘플링 카운터
+_sample_every = 100  # 요청 N개 중 1개만 기록 (0이면 기록하지 않음)
+_payloads = False  # 요청 로그에 페이로드 포함 여부
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    로그 레코드 하나를 JSON 한 줄로 바꾸는 포매터 클래스
+    """
+    
+    def format(self, record):
+        entry = {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(record.created))
+                    + f'.{int(record.msecs):03d}',
+            'level': record.levelname.lower(),
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    큐가 가득 차면 기다리지 않고 레코드를 버리는 QueueHandler
+    
+    출력이 느려져도 요청 처리 스레드가 로그 때문에 멈추지 않도록 합니다.
+    """
+    
+    dropped = 0  # 버린 레코드 수
+    
+    def prepare(self, record):
+        # 기본 QueueHandler는 여기서 메시지를 포맷하지만,
+        # 포맷은 출력 스레드에서 하도록 레코드를 그대로 넘김
+        return record
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _DroppingQueueHandler.dropped += 1
+
+
+def setup_logging(level='info', sample=100, payloads=False, fmt='plain', stream=None):
+    """
+    로거를 설정하고 백그라운드 출력 스레드를 시작하는 함수
+    
+    Args:
+        level (str): 로그 레벨 - 'debug', 'info', 'warning', 'error' (기본값: 'info')
+        sample (int): 요청 로그를 N개 중 1개만 기록 (1이면 모두, 0이면 기록 안 함, 기본값: 100)
+        payloads (bool): 요청 로그에 요청 내용(페이로드) 포함 여부 (기본값: False)
+        fmt (str): 출력 형식 - 'plain' 또는 'json' (기본값: 'plain')
+        stream: 로그를 쓸 스트림 (기본값: None - 표준 출력)
+    """
+    global _listener, _sample_every, _payloads
+    if level not in LOG_LEVELS:
+        raise ValueError(f"지원하지 않는 로그 레벨입니다: {level} (가능: {', '.join(LOG_LEVELS)})")
+    if fmt not in LOG_FORMATS:
+        raise ValueError(f"지원하지 않는 로그 형식입니다: {fmt} (가능: {', '.join(LOG_FORMATS)})")
+    shutdown_logging()
+    _config.update(level=level, sample=sample, payloads=payloads, fmt=fmt, stream=stream)
+    _sample_every = max(0, sample)
+    _payloads = payloads
+    
+    output = logging.StreamHandler(stream if stream is not None else sys.stdout)
+    output.setFormatter(JsonFormatter() if fmt == 'json' else logging.Formatter('%(message)s'))
+    
+    records = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    log.handlers[:] = [_DroppingQueueHandler(records)]
+    log.setLevel(LOG_LEVELS[level])
+    log.propagate = False
+    
+    _listener = logging.handlers.QueueListener(records, output)
+    _listener.start()
+
+
+def shutdown_logging():
+    """
+    큐에 남은 로그를 모두 출력하고 백그라운드 출력 스레드를 멈추는 함수
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _restart_after_fork():
+    """
+    fork된 자식 프로세스에서 출력 스레드를 다시 만드는 함수
+    
+    fork는 호출한 스레드만 복제하므로 자식에는 출력 스레드가 없습니다.
+    부모의 큐에 남은 레코드는 부모가 출력하므로 자식은 새 큐로 시작합니다.
+    """
+    global _listener
+    if _listener is not None:
+        _listener = None
+        setup_logging(**_config)
+
+
+def sample_request():
+    """
+    이번 요청의 로그를 기록할지 결정하는 함수 (요청 N개 중 1개만 True)
+    
+    Returns:
+        bool: 기록할 차례이고 INFO 레벨이 켜져 있으면 True
+    """
+    return (_sample_every > 0 and next(_request_counter) % _sample_every == 0
+            and log.isEnabledFor(logging.INFO))
+
+
+def log_payloads():
+    """
+    요청 로그에 페이로드를 포함하도록 설정되었는지 반환하는 함수
+    """
+    return _payloads
+
+
+def dropped_records():
+    """
+    큐가 가득 차서 버린 로그 레코드 수를 반환하는 함수
+    """
+    return _DroppingQueueHandler.dropped
+
+
+# 프로그램이 끝날 때 큐에 남은 로그를 모두 출력
+atexit.register(shutdown_logging)
+# fork된 자식 프로세스(워커)에서도 로그가 출력되도록 출력 스레드를 다시 만듦 (fork가 없는 Windows 제외)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_after_fork)
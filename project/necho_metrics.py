@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+N-Echo 서버 메트릭 모듈 (Python)
+요청 지연 시간 히스토그램과 Prometheus 텍스트 형식의 메트릭 조회 서버
+
+서버의 카운터(연결 수, 요청 수, 송수신 바이트, 오류 종류별 횟수 등)는
+NEchoServer.stats 배열에 정수로 누적되고, 요청별 처리 시간은 LatencyHistogram에 기록됩니다.
+두 곳 모두 "정수 배열의 한 칸을 1 증가"시키는 것이 전부이므로
+요청 처리 경로(hot path)에 드는 비용은 거의 없습니다.
+문자열 생성과 백분위 계산은 누군가 메트릭을 조회할 때만 수행합니다.
+
+MetricsServer는 별도 포트에서 HTTP 요청을 받아 Prometheus 텍스트 형식으로 응답합니다.
+    curl http://localhost:9100/metrics
+"""
+
+# socket: 메트릭 조회용 소켓 서버를 위한 라이브러리
+import socket
+# threading: 메트릭 서버를 요청 처리와 별도의 스레드에서 실행하기 위한 라이브러리
+import threading
+# time: 초당 요청 수 계산을 위한 라이브러리
+import time
+# necho_log: 서버 공용 로거
+from necho_log import log
+
+# 히스토그램 정밀도 - 2의 거듭제곱 구간 하나를 2**SUB_BUCKET_BITS개로 나눔 (상대 오차 약 6%)
+SUB_BUCKET_BITS = 4
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+
+# 기록할 수 있는 최대 값의 비트 수 (마이크로초 기준 2**32us = 약 71분, 넘으면 마지막 구간에 기록)
+MAX_VALUE_BITS = 32
+
+# Prometheus 히스토그램으로 내보낼 구간 경계 (초)
+EXPORT_BOUNDS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 내보낼 지연 시간 백분위수
+EXPORT_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+class LatencyHistogram:
+    """
+    HDR 방식(로그-선형 구간)의 지연 시간 히스토그램 클래스
+    
+    값(마이크로초)을 2의 거듭제곱 구간으로 나누고, 각 구간을 다시 16개의 같은 폭으로 나눕니다.
+    그래서 1us든 10초든 상대 오차 약 6% 이내로 기록되며, 구간 수는 고정(464개)입니다.
+    record()는 정수 연산 몇 번과 배열 한 칸 증가뿐이므로 요청마다 호출해도 부담이 없습니다.
+    
+    counts에 공유 메모리(memoryview)를 넘기면 워커 프로세스의 기록을 감독 프로세스가 읽을 수 있습니다.
+    """
+    
+    # 전체 구간 수
+    BUCKETS = (MAX_VALUE_BITS - SUB_BUCKET_BITS + 1) * SUB_BUCKET_COUNT
+    
+    def __init__(self, counts=None):
+        """
+        Args:
+            counts: 구간별 횟수를 기록할 배열 (기본값: None - 새 리스트 생성)
+                    길이는 LatencyHistogram.BUCKETS여야 합니다.
+        """
+        self.counts = counts if counts is not None else [0] * self.BUCKETS
+    
+    @staticmethod
+    def bucket_index(value):
+        """
+        값이 속하는 구간 번호를 계산하는 메서드
+        
+        Args:
+            value (int): 기록할 값 (마이크로초, 0 이상)
+        
+        Returns:
+            int: 구간 번호
+        """
+        if value < SUB_BUCKET_COUNT:
+            return value
+        # 상위 (SUB_BUCKET_BITS + 1)비트만 남겨 구간 안의 위치를 구함
+        exponent = value.bit_length() - SUB_BUCKET_BITS
+        index = exponent * SUB_BUCKET_COUNT + (value >> (exponent - 1)) - SUB_BUCKET_COUNT
+        return min(index, LatencyHistogram.BUCKETS - 1)
+    
+    @staticmethod
+    def bucket_bounds(index):
+        """
+        구간 번호에 해당하는 값의 범위를 계산하는 메서드
+        
+        Returns:
+            tuple: (하한, 상한) - 상한을 포함하는 정수 범위 (마이크로초)
+        """
+        exponent, offset = divmod(index, SUB_BUCKET_COUNT)
+        if exponent == 0:
+            return index, index
+        low = (SUB_BUCKET_COUNT + offset) << (exponent - 1)
+        return low, low + (1 << (exponent - 1)) - 1
+    
+    def record(self, value):
+        """
+        값 하나를 기록하는 메서드
+        
+        Args:
+            value (int): 기록할 값 (마이크로초)
+        """
+        self.counts[self.bucket_index(value)] += 1
+    
+    def total(self):
+        """
+        기록된 값의 개수를 반환하는 메서드
+        """
+        return sum(self.counts)
+    
+    def merge(self, other):
+        """
+        다른 히스토그램의 기록을 이 히스토그램에 더하는 메서드 (워커 합산용)
+        
+        Args:
+            other (LatencyHistogram): 더할 히스토그램
+        
+        Returns:
+            LatencyHistogram: self
+        """
+        counts = self.counts
+        for index, count in enumerate(other.counts):
+            if count:
+                counts[index] += count
+        return self
+    
+    def percentile(self, p):
+        """
+        p 백분위수를 계산하는 메서드
+        
+        해당 순위의 값이 들어 있는 구간의 상한을 돌려주므로 실제 값보다 약간(최대 약 6%) 클 수 있습니다.
+        
+        Args:
+            p (float): 백분위 (0~100)
+        
+        Returns:
+            int: 백분위수 (마이크로초, 기록이 없으면 0)
+        """
+        total = self.total()
+        if not total:
+            return 0
+        rank = max(1, -(-total * p // 100))  # 올림 나눗셈
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.bucket_bounds(index)[1]
+        return self.bucket_bounds(self.BUCKETS - 1)[1]
+    
+    def cumulative(self, bounds):
+        """
+        각 경계값 이하로 기록된 값의 누적 개수를 계산하는 메서드 (Prometheus 히스토그램용)
+        
+        구간의 상한이 경계값 이하인 구간만 셉니다.
+        
+        Args:
+            bounds (tuple): 오름차순 경계값 (마이크로초)
+        
+        Returns:
+            list: 경계값별 누적 개수
+        """
+        result = []
+        seen = 0
+        position = 0
+        for bound in bounds:
+            while position < self.BUCKETS and self.bucket_bounds(position)[1] <= bound:
+                seen += self.counts[position]
+                position += 1
+            result.append(seen)
+        return result
+
+
+def render_prometheus(counters, latency, requests_per_second, prefix='necho'):
+    """
+    카운터와 히스토그램을 Prometheus 텍스트 형식(0.0.4)으로 변환하는 함수
+    
+    Args:
+        counters (dict): 카운터 이름 -> 값 (active로 시작하거나 _active로 끝나는 이름은 gauge, 나머지는 counter)
+        latency (LatencyHistogram): 요청 처리 시간 히스토그램
+        requests_per_second (float): 직전 조회 이후의 초당 요청 수
+        prefix (str): 메트릭 이름 앞에 붙일 문자열
+    
+    Returns:
+        str: Prometheus 텍스트 형식 문자열
+    """
+    lines = []
+    for name, value in counters.items():
+        if name == 'latency_us':
+            # 처리 시간 합계는 아래 히스토그램의 _sum으로 내보냄
+            continue
+        if name.startswith('active') or name.endswith('_active'):
+            lines.append(f"# TYPE {prefix}_{name} gauge")
+            lines.append(f"{prefix}_{name} {value}")
+        elif name.endswith('_us'):
+            # 마이크로초 합계는 초 단위 counter로 변환
+            metric = f"{prefix}_{name[:-3]}_seconds_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value / 1e6}")
+        else:
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+    
+    lines.append(f"# TYPE {prefix}_requests_per_second gauge")
+    lines.append(f"{prefix}_requests_per_second {requests_per_second:.1f}")
+    
+    # 요청 처리 시간 히스토그램 (초 단위 경계)
+    metric = f"{prefix}_request_duration_seconds"
+    total = latency.total()
+    cumulative = latency.cumulative([int(bound * 1e6) for bound in EXPORT_BOUNDS])
+    lines.append(f"# TYPE {metric} histogram")
+    for bound, count in zip(EXPORT_BOUNDS, cumulative):
+        lines.append(f'{metric}_bucket{{le="{bound:g}"}} {count}')
+    lines.append(f'{metric}_bucket{{le="+Inf"}} {total}')
+    lines.append(f"{metric}_sum {counters.get('latency_us', 0) / 1e6}")
+    lines.append(f"{metric}_count {total}")
+    
+    # 히스토그램에서 계산한 백분위수 (구간 상한 기준)
+    metric = f"{prefix}_request_duration_quantile_seconds"
+    lines.append(f"# TYPE {metric} gauge")
+    for q in EXPORT_QUANTILES:
+        lines.append(f'{metric}{{quantile="{q:g}"}} {latency.percentile(q * 100) / 1e6}')
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """
+    메트릭 조회 서버 클래스
+    
+    지정한 포트에서 연결을 받아 collect()가 돌려준 메트릭을 Prometheus 텍스트 형식으로 응답합니다.
+    HTTP 요청(curl, Prometheus)이든 빈 연결(nc)이든 같은 내용을 보내고 연결을 닫습니다.
+    요청 처리 스레드와 분리된 데몬 스레드 하나에서 실행되며, 조회할 때만 문자열을 만듭니다.
+    """
+    
+    def __init__(self, collect, host='127.0.0.1', port=9100):
+        """
+        Args:
+            collect: (카운터 딕셔너리, LatencyHistogram)을 반환하는 함수
+            host (str): 바인딩할 주소 (기본값: '127.0.0.1' - 로컬에서만 조회)
+            port (int): 메트릭 포트 번호 (기본값: 9100)
+        """
+        self.collect = collect
+        self.host = host
+        self.port = port
+        self.server_socket = None
+        self._last_sample = (time.monotonic(), 0)  # (시각, 요청 수) - 초당 요청 수 계산용
+    
+    def start(self):
+        """
+        메트릭 서버 스레드를 시작하는 메서드
+        """
+        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server_socket.bind((self.host, self.port))
+        self.server_socket.listen(5)
+        thread = threading.Thread(target=self._serve, name='necho-metrics')
+        thread.daemon = True
+        thread.start()
+        log.info("[메트릭] http://%s:%s/metrics", self.host, self.port)
+    
+    def render(self):
+        """
+        현재 메트릭을 Prometheus 텍스트로 만드는 메서드
+        
+        초당 요청 수는 직전 조회 이후 늘어난 요청 수를 경과 시간으로 나눈 값입니다.
+        """
+        counters, latency = self.collect()
+        now = time.monotonic()
+        requests = counters.get('requests', 0)
+        last_time, last_requests = self._last_sample
+        elapsed = now - last_time
+        rate = (requests - last_requests) / elapsed if elapsed > 0 else 0.0
+        self._last_sample = (now, requests)
+        return render_prometheus(counters, latency, rate)
+    
+    def _serve(self):
+        """
+        메트릭 조회 연결을 하나씩 처리하는 루프
+        """
+        while True:
+            try:
+                client_socket, _ = self.server_socket.accept()
+            except OSError:
+                # 서버 소켓이 닫힌 경우
+                break
+            try:
+                # HTTP 요청이면 헤더를 읽고 버림 (내용과 관계없이 같은 응답)
+                client_socket.settimeout(0.5)
+                try:
+                    client_socket.recv(4096)
+                except socket.timeout:
+                    pass
+                body = self.render().encode('utf-8')
+                header = ("HTTP/1.0 200 OK\r\n"
+                          "Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                          f"Content-Length: {len(body)}\r\n\r\n").encode('ascii')
+                client_socket.sendall(header + body)
+            except OSError:
+                pass
+            finally:
+                client_socket.close()
+    
+    def stop(self):
+        """
+        메트릭 서버 소켓을 닫는 메서드
+        
+        close()만으로는 accept()에서 기다리는 스레드가 깨어나지 않아 포트가 계속 열려 있으므로,
+        shutdown()으로 먼저 깨워 포트를 바로 놓아줍니다 (재시작한 프로세스가 같은 포트에 바인딩할 수 있도록).
+        """
+        if self.server_socket:
+            try:
+                self.server_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.server_socket.close()
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+N-Echo 연결 풀 (Python)
+여러 스레드가 함께 사용하는 라이브러리용 N-Echo 클라이언트
+
+python_client.py의 NEchoClient는 대화형 프로그램(main)을 위한 클래스라서 소켓 하나만 다루고,
+연결과 요청마다 화면에 출력하며, 오류가 나면 출력 후 None을 반환합니다.
+다른 서비스가 N-Echo 서버를 호출할 때 요청마다 새로 연결하면 연결 수립 비용(TCP 3-way handshake)과
+출력 비용을 매번 치르게 됩니다. 이 모듈의 NEchoPool은 다음 기능을 제공합니다.
+
+- 연결 재사용(keep-alive): 요청이 끝난 연결을 닫지 않고 보관했다가 다음 요청에 다시 사용
+  (TCP 연결은 SO_KEEPALIVE를 켜서 끊어진 상대를 커널이 찾아내도록 함)
+- 상태 확인(health check): 보관 중인 연결을 꺼낼 때마다 서버가 연결을 닫았는지 확인하고,
+  오래 쉬던 연결은 n=1 요청을 보내 응답하는지 확인한 뒤 사용
+- 자동 재연결: 재사용한 연결이 요청 도중 끊어지면 새 연결로 한 번 더 시도
+  (N-Echo 요청은 서버에 상태를 남기지 않으므로 다시 보내도 결과가 같음)
+- 호출별 제한 시간: 연결을 얻고, 보내고, 응답을 받는 전체 시간을 timeout초로 제한
+- 출력 없음: 응답은 파싱된 딕셔너리로 반환하고, 실패는 예외(TimeoutError, ConnectionError)로 알림
+
+사용 예:
+    from necho_pool import NEchoPool
+    
+    with NEchoPool('127.0.0.1', 5000, max_size=8) as pool:
+        response = pool.request(3, 'Hello', timeout=1.0)
+        print(list(response['echoes']))
+"""
+
+# socket: 네트워크 통신을 위한 소켓 라이브러리
+import socket
+# threading: 여러 스레드가 풀을 안전하게 함께 쓰기 위한 잠금과 조건 변수
+import threading
+# time: 제한 시간(deadline)과 유휴 시간 계산을 위한 라이브러리
+import time
+# collections.deque: 보관 중인 연결 목록 (오래된 연결은 앞에서 정리, 최근 연결은 뒤에서 꺼냄)
+from collections import deque
+# necho_protocol: 요청/응답 프레이밍과 주소 해석
+from necho_protocol import (FrameBuffer, encode_frame, decode_frame, expand_echoes,
+                            parse_address, format_address, RECV_SIZE, ENCODING_REPEAT)
+
+# 상태 확인에 사용하는 요청 (가장 작은 정상 요청)
+HEALTH_CHECK_FRAME = encode_frame({'n': 1, 'message': 'ping', 'encoding': ENCODING_REPEAT})
+
+# 풀 카운터 이름 (stats()의 키)
+POOL_STAT_NAMES = ('requests', 'connects', 'reuses', 'reconnects', 'timeouts', 'health_check_failures')
+
+
+def _remaining(deadline):
+    """
+    deadline까지 남은 시간(초)을 반환하는 함수 (이미 지났으면 TimeoutError)
+    """
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError("요청 제한 시간을 넘었습니다.")
+    return remaining
+
+
+class PooledConnection:
+    """
+    풀이 관리하는 서버 연결 하나를 나타내는 클래스
+    
+    소켓과 응답 수신 버퍼를 함께 보관하며, 한 번에 한 스레드만 사용합니다
+    (풀에서 꺼낸 스레드가 요청을 마치고 돌려줄 때까지 다른 스레드는 이 연결을 받지 못함).
+    """
+    
+    def __init__(self, family, address, connect_timeout=3.0, keepalive=60):
+        """
+        서버에 연결하는 생성자
+        
+        Args:
+            family: 주소 체계 (socket.AF_INET, AF_INET6, AF_UNIX)
+            address: connect()에 넘길 주소 ((host, port) 튜플 또는 파일 경로)
+            connect_timeout (float): 연결 수립 제한 시간 (초)
+            keepalive (int): TCP keep-alive 탐색을 시작할 유휴 시간 (초, None이면 SO_KEEPALIVE를 켜지 않음)
+        
+        Raises:
+            OSError: 연결에 실패한 경우 (TimeoutError 포함)
+        """
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            self.sock.settimeout(connect_timeout)
+            self.sock.connect(address)
+            if family != getattr(socket, 'AF_UNIX', None):
+                # 작은 요청을 모아 보내려고 기다리지 않도록 Nagle 알고리즘을 끔
+                self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                if keepalive:
+                    self._enable_keepalive(keepalive)
+        except OSError:
+            self.sock.close()
+            raise
+        self._buffer = FrameBuffer()  # 응답 조각을 모으는 증분 수신 버퍼
+        self._frames = deque()  # 수신했지만 아직 꺼내지 않은 응답 프레임
+        self.last_used = time.monotonic()  # 마지막으로 요청을 마친 시각
+    
+    def _enable_keepalive(self, idle):
+        """
+        TCP keep-alive를 켜는 메서드
+        
+        상대 호스트가 꺼지거나 중간 장비가 연결을 잊어버려도 FIN이 오지 않으므로,
+        오래 쉬는 연결은 커널이 주기적으로 탐색 패킷을 보내 끊어진 연결을 찾아내게 합니다.
+        세부 간격 옵션은 운영체제마다 달라서 지원하는 경우에만 설정합니다.
+        """
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        for option, value in (('TCP_KEEPIDLE', idle), ('TCP_KEEPINTVL', max(1, idle // 6)),
+                              ('TCP_KEEPCNT', 3)):
+            if hasattr(socket, option):
+                self.sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+    
+    def is_alive(self):
+        """
+        서버가 연결을 닫지 않았는지 확인하는 메서드 (네트워크 왕복 없음)
+        
+        쉬고 있는 연결에는 서버가 보낼 데이터가 없어야 하므로, 읽을 수 있는 데이터가 있으면
+        서버가 연결을 닫았거나(EOF) 응답 순서가 어긋난 것입니다.
+        MSG_PEEK으로 읽어 보기만 하고 버퍼에서 꺼내지는 않습니다.
+        
+        Returns:
+            bool: 그대로 사용해도 되면 True
+        """
+        if self._frames or len(self._buffer):
+            return False
+        try:
+            self.sock.setblocking(False)
+            self.sock.recv(1, socket.MSG_PEEK)
+        except BlockingIOError:
+            # 읽을 데이터가 없음 - 정상적으로 쉬고 있는 연결
+            return True
+        except OSError:
+            return False
+        # EOF(b'')이거나 요청하지 않은 데이터가 있음
+        return False
+    
+    def request(self, frame, deadline):
+        """
+        요청 프레임 하나를 보내고 응답 프레임 하나를 받는 메서드
+        
+        Args:
+            frame (bytes): encode_frame()으로 만든 요청
+            deadline (float): 응답을 다 받아야 하는 시각 (time.monotonic() 기준)
+        
+        Returns:
+            bytes: 구분자를 제외한 응답 프레임
+        
+        Raises:
+            TimeoutError: deadline까지 응답을 다 받지 못한 경우
+            ConnectionError: 응답을 다 받기 전에 서버가 연결을 종료한 경우
+        """
+        self.sock.settimeout(_remaining(deadline))
+        self.sock.sendall(frame)
+        while not self._frames:
+            self.sock.settimeout(_remaining(deadline))
+            data = self.sock.recv(RECV_SIZE)
+            if not data:
+                raise ConnectionError("서버가 연결을 종료했습니다.")
+            self._frames.extend(self._buffer.feed(data))
+        return self._frames.popleft()
+    
+    def close(self):
+        """
+        소켓을 닫는 메서드
+        """
+        self.sock.close()
+
+
+class NEchoPool:
+    """
+    N-Echo 연결 풀 클래스
+    
+    최대 max_size개의 연결을 열어 두고 여러 스레드가 나누어 사용합니다.
+    모든 연결이 사용 중이면 다른 스레드가 연결을 돌려줄 때까지(제한 시간 안에서) 기다립니다.
+    보관 중인 연결은 가장 최근에 쓴 것부터 꺼내므로, 부하가 줄면 오래된 연결은 max_idle이 지나 정리됩니다.
+    """
+    
+    def __init__(self, host='localhost', port=5000, max_size=8, timeout=5.0, connect_timeout=3.0,
+                 max_idle=300.0, health_check_interval=30.0, retries=1, keepalive=60, compact=True):
+        """
+        풀 초기화 메서드 (연결은 처음 필요할 때 만듦)
+        
+        Args:
+            host (str): 서버 주소 ('host', 'host:port', 'unix:/경로' - NEchoClient와 같음)
+            port (int): 서버 포트 번호 (기본값: 5000)
+            max_size (int): 동시에 열어 둘 최대 연결 수 (기본값: 8)
+            timeout (float): request()의 기본 제한 시간 (초, 기본값: 5)
+            connect_timeout (float): 연결 수립 제한 시간 (초, 기본값: 3)
+            max_idle (float): 이 시간 넘게 쉰 연결은 재사용하지 않고 닫음 (초, 기본값: 300)
+            health_check_interval (float): 이 시간 넘게 쉰 연결은 n=1 요청으로 확인한 뒤 사용 (초, 기본값: 30)
+            retries (int): 연결이 끊어진 경우 새 연결로 다시 시도할 횟수 (기본값: 1)
+            keepalive (int): TCP keep-alive 탐색 시작 시간 (초, None이면 끔, 기본값: 60)
+            compact (bool): "repeat" 압축 응답을 요청할지 여부 (기본값: True)
+        """
+        if max_size < 1:
+            raise ValueError("max_size는 1 이상이어야 합니다.")
+        self.family, self.address = parse_address(host, port)
+        self.max_size = max_size
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.max_idle = max_idle
+        self.health_check_interval = health_check_interval
+        self.retries = retries
+        self.keepalive = keepalive
+        self.compact = compact
+        self._idle = deque()  # 보관 중인 연결 (뒤쪽이 가장 최근에 쓴 연결)
+        self._open = 0  # 열려 있는 연결 수 (보관 중 + 사용 중 + 연결 중)
+        self._closed = False
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)  # 연결이 반환되면 기다리는 스레드를 깨움
+        self.counters = dict.fromkeys(POOL_STAT_NAMES, 0)
+    
+    def __repr__(self):
+        return f"NEchoPool({format_address(self.family, self.address)}, max_size={self.max_size})"
+    
+    def build_request(self, n, message):
+        """
+        요청 딕셔너리를 만드는 메서드 (NEchoClient.build_request와 같은 형식)
+        """
+        request = {'n': n, 'message': message}
+        if self.compact:
+            request['encoding'] = ENCODING_REPEAT
+        return request
+    
+    def request(self, n, message, timeout=None):
+        """
+        N-Echo 요청 하나를 보내고 파싱된 응답을 반환하는 메서드 (여러 스레드에서 동시에 호출 가능)
+        
+        Args:
+            n (int): 메시지를 몇 번 반복할지 (에코 횟수)
+            message (str): 에코할 메시지 내용
+            timeout (float): 연결 대기, 전송, 수신을 모두 합친 제한 시간 (초, 기본값: None - 풀 설정 사용)
+        
+        Returns:
+            dict: 서버 응답 (status가 'error'인 응답도 그대로 반환)
+                  압축 응답이면 echoes는 지연 시퀀스입니다.
+        
+        Raises:
+            TimeoutError: 제한 시간 안에 응답을 받지 못한 경우
+            ConnectionError: 서버에 연결할 수 없거나, 다시 시도해도 연결이 끊어진 경우
+            ValueError: 응답이 올바른 JSON이 아닌 경우
+        """
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        frame = encode_frame(self.build_request(n, message))
+        attempt = 0
+        while True:
+            conn = self._acquire(deadline)
+            try:
+                response = conn.request(frame, deadline)
+            except TimeoutError:
+                # 늦게 도착할 응답이 다음 요청의 응답으로 읽히지 않도록 연결을 버림
+                self._release(conn, reusable=False, timed_out=True)
+                raise
+            except OSError as e:
+                self._release(conn, reusable=False)
+                if attempt >= self.retries:
+                    raise ConnectionError(f"요청 처리 중 연결이 끊어졌습니다: {e}") from e
+                attempt += 1
+                with self._lock:
+                    self.counters['reconnects'] += 1
+                continue
+            except BaseException:
+                self._release(conn, reusable=False)
+                raise
+            self._release(conn, reusable=True)
+            # 연결을 돌려준 뒤에 파싱 (JSON 오류는 연결 상태와 무관하게 호출자에게 알림)
+            return expand_echoes(decode_frame(response))
+    
+    def ping(self, timeout=None):
+        """
+        서버가 요청에 응답하는지 확인하는 메서드
+        
+        Args:
+            timeout (float): 제한 시간 (초, 기본값: None - 풀 설정 사용)
+        
+        Returns:
+            bool: 정상 응답을 받으면 True
+        """
+        try:
+            return self.request(1, 'ping', timeout).get('status') == 'success'
+        except (OSError, ValueError):
+            return False
+    
+    def _acquire(self, deadline):
+        """
+        사용할 연결 하나를 꺼내거나 새로 만드는 메서드
+        
+        보관 중인 연결이 있으면 상태를 확인한 뒤 반환하고, 없으면 max_size까지 새로 연결하며,
+        모든 연결이 사용 중이면 deadline까지 반환을 기다립니다.
+        
+        Returns:
+            PooledConnection: 이 스레드만 사용하는 연결
+        
+        Raises:
+            TimeoutError: deadline까지 연결을 얻지 못한 경우
+            ConnectionError: 풀이 닫혔거나 서버에 연결할 수 없는 경우
+        """
+        while True:
+            with self._available:
+                conn = self._checkout(deadline)
+            if conn is None:
+                break
+            # 상태 확인은 잠금 밖에서 수행 (n=1 요청은 네트워크 왕복이 필요함)
+            if self._check(conn, deadline):
+                with self._lock:
+                    self.counters['reuses'] += 1
+                return conn
+            self._release(conn, reusable=False, health_check_failed=True)
+        
+        # 새 연결 (자리는 _checkout()에서 미리 확보함)
+        try:
+            timeout = min(self.connect_timeout, _remaining(deadline))
+            conn = PooledConnection(self.family, self.address, timeout, self.keepalive)
+        except BaseException as e:
+            with self._available:
+                self._open -= 1
+                self._available.notify()
+            if isinstance(e, TimeoutError):
+                raise
+            if isinstance(e, OSError):
+                raise ConnectionError(
+                    f"서버 {format_address(self.family, self.address)}에 연결할 수 없습니다: {e}") from e
+            raise
+        with self._lock:
+            self.counters['connects'] += 1
+        return conn
+    
+    def _checkout(self, deadline):
+        """
+        보관 중인 연결을 꺼내거나 새 연결 자리를 확보하는 메서드 (self._lock을 잡은 상태에서 호출)
+        
+        Returns:
+            PooledConnection: 보관 중이던 연결 (None이면 새로 연결할 자리를 확보한 것)
+        """
+        while True:
+            if self._closed:
+                raise ConnectionError("연결 풀이 닫혔습니다.")
+            # 너무 오래 쉰 연결은 앞쪽(가장 오래된 쪽)부터 정리
+            now = time.monotonic()
+            while self._idle and now - self._idle[0].last_used > self.max_idle:
+                self._idle.popleft().close()
+                self._open -= 1
+            if self._idle:
+                return self._idle.pop()
+            if self._open < self.max_size:
+                self._open += 1
+                return None
+            remaining = deadline - now
+            if remaining <= 0:
+                self.counters['timeouts'] += 1
+                raise TimeoutError(f"사용 가능한 연결이 없습니다 (최대 {self.max_size}개 모두 사용 중).")
+            self._available.wait(remaining)
+    
+    def _check(self, conn, deadline):
+        """
+        보관 중이던 연결을 사용해도 되는지 확인하는 메서드
+        
+        항상 서버가 연결을 닫았는지(EOF) 확인하고, health_check_interval 넘게 쉰 연결은
+        실제로 n=1 요청을 보내 응답하는지까지 확인합니다.
+        
+        Returns:
+            bool: 사용해도 되면 True
+        """
+        if not conn.is_alive():
+            return False
+        if time.monotonic() - conn.last_used <= self.health_check_interval:
+            return True
+        try:
+            response = decode_frame(conn.request(HEALTH_CHECK_FRAME, deadline))
+        except (OSError, ValueError):
+            return False
+        return response.get('status') == 'success'
+    
+    def _release(self, conn, reusable, timed_out=False, health_check_failed=False):
+        """
+        사용이 끝난 연결을 풀에 돌려주거나 닫는 메서드
+        
+        Args:
+            conn (PooledConnection): 돌려줄 연결
+            reusable (bool): 다음 요청에 다시 써도 되는지 여부 (False면 닫음)
+            timed_out (bool): 제한 시간 초과로 버리는 연결인지 여부 (카운터용)
+            health_check_failed (bool): 상태 확인에 실패한 연결인지 여부 (카운터용)
+        """
+        with self._available:
+            if timed_out:
+                self.counters['timeouts'] += 1
+            if health_check_failed:
+                self.counters['health_check_failures'] += 1
+            else:
+                self.counters['requests'] += 1
+            if reusable and not self._closed:
+                conn.last_used = time.monotonic()
+                self._idle.append(conn)
+            else:
+                conn.close()
+                self._open -= 1
+            self._available.notify()
+    
+    def stats(self):
+        """
+        풀 카운터와 현재 연결 수를 반환하는 메서드
+        
+        Returns:
+            dict: requests(요청 시도), connects(새 연결), reuses(재사용), reconnects(재시도),
+                  timeouts(제한 시간 초과), health_check_failures(상태 확인 실패), open, idle
+        """
+        with self._lock:
+            stats = dict(self.counters)
+            stats['open'] = self._open
+            stats['idle'] = len(self._idle)
+        return stats
+    
+    def close(self):
+        """
+        풀을 닫는 메서드
+        
+        보관 중인 연결은 바로 닫고, 사용 중인 연결은 요청이 끝나 반환될 때 닫습니다.
+        닫힌 풀에 요청하면 ConnectionError가 발생합니다.
+        """
+        with self._available:
+            self._closed = True
+            while self._idle:
+                self._idle.pop().close()
+                self._open -= 1
+            self._available.notify_all()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
@@ -0,0 +1,569 @@
+#!/usr/bin/env python3
+"""
+N-Echo 프로토콜 공용 모듈 (Python)
+서버와 클라이언트가 함께 사용하는 메시지 프레이밍(framing) 기능
+
+TCP는 메시지 경계가 없는 바이트 스트림이므로, recv() 한 번이
+요청 하나와 일치한다는 보장이 없습니다. 큰 응답은 여러 번에 나뉘어 도착하고,
+연달아 보낸 요청 여러 개는 한 번의 recv()로 합쳐져 도착할 수 있습니다.
+
+그래서 N-Echo 프로토콜은 JSON 메시지 하나를 한 줄로 보내고
+줄바꿈 문자('\\n')로 메시지의 끝을 표시합니다 (newline-delimited JSON).
+JSON 문자열 안의 줄바꿈은 항상 '\\\\n'으로 이스케이프되므로 구분자와 겹치지 않습니다.
+Java 서버(NEchoServer.java)의 readLine()/println()과도 그대로 호환됩니다.
+
+응답 인코딩 협상:
+요청에 "encoding": "repeat"를 넣으면 서버는 echoes 배열 대신
+{"status": "success", "n": n, "message": message, "encoding": "repeat"}처럼
+메시지를 한 번만 보냅니다. 이 키가 없는 요청(기존 클라이언트)은 기존 echoes 배열을 받습니다.
+
+바이너리 프로토콜 (선택):
+연결 직후 클라이언트가 BINARY_HELLO(첫 바이트 0xFF - JSON이나 UTF-8 텍스트에는 나올 수 없는 값)를 보내면
+서버가 같은 값을 돌려보내고, 그 연결은 이후 고정 헤더 + 메시지 바이트 형식을 사용합니다.
+  헤더 12바이트 (네트워크 바이트 순서): op(1) status(1) flags(2) n(4) length(4)
+  본문 length바이트: 요청은 메시지, 성공 응답은 메시지 한 번("repeat" 인코딩과 같음), 에러 응답은 에러 메시지
+JSON만 아는 서버는 BINARY_HELLO 줄을 잘못된 JSON으로 보고 JSON 에러 응답을 보내므로,
+클라이언트는 그 응답을 보고 같은 연결에서 JSON으로 돌아갈 수 있습니다. 기본값은 JSON입니다.
+
+서버 주소:
+같은 프로토콜을 TCP와 유닉스 도메인 소켓(AF_UNIX) 양쪽으로 제공합니다.
+주소는 'host', 'host:port', 'tcp://host:port' 또는 'unix:/경로', 'unix:///경로', '/경로'로 지정합니다.
+"""
+
+# json: JSON 형식의 데이터를 다루기 위한 라이브러리
+import json
+# struct: 바이너리 프로토콜의 고정 헤더를 만들고 해석하기 위한 라이브러리
+import struct
+# socket: 주소 체계(AF_INET/AF_UNIX) 상수를 위한 라이브러리
+import socket
+# os: sendmsg() 한 번에 넘길 수 있는 버퍼 수(IOV_MAX) 조회를 위한 라이브러리
+import os
+# collections.abc.Sequence: 리스트처럼 동작하는 지연(lazy) 시퀀스 구현을 위한 기반 클래스
+from collections.abc import Sequence
+# collections.namedtuple: 바이너리 프레임의 헤더 필드와 본문을 묶는 튜플
+from collections import namedtuple
+
+# 메시지(프레임)의 끝을 나타내는 구분자
+FRAME_DELIMITER = b'\n'
+
+# 한 번의 recv()로 읽을 최대 바이트 수
+RECV_SIZE = 65536
+
+# 압축 응답 인코딩 이름 - 메시지를 한 번만 보내고 반복 횟수(n)로 표현
+ENCODING_REPEAT = 'repeat'
+
+# 스트리밍 응답을 나누어 보내는 조각 크기 (바이트)
+STREAM_CHUNK_SIZE = 65536
+
+# sendmsg() 한 번에 넘길 수 있는 최대 버퍼 수 (조회할 수 없으면 리눅스 기본값 1024)
+try:
+    IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = -1
+if IOV_MAX <= 0:
+    IOV_MAX = 1024
+
+# 유닉스 도메인 소켓 주소의 접두어 (예: unix:/tmp/necho.sock)
+UNIX_SCHEME = 'unix:'
+
+# TCP 주소의 접두어 (생략 가능)
+TCP_SCHEME = 'tcp://'
+
+# 바이너리 프로토콜 시작 인사 - 0xFF, 'NEB', 버전 1, 줄바꿈
+# (줄바꿈으로 끝나므로 JSON만 아는 서버는 이 줄에 JSON 에러 응답 하나를 보냄)
+BINARY_HELLO = b'\xffNEB\x01\n'
+
+# 바이너리 프레임 헤더: op, status, flags, n, length (네트워크 바이트 순서, 12바이트)
+BINARY_HEADER = struct.Struct('!BBHII')
+
+# 바이너리 프레임의 op 값 - N-Echo 요청/응답
+OP_ECHO = 1
+
+# 바이너리 응답의 status 값
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+# 바이너리 프레임 하나 (body는 헤더 뒤의 length바이트)
+BinaryFrame = namedtuple('BinaryFrame', 'op status flags n body')
+
+
+class FrameTooLargeError(ValueError):
+    """
+    구분자 없이 허용 크기를 넘는 데이터가 쌓였을 때 발생하는 예외
+    """
+
+
+def encode_frame(message):
+    """
+    딕셔너리를 전송할 수 있는 프레임(바이트)으로 변환하는 함수
+    
+    Args:
+        message (dict): 보낼 요청 또는 응답
+    
+    Returns:
+        bytes: UTF-8로 인코딩된 JSON 한 줄 (끝에 구분자 포함)
+    """
+    # ensure_ascii=False: 한글 등 유니코드 문자를 그대로 유지
+    return json.dumps(message, ensure_ascii=False).encode('utf-8') + FRAME_DELIMITER
+
+
+def decode_frame(frame):
+    """
+    수신한 프레임(바이트)을 딕셔너리로 변환하는 함수
+    
+    Args:
+        frame (bytes): 구분자를 제외한 프레임 내용
+    
+    Returns:
+        dict: 파싱된 JSON 객체
+    
+    Raises:
+        ValueError: JSON 형식이 올바르지 않거나 UTF-8이 아닌 경우
+    """
+    return json.loads(frame)
+
+
+class FrameBuffer:
+    """
+    증분 수신 버퍼 클래스
+    
+    recv()로 받은 조각들을 차례로 넣으면(feed) 완성된 프레임만 골라 돌려줍니다.
+    아직 구분자가 도착하지 않은 나머지 바이트는 다음 feed()까지 보관합니다.
+    """
+    
+    def __init__(self, max_frame_size=None):
+        """
+        버퍼 초기화 메서드
+        
+        Args:
+            max_frame_size (int): 프레임 하나의 최대 크기 (바이트, 기본값: None - 제한 없음)
+        """
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray()  # 아직 완성되지 않은 프레임의 바이트
+        self._scanned = 0  # 구분자를 이미 찾아본 위치 (큰 프레임을 반복해서 검색하지 않기 위함)
+    
+    def __len__(self):
+        """
+        버퍼에 남아 있는(아직 완성되지 않은) 바이트 수
+        """
+        return len(self._buffer)
+    
+    def feed(self, data):
+        """
+        수신한 데이터를 버퍼에 추가하고 완성된 프레임 목록을 반환하는 메서드
+        
+        Args:
+            data (bytes): recv()로 받은 데이터
+        
+        Returns:
+            list: 완성된 프레임(bytes)의 목록 (구분자와 끝의 '\\r' 제외, 빈 줄 제외)
+        
+        Raises:
+            FrameTooLargeError: 구분자 없이 max_frame_size를 넘는 데이터가 쌓인 경우
+        """
+        buffer = self._buffer
+        buffer += data
+        frames = []
+        start = 0
+        end = buffer.find(FRAME_DELIMITER, self._scanned)
+        while end != -1:
+            frame = bytes(buffer[start:end]).rstrip(b'\r')
+            if frame:
+                frames.append(frame)
+            start = end + 1
+            end = buffer.find(FRAME_DELIMITER, start)
+        
+        # 처리한 프레임은 버퍼에서 한 번에 제거
+        if start:
+            del buffer[:start]
+        self._scanned = len(buffer)
+        
+        if self.max_frame_size is not None and len(buffer) > self.max_frame_size:
+            raise FrameTooLargeError(
+                f"프레임 크기가 최대 허용 크기({self.max_frame_size}바이트)를 넘었습니다.")
+        return frames
+
+
+class BinaryFrameBuffer:
+    """
+    바이너리 프로토콜용 증분 수신 버퍼 클래스
+    
+    FrameBuffer와 같은 방식으로 사용하며(feed), 헤더의 length만큼 본문이 모두 도착한
+    프레임만 BinaryFrame으로 돌려줍니다. 구분자를 찾을 필요 없이 길이만 보면 되므로
+    본문 내용을 검사하거나 디코딩하지 않습니다.
+    """
+    
+    def __init__(self, max_frame_size=None):
+        """
+        버퍼 초기화 메서드
+        
+        Args:
+            max_frame_size (int): 프레임 본문의 최대 크기 (바이트, 기본값: None - 제한 없음)
+        """
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray()  # 아직 완성되지 않은 프레임의 바이트
+    
+    def __len__(self):
+        """
+        버퍼에 남아 있는(아직 완성되지 않은) 바이트 수
+        """
+        return len(self._buffer)
+    
+    def feed(self, data):
+        """
+        수신한 데이터를 버퍼에 추가하고 완성된 프레임 목록을 반환하는 메서드
+        
+        Args:
+            data (bytes): recv()로 받은 데이터
+        
+        Returns:
+            list: 완성된 BinaryFrame의 목록
+        
+        Raises:
+            FrameTooLargeError: 헤더의 length가 max_frame_size를 넘는 경우 (본문을 기다리지 않고 바로 발생)
+        """
+        buffer = self._buffer
+        buffer += data
+        frames = []
+        start = 0
+        header_size = BINARY_HEADER.size
+        while len(buffer) - start >= header_size:
+            op, status, flags, n, length = BINARY_HEADER.unpack_from(buffer, start)
+            if self.max_frame_size is not None and length > self.max_frame_size:
+                raise FrameTooLargeError(
+                    f"프레임 크기가 최대 허용 크기({self.max_frame_size}바이트)를 넘었습니다.")
+            end = start + header_size + length
+            if end > len(buffer):
+                break
+            frames.append(BinaryFrame(op, status, flags, n, bytes(buffer[start + header_size:end])))
+            start = end
+        
+        # 처리한 프레임은 버퍼에서 한 번에 제거
+        if start:
+            del buffer[:start]
+        return frames
+
+
+def encode_binary_frame(n, body, status=STATUS_OK, op=OP_ECHO):
+    """
+    바이너리 프레임(헤더 + 본문)을 만드는 함수
+    
+    Args:
+        n (int): 에코 횟수 (0 이상 2^32 미만)
+        body (bytes): 본문 (요청과 성공 응답은 메시지, 에러 응답은 에러 메시지)
+        status (int): STATUS_OK 또는 STATUS_ERROR (기본값: STATUS_OK)
+        op (int): 프레임 종류 (기본값: OP_ECHO)
+    
+    Returns:
+        bytes: 전송할 프레임
+    
+    Raises:
+        ValueError: n이 헤더에 담을 수 없는 값인 경우
+    """
+    if not 0 <= n <= 0xFFFFFFFF:
+        raise ValueError("바이너리 프로토콜의 n은 0 이상 4294967295 이하여야 합니다.")
+    return BINARY_HEADER.pack(op, status, 0, n, len(body)) + body
+
+
+def encode_binary_error(message, op=OP_ECHO):
+    """
+    바이너리 에러 응답 프레임을 만드는 함수
+    
+    Args:
+        message (str): 에러 메시지
+        op (int): 요청의 op 값 (기본값: OP_ECHO)
+    
+    Returns:
+        bytes: 전송할 프레임
+    """
+    return encode_binary_frame(0, message.encode('utf-8'), STATUS_ERROR, op)
+
+
+def decode_binary_response(frame):
+    """
+    바이너리 응답 프레임을 JSON 응답과 같은 모양의 딕셔너리로 바꾸는 함수
+    
+    성공 응답은 "repeat" 인코딩 JSON 응답에 expand_echoes()를 적용한 결과와 같습니다.
+    
+    Args:
+        frame (BinaryFrame): BinaryFrameBuffer가 돌려준 프레임
+    
+    Returns:
+        dict: 응답 딕셔너리 (status, n, message, encoding, echoes 또는 status, message)
+    
+    Raises:
+        ValueError: 본문이 UTF-8이 아닌 경우
+    """
+    message = frame.body.decode('utf-8')
+    if frame.status != STATUS_OK:
+        return {'status': 'error', 'message': message}
+    return {'status': 'success', 'n': frame.n, 'message': message, 'encoding': ENCODING_REPEAT,
+            'echoes': RepeatedEchoes(message, frame.n)}
+
+
+class RepeatedEchoes(Sequence):
+    """
+    같은 메시지가 n번 반복된 echoes 배열을 표현하는 지연(lazy) 시퀀스 클래스
+    
+    "repeat" 인코딩 응답을 받으면 n개짜리 리스트를 만들지 않고 이 객체를 사용합니다.
+    len(), 인덱싱, 반복(for), 비교는 리스트와 같게 동작하며,
+    실제 리스트가 필요할 때만 list(echoes)로 만들면 됩니다.
+    """
+    
+    __slots__ = ('message', 'n')
+    
+    def __init__(self, message, n):
+        """
+        Args:
+            message (str): 반복되는 메시지
+            n (int): 반복 횟수
+        """
+        self.message = message
+        self.n = n
+    
+    def __len__(self):
+        return self.n
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # 슬라이스는 해당 길이만큼만 실제 리스트로 만듦
+            return [self.message] * len(range(*index.indices(self.n)))
+        if index < 0:
+            index += self.n
+        if not 0 <= index < self.n:
+            raise IndexError('echoes 인덱스가 범위를 벗어났습니다.')
+        return self.message
+    
+    def __iter__(self):
+        message = self.message
+        for _ in range(self.n):
+            yield message
+    
+    def __contains__(self, value):
+        # 모든 원소가 같으므로 n번 비교할 필요 없음
+        return self.n > 0 and value == self.message
+    
+    def count(self, value):
+        return self.n if value in self else 0
+    
+    def __eq__(self, other):
+        if isinstance(other, RepeatedEchoes):
+            return self.n == other.n and (self.n == 0 or self.message == other.message)
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return len(other) == self.n and all(item == self.message for item in other)
+        return NotImplemented
+    
+    def __repr__(self):
+        return f"RepeatedEchoes({self.message!r}, n={self.n})"
+
+
+def expand_echoes(response):
+    """
+    "repeat" 인코딩 응답을 기존 형식(echoes 키가 있는 응답)으로 바꾸는 함수
+    
+    echoes에는 리스트 대신 RepeatedEchoes 지연 시퀀스를 넣으므로
+    n이 아무리 커도 메모리를 거의 쓰지 않습니다.
+    이미 echoes 배열이 있는 응답(기존 서버, Java 서버)은 그대로 반환합니다.
+    
+    Args:
+        response (dict): 서버로부터 받은 응답
+    
+    Returns:
+        dict: echoes 키를 가진 응답
+    """
+    if response.get('encoding') == ENCODING_REPEAT and 'echoes' not in response:
+        response['echoes'] = RepeatedEchoes(response.get('message', ''), response.get('n', 0))
+    return response
+
+
+def _encode_json(value):
+    """
+    JSON 값 하나를 encode_frame()과 같은 형식의 UTF-8 바이트로 변환하는 함수
+    """
+    return json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+
+def _split_echoes(message):
+    """
+    echoes 배열 앞뒤의 고정 부분과 원소 하나의 인코딩 결과를 계산하는 함수
+    
+    Args:
+        message (dict): echoes 값이 RepeatedEchoes인 응답
+    
+    Returns:
+        tuple: (head, item, tail) 바이트 - 전체 프레임은 head + item을 ', '로 n번 이은 것 + tail
+    """
+    rest = {key: value for key, value in message.items() if key != 'echoes'}
+    # '{"status": "success", "n": 3' 뒤에 echoes 키를 이어 붙여 json.dumps와 같은 모양을 만듦
+    head = _encode_json(rest)[:-1] + (b', ' if rest else b'') + b'"echoes": ['
+    item = _encode_json(message['echoes'].message)
+    return head, item, b']}' + FRAME_DELIMITER
+
+
+def frame_size(message):
+    """
+    응답을 프레임으로 보낼 때의 전체 크기(바이트)를 계산하는 함수
+    
+    echoes가 RepeatedEchoes이면 실제로 인코딩하지 않고 크기만 계산합니다.
+    
+    Args:
+        message (dict): 보낼 응답
+    
+    Returns:
+        int: 구분자를 포함한 프레임 크기
+    """
+    echoes = message.get('echoes')
+    if not isinstance(echoes, RepeatedEchoes):
+        return len(encode_frame(message))
+    head, item, tail = _split_echoes(message)
+    return len(head) + echoes.n * (len(item) + 2) - (2 if echoes.n else 0) + len(tail)
+
+
+def iter_frame_chunks(message, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    응답을 프레임으로 인코딩하면서 일정 크기의 조각으로 나누어 돌려주는 제너레이터
+    
+    echoes가 RepeatedEchoes인 응답은 전체 JSON 문자열을 만들지 않고
+    메시지를 한 번만 인코딩한 뒤 같은 바이트를 재사용하여 조각을 만듭니다.
+    그래서 n이 아무리 커도 사용하는 메모리는 조각 하나(chunk_size) 정도로 일정하며,
+    encode_frame(응답을 리스트로 만든 것)과 바이트 단위로 같은 결과를 냅니다.
+    echoes가 일반 리스트이거나 없는 응답은 encode_frame() 결과 하나를 돌려줍니다.
+    
+    Args:
+        message (dict): 보낼 응답
+        chunk_size (int): 조각 하나의 대략적인 크기 (바이트)
+    
+    Yields:
+        bytes: 프레임 조각 (모두 이어 붙이면 프레임 하나)
+    """
+    echoes = message.get('echoes')
+    if not isinstance(echoes, RepeatedEchoes):
+        yield encode_frame(message)
+        return
+    
+    head, item, tail = _split_echoes(message)
+    n = echoes.n
+    if n == 0:
+        yield head + tail
+        return
+    
+    # 조각 하나에 들어갈 원소 수 (최소 1개) - 원소와 구분자를 미리 반복해 둔 조각을 재사용
+    element = item + b', '
+    per_chunk = max(1, chunk_size // len(element))
+    full_chunk = element * per_chunk
+    
+    # 첫 조각에는 head를 붙이고, 마지막 원소 뒤에는 구분자 대신 tail을 붙임
+    remaining = n - 1
+    pending = head
+    while remaining >= per_chunk:
+        yield pending + full_chunk if pending else full_chunk
+        pending = b''
+        remaining -= per_chunk
+    yield pending + element * remaining + item + tail
+
+
+def iter_frame_buffers(message, block_size=STREAM_CHUNK_SIZE, max_buffers=IOV_MAX):
+    """
+    응답 프레임을 sendmsg()에 그대로 넘길 수 있는 버퍼 목록으로 나누어 돌려주는 제너레이터
+    
+    iter_frame_chunks()는 조각마다 새 bytes를 만들지만, 이 함수는 원소 여러 개를 이어 둔
+    블록(block_size 정도) 하나를 memoryview로 만들어 목록 안에서 여러 번 참조합니다.
+    그래서 n이 아무리 커도 새로 만드는 버퍼는 블록 하나와 마지막 조각뿐이며,
+    목록 하나에는 최대 max_buffers개의 버퍼가 들어갑니다 (sendmsg() 한 번의 IOV 제한).
+    모든 목록의 버퍼를 이어 붙이면 iter_frame_chunks()의 결과와 바이트 단위로 같습니다.
+    
+    Args:
+        message (dict): 보낼 응답
+        block_size (int): 반복해서 참조할 블록의 대략적인 크기 (바이트)
+        max_buffers (int): 목록 하나에 넣을 최대 버퍼 수 (기본값: IOV_MAX)
+    
+    Yields:
+        list: bytes 또는 memoryview 버퍼 목록
+    """
+    echoes = message.get('echoes')
+    if not isinstance(echoes, RepeatedEchoes):
+        yield [encode_frame(message)]
+        return
+    
+    head, item, tail = _split_echoes(message)
+    n = echoes.n
+    if n == 0:
+        yield [head + tail]
+        return
+    
+    # 마지막 원소를 뺀 n - 1개를 블록 단위로 보냄 (블록은 응답보다 크게 만들지 않음)
+    element = item + b', '
+    per_block = max(1, min(block_size // len(element), n - 1))
+    blocks, remaining = divmod(n - 1, per_block)
+    block = memoryview(element * per_block) if blocks else None
+    
+    buffers = [head]
+    for _ in range(blocks):
+        if len(buffers) == max_buffers:
+            yield buffers
+            buffers = []
+        buffers.append(block)
+    if len(buffers) == max_buffers:
+        yield buffers
+        buffers = []
+    buffers.append(element * remaining + item + tail)
+    yield buffers
+
+
+def parse_address(address, default_port=5000):
+    """
+    서버 주소 문자열을 소켓 주소 체계와 주소로 변환하는 함수
+    
+    'unix:'로 시작하거나 '/'를 포함하는 주소는 유닉스 도메인 소켓 경로로,
+    나머지는 TCP 'host' 또는 'host:port'로 해석합니다 (IPv6는 '[::1]:5000').
+    
+    Args:
+        address (str): 서버 주소 (예: 'localhost', '127.0.0.1:5000', 'tcp://host:5000',
+                       'unix:/tmp/necho.sock', '/tmp/necho.sock')
+        default_port (int): 주소에 포트가 없을 때 사용할 포트 번호 (기본값: 5000)
+    
+    Returns:
+        tuple: (socket.AF_INET 또는 socket.AF_UNIX, (host, port) 또는 경로)
+    
+    Raises:
+        ValueError: 포트가 숫자가 아니거나, 유닉스 도메인 소켓을 지원하지 않는 플랫폼인 경우
+    """
+    if address.startswith(UNIX_SCHEME) or ('/' in address and not address.startswith(TCP_SCHEME)):
+        path = address[len(UNIX_SCHEME):] if address.startswith(UNIX_SCHEME) else address
+        # unix:///tmp/x.sock 형식은 앞의 '//'를 제거
+        if path.startswith('///'):
+            path = path[2:]
+        if not path:
+            raise ValueError(f"유닉스 도메인 소켓 경로가 없습니다: {address}")
+        if not hasattr(socket, 'AF_UNIX'):
+            raise ValueError("이 플랫폼은 유닉스 도메인 소켓을 지원하지 않습니다.")
+        return socket.AF_UNIX, path
+    
+    if address.startswith(TCP_SCHEME):
+        address = address[len(TCP_SCHEME):]
+    host, port = address, default_port
+    if address.startswith('['):
+        # IPv6 주소: [::1] 또는 [::1]:5000
+        host, _, rest = address[1:].partition(']')
+        if rest.startswith(':'):
+            port = rest[1:]
+    elif address.count(':') == 1:
+        host, port = address.split(':')
+    try:
+        port = int(port)
+    except ValueError:
+        raise ValueError(f"포트 번호가 올바르지 않습니다: {address}") from None
+    return socket.AF_INET6 if ':' in host else socket.AF_INET, (host or 'localhost', port)
+
+
+def format_address(family, address):
+    """
+    parse_address()의 결과를 화면에 표시할 문자열로 바꾸는 함수
+    
+    Returns:
+        str: 'unix:/경로' 또는 'host:port'
+    """
+    if family == getattr(socket, 'AF_UNIX', None):
+        return f"{UNIX_SCHEME}{address}"
+    host, port = address[:2]
+    return f"[{host}]:{port}" if ':' in host else f"{host}:{port}"
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+N-Echo 연결 시간 제한 모듈 (Python)
+요청 없이 붙어 있는 연결과 느린 클라이언트(slowloris)를 해시 타이머 휠 하나로 정리하는 모듈
+
+연결마다 타이머(스레드, settimeout, call_later)를 두지 않고, 모든 연결의 마감 시각을
+고정 크기 슬롯 배열(타이머 휠)에 넣어 두었다가 일정 간격(tick)마다 현재 슬롯만 확인합니다.
+
+- 휠: 마감 tick 번호를 슬롯 수로 나눈 나머지 슬롯에 저장 (해시 타이머 휠)
+  휠 한 바퀴보다 먼 마감은 같은 슬롯에 두고 tick 번호를 비교해 다음 바퀴까지 남겨 둠
+- tick마다 비용: 현재 슬롯에 든 항목만 확인하므로 전체 연결 수와 관계없음
+- 게으른 갱신: 연결이 요청을 받거나 응답을 보낼 때는 연결 객체의 마감 시각만 바꾸고 휠은 건드리지 않음.
+  휠에서 꺼냈을 때 실제 마감이 아직 남았으면 그 시각으로 다시 넣음 (연결당 마감 주기마다 한 번)
+- 단계: 연결은 항상 세 단계 중 하나이고 단계마다 제한 시간이 다름
+    idle  : 요청을 기다리는 중 (마지막 응답 또는 연결 이후)
+    read  : 요청의 첫 바이트가 도착했지만 아직 프레임이 완성되지 않음 (조금씩 보내도 늘어나지 않음)
+    write : 응답 조각 하나를 보내는 중 (클라이언트가 읽지 않아 송신이 막힘)
+
+사용 예:
+    reaper = ConnectionReaper(idle_timeout=60, read_timeout=10)
+    watch = reaper.watch(lambda: sock.shutdown(socket.SHUT_RDWR))
+    watch.enter(PHASE_READ)
+    ...
+    reaper.unwatch(watch)
+    reaped = reaper.expire()  # 주기적으로 호출 (시간이 지난 연결의 abort를 호출하고 단계 목록 반환)
+"""
+
+# math: 마감 시각을 tick 번호로 올림하기 위한 라이브러리
+import math
+# threading: 여러 스레드가 휠을 안전하게 함께 쓰기 위한 잠금
+import threading
+# time: 마감 시각 계산을 위한 단조 시계
+import time
+
+# 휠이 한 칸씩 넘어가는 간격 (초) - 연결은 마감 후 최대 이 시간 안에 정리됨
+DEFAULT_TICK = 0.25
+# 휠의 슬롯 수 (한 바퀴 = DEFAULT_TICK * DEFAULT_SLOTS = 128초)
+DEFAULT_SLOTS = 512
+
+# 연결 단계 (timeouts 튜플과 TIMEOUT_REASONS의 인덱스)
+PHASE_IDLE, PHASE_READ, PHASE_WRITE = range(3)
+# 단계 이름 (로그와 카운터 이름에 사용)
+TIMEOUT_REASONS = ('idle', 'read', 'write')
+
+
+class TimerWheel:
+    """
+    해시 타이머 휠 클래스
+    
+    키마다 마감 시각 하나를 저장하고, advance()로 시간이 지난 키를 꺼냅니다.
+    추가/취소는 O(1)이고, advance()는 지나간 tick의 슬롯만 확인합니다.
+    스레드 안전하지 않으므로 여러 스레드에서 쓸 때는 호출하는 쪽이 잠금을 잡아야 합니다.
+    """
+    
+    def __init__(self, tick=DEFAULT_TICK, slots=DEFAULT_SLOTS, now=None):
+        """
+        휠 초기화 메서드
+        
+        Args:
+            tick (float): 슬롯 하나가 차지하는 시간 (초, 기본값: 0.25)
+            slots (int): 슬롯 수 (기본값: 512)
+            now (float): 시작 시각 (기본값: None - time.monotonic())
+        
+        Raises:
+            ValueError: tick이나 slots가 양수가 아닌 경우
+        """
+        if tick <= 0 or slots <= 0:
+            raise ValueError("tick과 슬롯 수는 양수여야 합니다.")
+        self.tick = tick
+        self._slots = [{} for _ in range(slots)]  # 슬롯마다 키 -> 마감 tick 번호
+        self._where = {}  # 키 -> 들어 있는 슬롯 번호 (취소를 O(1)로 하기 위함)
+        # 다음에 확인할 tick 번호
+        self._current = int((time.monotonic() if now is None else now) / tick)
+    
+    def __len__(self):
+        """
+        휠에 들어 있는 키 수
+        """
+        return len(self._where)
+    
+    def schedule(self, key, when):
+        """
+        키의 마감 시각을 정하는 메서드 (이미 있으면 옮김)
+        
+        Args:
+            key: 해시할 수 있는 객체
+            when (float): 마감 시각 (time.monotonic() 기준 초)
+        """
+        self.cancel(key)
+        # 마감 시각이 지난 뒤의 첫 tick에 꺼냄 (이미 지났으면 다음 확인 때)
+        expires = max(math.ceil(when / self.tick), self._current)
+        index = expires % len(self._slots)
+        self._slots[index][key] = expires
+        self._where[key] = index
+    
+    def cancel(self, key):
+        """
+        키를 휠에서 제거하는 메서드 (없으면 무시)
+        
+        Args:
+            key: schedule()에 넘긴 키
+        """
+        index = self._where.pop(key, None)
+        if index is not None:
+            del self._slots[index][key]
+    
+    def advance(self, now=None):
+        """
+        현재 시각까지 지나간 tick의 슬롯을 확인하고 마감된 키를 꺼내는 메서드
+        
+        슬롯에는 휠 한 바퀴 뒤의 키도 들어 있으므로 tick 번호가 지난 키만 꺼냅니다.
+        오래 호출하지 않아 한 바퀴 이상 지났으면 모든 슬롯을 한 번씩만 확인합니다.
+        
+        Args:
+            now (float): 현재 시각 (기본값: None - time.monotonic())
+        
+        Returns:
+            list: 마감된 키 목록 (휠에서 제거됨)
+        """
+        target = int((time.monotonic() if now is None else now) / self.tick)
+        if target < self._current:
+            return []
+        slots, where = self._slots, self._where
+        expired = []
+        for current in range(self._current, min(target + 1, self._current + len(slots))):
+            slot = slots[current % len(slots)]
+            if not slot:
+                continue
+            due = [key for key, expires in slot.items() if expires <= target]
+            for key in due:
+                del slot[key]
+                del where[key]
+            expired += due
+        self._current = target + 1
+        return expired
+
+
+class ConnectionWatch:
+    """
+    연결 하나의 현재 단계와 마감 시각 (메모리를 줄이기 위해 __slots__ 사용)
+    
+    연결을 처리하는 쪽이 enter()로 단계를 바꾸며, 휠은 건드리지 않으므로 잠금 없이 호출합니다.
+    """
+    __slots__ = ('phase', 'deadline', 'abort', 'timeouts')
+    
+    def __init__(self, abort, timeouts):
+        self.phase = PHASE_IDLE  # 현재 단계
+        self.deadline = math.inf  # 현재 단계의 마감 시각
+        self.abort = abort  # 시간이 지났을 때 호출할 함수 (연결을 끊어 처리 중인 recv/send를 깨움)
+        self.timeouts = timeouts  # 단계별 제한 시간 (ConnectionReaper와 공유)
+    
+    def enter(self, phase):
+        """
+        단계를 바꾸고 그 단계의 제한 시간으로 마감 시각을 다시 정하는 메서드
+        
+        Args:
+            phase (int): PHASE_IDLE, PHASE_READ, PHASE_WRITE 중 하나
+        """
+        self.phase = phase
+        self.deadline = time.monotonic() + self.timeouts[phase]
+
+
+class ConnectionReaper:
+    """
+    단계별 제한 시간이 지난 연결을 찾아 끊는 클래스 (타이머 휠 하나로 모든 연결을 관리)
+    
+    제한 시간을 None으로 준 단계는 검사하지 않습니다. 정리한 연결 수는 사용하는 쪽(서버의 카운터 배열)이
+    기록하도록 expire()는 정리한 연결의 단계 목록만 돌려줍니다.
+    """
+    
+    def __init__(self, idle_timeout=None, read_timeout=None, write_timeout=None,
+                 tick=DEFAULT_TICK, slots=DEFAULT_SLOTS):
+        """
+        정리기 초기화 메서드
+        
+        Args:
+            idle_timeout (float): 요청 없이 기다리는 최대 시간 (초, 기본값: None - 제한 없음)
+            read_timeout (float): 요청 하나를 다 받을 때까지의 최대 시간 (초, 기본값: None - 제한 없음)
+            write_timeout (float): 응답 조각 하나를 보내는 최대 시간 (초, 기본값: None - 제한 없음)
+            tick (float): 휠이 한 칸씩 넘어가는 간격 (초, 기본값: 0.25)
+            slots (int): 휠의 슬롯 수 (기본값: 512)
+        
+        Raises:
+            ValueError: 제한 시간이 양수가 아니거나 모두 None인 경우
+        """
+        timeouts = (idle_timeout, read_timeout, write_timeout)
+        if all(value is None for value in timeouts):
+            raise ValueError("제한 시간을 하나 이상 지정해야 합니다.")
+        if any(value is not None and value <= 0 for value in timeouts):
+            raise ValueError("제한 시간은 양수여야 합니다.")
+        self.timeouts = tuple(math.inf if value is None else value for value in timeouts)
+        # 휠에 다시 넣을 때의 최대 간격 - 제한 없는 단계에 있던 연결이 다른 단계로 바뀌어도
+        # 가장 짧은 제한 시간 안에는 다시 확인됨
+        self.recheck = min(value for value in timeouts if value is not None)
+        self.tick = tick
+        self._wheel = TimerWheel(tick, slots)
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        """
+        확인 중인 연결 수
+        """
+        return len(self._wheel)
+    
+    def watch(self, abort):
+        """
+        새 연결을 idle 단계로 등록하는 메서드
+        
+        Args:
+            abort: 시간이 지났을 때 인자 없이 호출할 함수 (OSError는 무시함)
+        
+        Returns:
+            ConnectionWatch: 연결을 처리하는 쪽이 단계를 바꿀 때 쓰는 객체
+        """
+        watch = ConnectionWatch(abort, self.timeouts)
+        watch.enter(PHASE_IDLE)
+        with self._lock:
+            self._wheel.schedule(watch, min(watch.deadline, time.monotonic() + self.recheck))
+        return watch
+    
+    def unwatch(self, watch):
+        """
+        끝난 연결을 휠에서 제거하는 메서드 (연결을 닫기 전에 호출하여 닫힌 연결의 abort가 불리지 않게 함)
+        
+        Args:
+            watch (ConnectionWatch): watch()가 돌려준 객체
+        """
+        with self._lock:
+            self._wheel.cancel(watch)
+    
+    def expire(self, now=None):
+        """
+        마감된 연결의 abort를 호출하고, 아직 마감 전인 연결은 실제 마감 시각으로 다시 넣는 메서드
+        
+        Args:
+            now (float): 현재 시각 (기본값: None - time.monotonic())
+        
+        Returns:
+            list: 끊은 연결의 단계 목록 (PHASE_IDLE, PHASE_READ, PHASE_WRITE)
+        """
+        if now is None:
+            now = time.monotonic()
+        reaped = []
+        with self._lock:
+            wheel = self._wheel
+            for watch in wheel.advance(now):
+                deadline = watch.deadline
+                if deadline > now:
+                    # 마지막 확인 이후 요청을 받거나 응답을 보낸 연결 - 새 마감 시각으로 다시 넣음
+                    wheel.schedule(watch, min(deadline, now + self.recheck))
+                    continue
+                reaped.append(watch.phase)
+                try:
+                    watch.abort()
+                except OSError:
+                    # 이미 닫히는 중인 연결
+                    pass
+        return reaped
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+소켓 튜닝 모듈 (Python)
+N-Echo 서버(python_server.py)와 통합 서버(multi_server.py)가 함께 쓰는 서버 소켓 옵션 프로필
+
+서버들은 listen(5) 같은 고정 백로그 외에는 소켓 옵션을 바꾸지 않으므로,
+연결이 한꺼번에 몰리면 작은 대기열이 넘쳐 SYN이 버려지고 클라이언트는 1초 뒤에야 다시 연결을 시도합니다.
+이 모듈은 백로그와 TCP 옵션을 프로필(프리셋, JSON 파일, 'key=value' 목록, 명령줄 옵션) 하나로 모아
+두 서버에 같은 방식으로 적용합니다.
+
+- 적용 위치: 서버 소켓(bind 후 listen 전)에 한 번만 설정합니다. 수락한 연결 소켓은 서버 소켓의 옵션을
+  물려받으므로(Linux, Windows, macOS) 연결마다 setsockopt()를 다시 호출하지 않습니다.
+  예외: asyncio는 모든 TCP 연결에 TCP_NODELAY를 켜므로 nodelay=off는 tune_connection()으로 연결마다 끔
+- 지원하지 않는 옵션: 플랫폼에 없는 옵션(TCP_DEFER_ACCEPT는 Linux 전용 등)은 건너뛰고 이름을 돌려줌
+- 서버가 먼저 말하는 프로토콜(Time, Number): 클라이언트는 데이터를 보내지 않고 기다리므로
+  TCP_DEFER_ACCEPT를 켜면 연결이 제한 시간 동안 수락되지 않음 - server_first=True로 건너뜀
+- 값이 None인 항목은 건드리지 않음 (운영체제 기본값, 서버의 기존 백로그) - load_tuning()은 바꿀 항목만 돌려줌
+
+사용 예:
+    tuning = load_tuning('latency', {'sndbuf': 262144})
+    sock.bind(('0.0.0.0', 5000))
+    unsupported = tune_listen_socket(sock, tuning)
+    sock.listen(tuning.get('backlog') or 5)
+"""
+
+# socket: 소켓 옵션 상수(TCP_NODELAY 등)와 setsockopt()
+import socket
+# json: 튜닝 프로필 파일(JSON) 읽기
+import json
+# argparse: 서버들이 함께 쓰는 명령줄 옵션 정의
+import argparse
+
+# 튜닝 항목 기본값 (None이면 바꾸지 않음)
+DEFAULT_TUNING = {
+    'backlog': None,       # listen() 대기열 크기 (None이면 각 서버의 기존 값)
+    'nodelay': None,       # TCP_NODELAY - 작은 응답을 Nagle 알고리즘으로 모으지 않고 바로 전송
+    'sndbuf': None,        # SO_SNDBUF - 송신 버퍼 크기 (바이트)
+    'rcvbuf': None,        # SO_RCVBUF - 수신 버퍼 크기 (바이트, 윈도 스케일을 정하므로 listen 전에 설정)
+    'defer_accept': None,  # TCP_DEFER_ACCEPT - 첫 데이터가 올 때까지 accept()를 미루는 최대 시간 (초, Linux)
+    'fastopen': None,      # TCP_FASTOPEN - SYN에 실린 첫 요청을 받는 대기열 크기 (Linux)
+    'keepalive': None,     # SO_KEEPALIVE - 응답 없는 상대를 찾아 연결을 정리
+    'keepidle': None,      # TCP_KEEPIDLE - 첫 keepalive 탐침까지의 유휴 시간 (초)
+    'keepintvl': None,     # TCP_KEEPINTVL - 탐침 간격 (초)
+    'keepcnt': None,       # TCP_KEEPCNT - 연결을 끊기 전까지 응답 없는 탐침 수
+}
+
+# 참/거짓 값을 받는 항목 (나머지는 정수)
+BOOLEAN_OPTIONS = ('nodelay', 'keepalive')
+
+# 서버가 먼저 응답을 보내는 서비스에는 설정하지 않는 항목
+CLIENT_FIRST_OPTIONS = ('defer_accept',)
+
+# keepalive를 켰을 때만 의미가 있는 세부 항목
+KEEPALIVE_OPTIONS = ('keepidle', 'keepintvl', 'keepcnt')
+
+# 항목 -> (setsockopt 수준, socket 모듈의 옵션 상수 이름 후보) - 앞의 이름부터 찾아 사용
+SOCKET_OPTIONS = {
+    'nodelay': (socket.IPPROTO_TCP, ('TCP_NODELAY',)),
+    'sndbuf': (socket.SOL_SOCKET, ('SO_SNDBUF',)),
+    'rcvbuf': (socket.SOL_SOCKET, ('SO_RCVBUF',)),
+    'defer_accept': (socket.IPPROTO_TCP, ('TCP_DEFER_ACCEPT',)),
+    'fastopen': (socket.IPPROTO_TCP, ('TCP_FASTOPEN',)),
+    'keepalive': (socket.SOL_SOCKET, ('SO_KEEPALIVE',)),
+    # macOS는 TCP_KEEPIDLE 대신 TCP_KEEPALIVE라는 이름을 사용
+    'keepidle': (socket.IPPROTO_TCP, ('TCP_KEEPIDLE', 'TCP_KEEPALIVE')),
+    'keepintvl': (socket.IPPROTO_TCP, ('TCP_KEEPINTVL',)),
+    'keepcnt': (socket.IPPROTO_TCP, ('TCP_KEEPCNT',)),
+}
+
+# 이름으로 고를 수 있는 프로필
+TUNING_PRESETS = {
+    # 서버의 기존 동작 그대로 (아무것도 바꾸지 않음)
+    'default': {},
+    # 짧은 요청/응답: 큰 대기열, Nagle 끔, 다시 연결하는 클라이언트의 핸드셰이크 왕복 생략
+    'latency': {'backlog': 1024, 'nodelay': True, 'fastopen': 256},
+    # 큰 응답: 큰 대기열, 큰 송수신 버퍼 (송신 버퍼가 커지면 sendall()이 깨어나는 횟수가 줄어듦)
+    'throughput': {'backlog': 1024, 'nodelay': True, 'sndbuf': 4 * 1024 * 1024, 'rcvbuf': 1024 * 1024},
+    # 연결 폭주: 아주 큰 대기열, 데이터가 온 연결만 수락, 끊긴 클라이언트 정리
+    'burst': {'backlog': 4096, 'defer_accept': 5, 'keepalive': True, 'keepidle': 60,
+              'keepintvl': 10, 'keepcnt': 3},
+}
+
+# 정수 값에 붙일 수 있는 단위 (예: 256k, 4m)
+SIZE_SUFFIXES = {'k': 1024, 'm': 1024 * 1024}
+
+# 참/거짓으로 읽는 문자열
+TRUE_WORDS = ('1', 'on', 'true', 'yes')
+FALSE_WORDS = ('0', 'off', 'false', 'no')
+
+
+def parse_option(key, value):
+    """
+    튜닝 항목 값 하나를 검사하고 bool 또는 int로 변환하는 함수
+    
+    Args:
+        key (str): 튜닝 항목 이름 (DEFAULT_TUNING의 키)
+        value: 값 (명령줄/'key=value' 목록의 문자열 또는 JSON의 bool/int, None이면 그대로)
+    
+    Returns:
+        bool 또는 int: 변환한 값 (value가 None이면 None)
+    
+    Raises:
+        ValueError: 알 수 없는 항목이거나 값이 올바르지 않은 경우
+    """
+    if key not in DEFAULT_TUNING:
+        raise ValueError(f"알 수 없는 튜닝 항목입니다: {key} (가능: {', '.join(DEFAULT_TUNING)})")
+    if value is None:
+        return None
+    if key in BOOLEAN_OPTIONS:
+        if isinstance(value, bool):
+            return value
+        text = str(value).strip().lower()
+        if text in TRUE_WORDS:
+            return True
+        if text in FALSE_WORDS:
+            return False
+        raise ValueError(f"{key} 값은 on 또는 off여야 합니다: {value}")
+    if isinstance(value, bool):
+        raise ValueError(f"{key} 값은 정수여야 합니다: {value}")
+    if isinstance(value, str):
+        text = value.strip().lower()
+        scale = SIZE_SUFFIXES.get(text[-1:], 1)
+        if scale != 1:
+            text = text[:-1]
+        try:
+            value = int(text) * scale
+        except ValueError:
+            raise ValueError(f"{key} 값은 정수여야 합니다: {value}") from None
+    if not isinstance(value, int) or value < 0 or (key == 'backlog' and value == 0):
+        raise ValueError(f"{key} 값은 {'양' if key == 'backlog' else '0 이상의 '}정수여야 합니다: {value}")
+    return value
+
+
+def parse_tuning_spec(spec):
+    """
+    'backlog=1024,nodelay=on' 형식의 문자열을 튜닝 항목 딕셔너리로 변환하는 함수
+    
+    Args:
+        spec (str): 쉼표로 구분한 key=value 목록
+    
+    Returns:
+        dict: 항목 이름 -> 값 (parse_option()으로 변환)
+    
+    Raises:
+        ValueError: 형식이나 값이 올바르지 않은 경우
+    """
+    options = {}
+    for item in spec.split(','):
+        if not item.strip():
+            continue
+        key, sep, value = item.partition('=')
+        if not sep:
+            raise ValueError(f"튜닝 항목 형식이 올바르지 않습니다: {item} (예: backlog=1024)")
+        key = key.strip().replace('-', '_')
+        options[key] = parse_option(key, value)
+    return options
+
+
+def load_tuning(profile=None, overrides=None):
+    """
+    기본값에 프로필과 개별 항목을 차례로 덮어써서 최종 튜닝 설정을 만드는 함수
+    
+    Args:
+        profile: 다음 중 하나 (기본값: None - 프로필 없음)
+                 - TUNING_PRESETS의 이름 (예: 'latency')
+                 - 'key=value,...' 형식의 문자열 (예: 'backlog=1024,nodelay=on')
+                 - JSON 파일 경로 (키는 DEFAULT_TUNING과 같음, "preset" 키로 프리셋을 먼저 적용 가능)
+                 - 항목 딕셔너리
+        overrides (dict): 프로필 위에 덮어쓸 항목 (값이 None인 항목은 무시, 보통 명령줄 옵션)
+    
+    Returns:
+        dict: 바꿀 항목 -> 값 (값이 None인 항목은 빠짐, 아무것도 바꾸지 않으면 빈 딕셔너리)
+              keepidle/keepintvl/keepcnt만 주고 keepalive를 정하지 않았으면 keepalive를 켬
+    
+    Raises:
+        ValueError: 알 수 없는 프리셋/항목이거나 값이 올바르지 않은 경우, 프로필 파일이 JSON 객체가 아닌 경우
+        OSError: 프로필 파일을 읽을 수 없는 경우
+    """
+    options = {}
+    if isinstance(profile, dict):
+        options = dict(profile)
+    elif profile in TUNING_PRESETS:
+        options = dict(TUNING_PRESETS[profile])
+    elif profile and '=' in profile:
+        options = parse_tuning_spec(profile)
+    elif profile:
+        if not profile.endswith('.json'):
+            raise ValueError(f"알 수 없는 튜닝 프로필입니다: {profile} "
+                             f"(가능: {', '.join(TUNING_PRESETS)}, JSON 파일 또는 key=value 목록)")
+        with open(profile, encoding='utf-8') as f:
+            options = json.load(f)
+        if not isinstance(options, dict):
+            raise ValueError(f"튜닝 프로필 파일의 최상위 값은 JSON 객체여야 합니다: {profile}")
+
+    preset = options.pop('preset', None)
+    if preset is not None:
+        if preset not in TUNING_PRESETS:
+            raise ValueError(f"알 수 없는 프리셋입니다: {preset} (가능: {', '.join(TUNING_PRESETS)})")
+        options = {**TUNING_PRESETS[preset], **options}
+
+    tuning = dict(DEFAULT_TUNING)
+    for key, value in options.items():
+        tuning[key] = parse_option(key, value)
+    for key, value in (overrides or {}).items():
+        if value is not None:
+            tuning[key] = parse_option(key, value)
+    if tuning['keepalive'] is None and any(tuning[key] is not None for key in KEEPALIVE_OPTIONS):
+        tuning['keepalive'] = True
+    return {key: value for key, value in tuning.items() if value is not None}
+
+
+def describe_tuning(tuning, unsupported=(), server_first=False):
+    """
+    시작 로그에 출력할 튜닝 설정 요약 문자열을 만드는 함수
+    
+    Args:
+        tuning (dict): load_tuning()의 결과 (None 가능)
+        unsupported (list): tune_listen_socket()이 설정하지 못한 항목 (기본값: 없음)
+        server_first (bool): tune_listen_socket()과 같은 값 - True이면 적용하지 않은 defer_accept를 뺌
+    
+    Returns:
+        str: 'backlog=1024, nodelay=on' 형식 (바꾼 항목이 없으면 '기본값')
+             설정하지 못한 항목이 있으면 '(지원 안 함: defer_accept)'를 덧붙임
+    """
+    items = []
+    for key, value in (tuning or {}).items():
+        if value is None or (server_first and key in CLIENT_FIRST_OPTIONS):
+            continue
+        items.append(f"{key}={'on' if value is True else 'off' if value is False else value}")
+    text = ", ".join(items) or "기본값"
+    if unsupported:
+        text += f" (지원 안 함: {', '.join(unsupported)})"
+    return text
+
+
+def _socket_option(names):
+    """
+    socket 모듈에서 옵션 상수를 찾는 함수 (플랫폼에 없으면 None)
+    """
+    for name in names:
+        value = getattr(socket, name, None)
+        if value is not None:
+            return value
+    return None
+
+
+def tune_listen_socket(sock, tuning, server_first=False):
+    """
+    서버 소켓에 튜닝 옵션을 설정하는 함수 (bind 후 listen 전에 호출, 백로그는 호출하는 쪽이 listen에 사용)
+    
+    수락한 연결 소켓은 이 옵션을 물려받습니다. keepidle/keepintvl/keepcnt는 keepalive를 켰을 때만 설정합니다.
+    
+    Args:
+        sock (socket.socket): TCP 서버 소켓
+        tuning (dict): load_tuning()의 결과 (None이면 아무것도 하지 않음)
+        server_first (bool): 연결하자마자 서버가 먼저 보내는 프로토콜인지 (기본값: False)
+                             True이면 첫 데이터를 기다리는 defer_accept를 설정하지 않음
+    
+    Returns:
+        list: 플랫폼이 지원하지 않아 설정하지 못한 항목 이름
+    """
+    unsupported = []
+    if not tuning:
+        return unsupported
+    for key, (level, names) in SOCKET_OPTIONS.items():
+        value = tuning.get(key)
+        if value is None or (key in KEEPALIVE_OPTIONS and not tuning.get('keepalive')):
+            continue
+        if server_first and key in CLIENT_FIRST_OPTIONS:
+            continue
+        option = _socket_option(names)
+        if option is None:
+            unsupported.append(key)
+            continue
+        try:
+            sock.setsockopt(level, option, int(value))
+        except OSError:
+            unsupported.append(key)
+    return unsupported
+
+
+def tune_connection(sock, tuning):
+    """
+    asyncio가 수락한 연결 소켓에 서버 소켓에서 물려받지 못하는 옵션을 다시 설정하는 함수
+    
+    asyncio는 모든 TCP 연결에 TCP_NODELAY를 켜므로, nodelay=off일 때만 연결마다 끕니다.
+    
+    Args:
+        sock: 연결 소켓 (StreamWriter/Transport의 'socket' 정보, None이면 무시)
+        tuning (dict): load_tuning()의 결과
+    """
+    if sock is None or not tuning or tuning.get('nodelay') is not False:
+        return
+    if sock.family in (socket.AF_INET, socket.AF_INET6):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 0)
+
+
+def add_tuning_arguments(parser, exclude=()):
+    """
+    서버 명령줄에 튜닝 옵션(--tuning과 항목별 옵션)을 추가하는 함수
+    
+    Args:
+        parser (argparse.ArgumentParser): 옵션을 추가할 파서
+        exclude (tuple): 서버가 이미 같은 이름의 옵션을 가지고 있어 추가하지 않을 항목 (예: ('backlog',))
+    """
+    group = parser.add_argument_group('소켓 튜닝')
+    group.add_argument('--tuning', default=None, metavar='PROFILE',
+                       help=f"튜닝 프로필 - 프리셋({', '.join(TUNING_PRESETS)}), JSON 파일, "
+                            "또는 'backlog=1024,nodelay=on' 형식 (아래 옵션이 프로필보다 우선)")
+    arguments = {
+        'backlog': dict(type=int, metavar='N', help='연결 대기열 크기 (기본값: 서버마다 다름)'),
+        'nodelay': dict(action=argparse.BooleanOptionalAction,
+                        help='TCP_NODELAY - 작은 응답을 모으지 않고 바로 전송'),
+        'sndbuf': dict(metavar='BYTES', help='SO_SNDBUF 송신 버퍼 크기 (예: 262144, 4m)'),
+        'rcvbuf': dict(metavar='BYTES', help='SO_RCVBUF 수신 버퍼 크기 (예: 262144, 1m)'),
+        'defer_accept': dict(type=int, metavar='SEC',
+                             help='TCP_DEFER_ACCEPT - 첫 데이터가 올 때까지 accept를 미루는 시간 (Linux)'),
+        'fastopen': dict(type=int, metavar='QLEN', help='TCP_FASTOPEN 대기열 크기 (Linux)'),
+        'keepalive': dict(action=argparse.BooleanOptionalAction, help='SO_KEEPALIVE - 끊긴 상대 연결 정리'),
+        'keepidle': dict(type=int, metavar='SEC', help='첫 keepalive 탐침까지의 유휴 시간'),
+        'keepintvl': dict(type=int, metavar='SEC', help='keepalive 탐침 간격'),
+        'keepcnt': dict(type=int, metavar='N', help='연결을 끊기 전까지 응답 없는 탐침 수'),
+    }
+    for key, options in arguments.items():
+        if key not in exclude:
+            group.add_argument('--' + key.replace('_', '-'), default=None, **options)
+
+
+def tuning_from_args(args, profile=None):
+    """
+    add_tuning_arguments()로 추가한 명령줄 옵션에서 튜닝 설정을 만드는 함수
+    
+    Args:
+        args (argparse.Namespace): 파싱한 명령줄 인자
+        profile: --tuning 대신 사용할 프로필 (기본값: None - args.tuning)
+    
+    Returns:
+        dict: load_tuning()의 결과
+    
+    Raises:
+        ValueError: 프로필이나 값이 올바르지 않은 경우
+        OSError: 프로필 파일을 읽을 수 없는 경우
+    """
+    overrides = {key: getattr(args, key, None) for key in DEFAULT_TUNING}
+    return load_tuning(profile if profile is not None else args.tuning, overrides)
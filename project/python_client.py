@@ -5,14 +5,31 @@ N-Echo TCP/IP 클라이언트 (Python)
 
 이 프로그램은 N-Echo 서버에 연결하여 메시지를 전송하고,
 서버로부터 해당 메시지를 n번 반복한 응답을 받는 클라이언트입니다.
+
+서버 주소에 'unix:/tmp/necho.sock'처럼 경로를 주면 유닉스 도메인 소켓으로 연결합니다.
+    python3 python_client.py unix:/tmp/necho.sock
+
+--binary 옵션을 주면 연결 직후 바이너리 프로토콜을 협상합니다 (서버가 지원하지 않으면 JSON 사용).
+    python3 python_client.py localhost 5000 --binary
+
+다른 프로그램에서 여러 스레드가 N-Echo 서버를 호출할 때는 출력 없이 연결을 재사용하는
+necho_pool.NEchoPool을, asyncio 애플리케이션에서는 necho_async.AsyncNEchoClient를 사용하세요.
 """
 
 # socket: 네트워크 통신을 위한 소켓 라이브러리
 import socket
-# json: JSON 형식의 데이터를 다루기 위한 라이브러리
-import json
-# sys: 명령줄 인자 처리를 위한 시스템 라이브러리
-import sys
+# argparse: 명령줄 인자(서버 주소, 포트, --binary) 처리를 위한 라이브러리
+import argparse
+# collections.deque: 먼저 도착한 응답 프레임을 순서대로 보관하기 위한 큐
+from collections import deque
+# necho_protocol: 요청/응답 프레이밍 (줄바꿈으로 구분된 JSON 또는 바이너리 프레임)
+from necho_protocol import (FrameBuffer, encode_frame, decode_frame, expand_echoes,
+                            BinaryFrameBuffer, encode_binary_frame, decode_binary_response,
+                            parse_address, format_address, RECV_SIZE, ENCODING_REPEAT,
+                            BINARY_HELLO)
+
+# 지원하는 전송 프로토콜
+PROTOCOLS = ('json', 'binary')
 
 
 class NEchoClient:
@@ -23,7 +40,7 @@ class NEchoClient:
     서버에 연결하고, 요청을 전송하며, 응답을 받아 화면에 표시합니다.
     """
     
-    def __init__(self, host='localhost', port=5000):
+    def __init__(self, host='localhost', port=5000, window=16, compact=True, protocol='json'):
         """
         클라이언트 초기화 메서드
         
@@ -31,32 +48,59 @@ class NEchoClient:
         
         Args:
             host (str): 서버의 IP 주소 또는 호스트명 (기본값: 'localhost')
+                        'unix:/경로' 또는 '/경로'를 주면 유닉스 도메인 소켓으로 연결하고,
+                        'host:port'처럼 포트를 함께 주면 port 인자보다 우선합니다.
             port (int): 서버가 열어놓은 포트 번호 (기본값: 5000)
+            window (int): send_many()에서 응답을 기다리지 않고 보낼 최대 요청 수 (기본값: 16)
+            compact (bool): "repeat" 압축 응답을 요청할지 여부 (기본값: True)
+                            압축 응답의 echoes는 필요할 때만 값을 만드는 지연 시퀀스입니다.
+            protocol (str): 'json' 또는 'binary' (기본값: 'json')
+                            'binary'면 연결할 때 바이너리 프로토콜을 협상하고,
+                            서버가 지원하지 않으면 JSON으로 통신합니다.
         """
+        if protocol not in PROTOCOLS:
+            raise ValueError(f"지원하지 않는 프로토콜입니다: {protocol}")
         self.host = host  # 연결할 서버의 주소를 저장
         self.port = port  # 연결할 서버의 포트 번호를 저장
+        # 주소 문자열을 소켓 주소 체계(AF_INET/AF_UNIX)와 connect()에 넘길 주소로 변환
+        self.family, self.address = parse_address(host, port)
+        self.window = window  # 파이프라이닝 윈도 크기를 저장
+        self.compact = compact  # 압축 응답 요청 여부를 저장
+        self.protocol = protocol  # 요청한 전송 프로토콜을 저장
+        self.binary = False  # 현재 연결이 바이너리 프로토콜을 사용하는지 여부 (협상 후 결정)
         self.client_socket = None  # 서버와의 연결에 사용할 소켓 객체 (아직 연결 전)
+        self._buffer = FrameBuffer()  # 응답 조각을 모으는 증분 수신 버퍼
+        self._frames = deque()  # 수신했지만 아직 꺼내지 않은 응답 프레임
         
     def connect(self):
         """
         서버에 연결하는 메서드
         
-        TCP 소켓을 생성하고 서버에 연결을 시도합니다.
+        TCP 소켓(또는 유닉스 도메인 소켓)을 생성하고 서버에 연결을 시도합니다.
         
         Returns:
             bool: 연결 성공 시 True, 실패 시 False
         """
         try:
-            # TCP/IP 소켓 생성
-            # AF_INET: IPv4 주소 체계 사용
-            # SOCK_STREAM: TCP 프로토콜 사용 (안정적인 연결 지향 통신)
-            self.client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # 소켓 생성
+            # family: AF_INET(IPv4), AF_INET6(IPv6) 또는 AF_UNIX(유닉스 도메인 소켓)
+            # SOCK_STREAM: 연결 지향 스트림 (TCP와 같은 방식으로 사용)
+            self.client_socket = socket.socket(self.family, socket.SOCK_STREAM)
             
             # 서버에 연결 시도
-            # (host, port) 튜플 형태로 서버 주소 전달
-            self.client_socket.connect((self.host, self.port))
+            # TCP는 (host, port) 튜플, 유닉스 도메인 소켓은 파일 경로
+            self.client_socket.connect(self.address)
             
-            print(f"[연결 성공] 서버 {self.host}:{self.port}에 연결되었습니다.")
+            # 새 연결이므로 이전 연결에서 남은 수신 데이터는 버림
+            self._buffer = FrameBuffer()
+            self._frames.clear()
+            self.binary = False
+            
+            print(f"[연결 성공] 서버 {format_address(self.family, self.address)}에 연결되었습니다.")
+            
+            # 바이너리 프로토콜을 요청했으면 시작 인사를 주고받아 협상
+            if self.protocol == 'binary':
+                self.negotiate_binary()
             return True
         except Exception as e:
             # 연결 실패 시 에러 메시지 출력
@@ -78,28 +122,14 @@ class NEchoClient:
             dict: 서버의 응답을 딕셔너리 형태로 반환 (실패 시 None)
         """
         try:
-            # 요청 데이터를 딕셔너리로 생성
-            # 서버가 요구하는 형식에 맞춰 'n'과 'message' 키를 포함
-            request = {
-                'n': n,
-                'message': message
-            }
-            
-            # 딕셔너리를 JSON 문자열로 변환 (직렬화)
-            # ensure_ascii=False: 한글 등 유니코드 문자를 그대로 유지
-            request_data = json.dumps(request, ensure_ascii=False)
-            
-            # JSON 문자열을 바이트로 인코딩하여 서버에 전송
-            # UTF-8 인코딩 사용
-            self.client_socket.send(request_data.encode('utf-8'))
+            # 요청을 프레임(JSON 한 줄 또는 바이너리 헤더 + 메시지)으로 변환하여 서버에 전송
+            # sendall(): 데이터가 모두 전송될 때까지 반복해서 전송
+            self.client_socket.sendall(self.encode_request(n, message))
             print(f"[전송] n={n}, message='{message}'")
             
-            # 서버로부터 응답 수신
-            # 최대 4096바이트까지 받음
-            response_data = self.client_socket.recv(4096).decode('utf-8')
-            
-            # 받은 JSON 문자열을 파싱하여 딕셔너리로 변환
-            response = json.loads(response_data)
+            # 서버로부터 응답 프레임 하나를 수신하여 딕셔너리로 변환
+            # 압축 응답이면 echoes를 지연 시퀀스로 채움
+            response = self.decode_response(self.recv_frame())
             
             return response
             
@@ -107,6 +137,183 @@ class NEchoClient:
             # 오류 발생 시 메시지 출력하고 None 반환
             print(f"[오류] 요청 처리 중 오류: {e}")
             return None
+    
+    def build_request(self, n, message):
+        """
+        요청 딕셔너리를 만드는 메서드
+        
+        compact 설정이 켜져 있으면 "repeat" 인코딩을 요청합니다.
+        이 키를 모르는 서버(Java 서버 등)는 무시하고 기존 echoes 배열로 응답하므로 호환됩니다.
+        
+        Args:
+            n (int): 메시지를 몇 번 반복할지 (에코 횟수)
+            message (str): 에코할 메시지 내용
+        
+        Returns:
+            dict: 서버에 보낼 요청 딕셔너리
+        """
+        request = {
+            'n': n,
+            'message': message
+        }
+        if self.compact:
+            request['encoding'] = ENCODING_REPEAT
+        return request
+    
+    def encode_request(self, n, message):
+        """
+        현재 연결의 프로토콜에 맞게 요청 프레임을 만드는 메서드
+        
+        Args:
+            n (int): 메시지를 몇 번 반복할지 (에코 횟수)
+            message (str): 에코할 메시지 내용
+        
+        Returns:
+            bytes: 전송할 요청 프레임
+        """
+        if self.binary:
+            return encode_binary_frame(n, message.encode('utf-8'))
+        return encode_frame(self.build_request(n, message))
+    
+    def decode_response(self, frame):
+        """
+        recv_frame()이 돌려준 응답 프레임을 응답 딕셔너리로 바꾸는 메서드
+        
+        바이너리 응답도 압축 JSON 응답과 같은 모양(echoes는 지연 시퀀스)으로 돌려줍니다.
+        
+        Args:
+            frame: JSON 프레임(bytes) 또는 BinaryFrame
+        
+        Returns:
+            dict: 응답 딕셔너리
+        """
+        if self.binary:
+            return decode_binary_response(frame)
+        return expand_echoes(decode_frame(frame))
+    
+    def negotiate_binary(self):
+        """
+        바이너리 프로토콜 시작 인사를 보내고 서버의 응답으로 프로토콜을 정하는 메서드
+        
+        서버가 같은 인사를 돌려보내면 바이너리로 전환하고,
+        JSON만 지원하는 서버가 JSON 에러 응답을 보내면 그 응답을 버리고 JSON으로 통신합니다.
+        
+        Returns:
+            bool: 바이너리 프로토콜로 전환했으면 True
+        
+        Raises:
+            ConnectionError: 협상 중에 서버가 연결을 종료한 경우
+        """
+        self.client_socket.sendall(BINARY_HELLO)
+        first = self._recv_exactly(1)
+        if first == BINARY_HELLO[:1]:
+            # 바이너리 응답의 첫 바이트는 0xFF (JSON 응답은 항상 '{'로 시작)
+            if first + self._recv_exactly(len(BINARY_HELLO) - 1) != BINARY_HELLO:
+                raise ConnectionError("서버의 바이너리 프로토콜 응답이 올바르지 않습니다.")
+            self.binary = True
+            self._buffer = BinaryFrameBuffer()
+            return True
+        
+        # 인사에 대한 JSON 에러 응답 한 줄을 버리고 그 뒤에 온 데이터는 그대로 보관
+        self._frames.extend(self._buffer.feed(first))
+        self.recv_frame()
+        print("[알림] 서버가 바이너리 프로토콜을 지원하지 않아 JSON으로 통신합니다.")
+        return False
+    
+    def send_many(self, requests, window=None):
+        """
+        여러 N-Echo 요청을 파이프라이닝으로 전송하는 메서드
+        
+        요청마다 응답을 기다리지 않고 최대 window개의 요청을 연달아 보낸 뒤,
+        응답이 도착하는 대로 다음 요청들을 채워 보냅니다.
+        서버는 요청 순서대로 응답하므로 반환되는 응답도 요청 순서와 같습니다.
+        왕복 지연(RTT)을 요청마다 기다리지 않아 배치 작업의 처리량이 크게 늘어납니다.
+        
+        Args:
+            requests: (n, message) 튜플의 목록 (또는 반복 가능한 객체)
+            window (int): 응답을 기다리지 않고 보낼 최대 요청 수 (기본값: None - self.window 사용)
+        
+        Returns:
+            list: 요청 순서대로 정렬된 응답 딕셔너리 목록 (실패 시 None)
+        """
+        window = max(1, window or self.window)
+        try:
+            # 요청을 미리 프레임으로 변환
+            frames = [self.encode_request(n, message) for n, message in requests]
+            responses = []
+            sent = 0
+            
+            while len(responses) < len(frames):
+                in_flight = sent - len(responses)
+                # 대기 중인 요청이 윈도의 절반 이하로 줄면 윈도를 다시 채워 한 번에 전송
+                if sent < len(frames) and in_flight <= window // 2:
+                    count = min(window - in_flight, len(frames) - sent)
+                    self.client_socket.sendall(b''.join(frames[sent:sent + count]))
+                    sent += count
+                
+                # 응답 하나 수신 (요청 순서와 같은 순서로 도착)
+                responses.append(self.decode_response(self.recv_frame()))
+            
+            print(f"[전송] 요청 {len(frames)}개 (window={window})")
+            return responses
+        
+        except Exception as e:
+            # 오류 발생 시 메시지 출력하고 None 반환
+            print(f"[오류] 요청 처리 중 오류: {e}")
+            return None
+    
+    def pipeline(self, window=None):
+        """
+        요청을 모아 두었다가 한 번에 파이프라이닝으로 보내는 NEchoPipeline 객체를 만드는 메서드
+        
+        사용 예:
+            with client.pipeline() as pipe:
+                pipe.add(3, 'Hello')
+                pipe.add(1, 'World')
+            print(pipe.responses)
+        
+        Args:
+            window (int): 파이프라이닝 윈도 크기 (기본값: None - self.window 사용)
+        
+        Returns:
+            NEchoPipeline: 요청을 모으는 파이프라인 객체
+        """
+        return NEchoPipeline(self, window)
+    
+    def recv_frame(self):
+        """
+        서버로부터 응답 프레임 하나를 받는 메서드
+        
+        응답이 여러 번의 recv()에 나뉘어 도착하면 프레임이 완성될 때까지 계속 받고,
+        한 번의 recv()에 여러 응답이 들어 있으면 나머지는 다음 호출을 위해 보관합니다.
+        
+        Returns:
+            bytes: 구분자를 제외한 응답 프레임 (바이너리 프로토콜이면 BinaryFrame)
+        
+        Raises:
+            ConnectionError: 응답을 다 받기 전에 서버가 연결을 종료한 경우
+        """
+        while not self._frames:
+            data = self.client_socket.recv(RECV_SIZE)
+            if not data:
+                raise ConnectionError("서버가 연결을 종료했습니다.")
+            self._frames.extend(self._buffer.feed(data))
+        return self._frames.popleft()
+    
+    def _recv_exactly(self, size):
+        """
+        정확히 size바이트를 받는 메서드 (프로토콜 협상용)
+        
+        Raises:
+            ConnectionError: size바이트를 다 받기 전에 서버가 연결을 종료한 경우
+        """
+        data = b''
+        while len(data) < size:
+            chunk = self.client_socket.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("서버가 연결을 종료했습니다.")
+            data += chunk
+        return data
             
     def disconnect(self):
         """
@@ -152,6 +359,58 @@ class NEchoClient:
         print("="*50 + "\n")
 
 
+class NEchoPipeline:
+    """
+    N-Echo 파이프라인 클래스
+    
+    add()로 요청을 모아 두었다가 execute()를 호출하면(또는 with 블록이 끝나면)
+    NEchoClient.send_many()로 모든 요청을 파이프라이닝하여 전송합니다.
+    """
+    
+    def __init__(self, client, window=None):
+        """
+        파이프라인 초기화 메서드
+        
+        Args:
+            client (NEchoClient): 연결된 클라이언트
+            window (int): 파이프라이닝 윈도 크기 (기본값: None - 클라이언트 설정 사용)
+        """
+        self.client = client
+        self.window = window
+        self.requests = []  # 아직 보내지 않은 (n, message) 요청 목록
+        self.responses = None  # execute() 후 요청 순서대로 채워지는 응답 목록
+    
+    def add(self, n, message):
+        """
+        보낼 요청을 하나 추가하는 메서드
+        
+        Returns:
+            NEchoPipeline: 연쇄 호출을 위해 자기 자신을 반환
+        """
+        self.requests.append((n, message))
+        return self
+    
+    def execute(self):
+        """
+        모아 둔 요청을 모두 전송하고 응답 목록을 반환하는 메서드
+        
+        Returns:
+            list: 요청 순서대로 정렬된 응답 딕셔너리 목록 (실패 시 None)
+        """
+        requests, self.requests = self.requests, []
+        self.responses = self.client.send_many(requests, self.window)
+        return self.responses
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        # with 블록이 예외 없이 끝난 경우에만 전송
+        if exc_type is None:
+            self.execute()
+        return False
+
+
 def main():
     """
     메인 함수 - 프로그램의 진입점
@@ -160,13 +419,20 @@ def main():
     사용자로부터 입력을 받아 서버와 통신하는 무한 루프를 실행합니다.
     """
     # 명령줄 인자 처리
-    # 첫 번째 인자: 서버 주소 (없으면 기본값 'localhost')
-    host = sys.argv[1] if len(sys.argv) > 1 else 'localhost'
+    parser = argparse.ArgumentParser(description='N-Echo TCP/IP 클라이언트')
+    # 첫 번째 인자: 서버 주소 (없으면 기본값 'localhost', 'unix:/경로'면 유닉스 도메인 소켓)
+    parser.add_argument('host', nargs='?', default='localhost',
+                        help="서버 주소 (기본값: localhost, 'unix:/경로'면 유닉스 도메인 소켓)")
     # 두 번째 인자: 서버 포트 번호 (없으면 기본값 5000)
-    port = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    parser.add_argument('port', nargs='?', type=int, default=5000,
+                        help='서버 포트 번호 (기본값: 5000)')
+    parser.add_argument('--binary', action='store_true',
+                        help='바이너리 프로토콜 사용 (서버가 지원하지 않으면 JSON 사용)')
+    args = parser.parse_args()
     
     # NEchoClient 객체 생성
-    client = NEchoClient(host=host, port=port)
+    client = NEchoClient(host=args.host, port=args.port,
+                         protocol='binary' if args.binary else 'json')
     
     # 서버에 연결 시도
     if not client.connect():
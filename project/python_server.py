@@ -5,16 +5,391 @@ N-Echo TCP/IP 서버 (Python)
 
 이 프로그램은 여러 클라이언트의 연결을 동시에 처리할 수 있는 멀티스레드 서버입니다.
 각 클라이언트로부터 에코 횟수와 메시지를 받아 해당 메시지를 n번 반복하여 응답합니다.
+
+처리 엔진은 세 가지를 지원합니다.
+  - thread  : 연결마다 OS 스레드 하나를 생성 (기본값)
+  - pool    : 고정 크기 스레드 풀 + 제한된 대기 큐, 큐가 가득 차면 "busy" 에러로 즉시 거절
+  - asyncio : 단일 이벤트 루프에서 모든 연결을 처리 (수천 개 이상의 동시 연결용)
+
+--workers N 옵션을 주면 감독(supervisor) 프로세스가 워커 프로세스 N개를 fork하고,
+각 워커가 SO_REUSEPORT로 같은 포트에 바인딩하여 커널이 연결을 워커들에게 분배합니다.
+
+--unix 경로 옵션을 주면 TCP 포트와 함께 유닉스 도메인 소켓(AF_UNIX)에서도 같은 프로토콜로 연결을 받습니다.
+같은 호스트의 클라이언트는 TCP/IP 스택을 거치지 않으므로 지연 시간이 짧고 처리량이 높습니다.
+
+--metrics-port 옵션을 주면 해당 포트에서 카운터와 요청 처리 시간 히스토그램을
+Prometheus 텍스트 형식으로 조회할 수 있습니다 (워커 모드에서는 전체 워커 합산).
+
+JSON 프로토콜과 함께, 연결 첫 바이트로 협상하는 바이너리 프로토콜(necho_protocol.BINARY_HELLO)도 받습니다.
+바이너리 연결은 요청을 JSON으로 파싱하지 않고 헤더의 n과 메시지 바이트를 그대로 사용합니다.
+
+로그는 print() 대신 necho_log의 큐 기반 로거로 출력하므로 요청 처리 스레드가 출력을 기다리지 않습니다.
+요청마다 생기는 [수신]/[응답] 로그는 기본적으로 100개 중 1개만 기록하고 요청 내용은 넣지 않습니다.
+
+--rate-limit, --byte-limit, --conn-limit 옵션을 주면 클라이언트 IP마다 초당 요청 수, 초당 응답 바이트,
+동시 연결 수를 토큰 버킷으로 제한하고, 넘는 요청과 연결에는 미리 인코딩한 에러 응답을 보냅니다.
+
+--idle-timeout, --read-timeout, --write-timeout 옵션을 주면 요청 없이 붙어 있거나 요청/응답을 아주 느리게
+주고받는(slowloris) 연결을 끊습니다. 연결마다 타이머를 두지 않고 해시 타이머 휠 하나(necho_timer)로 확인합니다.
+
+--tuning 옵션(프리셋, JSON 파일, 'key=value' 목록)과 --backlog, --nodelay, --sndbuf 등 항목별 옵션으로
+연결 대기열 크기와 TCP 소켓 옵션을 정합니다 (necho_tuning, Time/Echo/Number 서버와 공용).
+
+SIGHUP을 받으면 연결 대기 중인 소켓을 그대로 물려준 새 프로세스를 띄우고(무중단 재시작),
+새 프로세스가 연결을 받기 시작하면 수락을 멈춘 뒤 처리 중인 연결이 끝나길 기다렸다가 종료합니다.
+--listen-fd 옵션이나 systemd 소켓 활성화(LISTEN_FDS)로 이미 열린 소켓을 받아 시작할 수도 있습니다.
 """
 
 # socket: 네트워크 통신을 위한 소켓 라이브러리
 import socket
 # threading: 멀티스레드 처리를 위한 라이브러리 (여러 클라이언트 동시 처리)
 import threading
-# json: JSON 형식의 데이터를 다루기 위한 라이브러리
-import json
-# sys: 명령줄 인자 처리를 위한 시스템 라이브러리
+# queue: pool 엔진의 제한된 연결 대기 큐를 위한 라이브러리
+import queue
+# sys: 표준 출력 버퍼 비우기(fork 전)를 위한 시스템 라이브러리
 import sys
+# argparse: 명령줄 옵션(--engine 등) 파싱을 위한 라이브러리
+import argparse
+# asyncio: 단일 이벤트 루프 기반 비동기 처리를 위한 라이브러리 (asyncio 엔진)
+import asyncio
+# os: 워커 프로세스 fork 및 종료 상태 확인을 위한 라이브러리
+import os
+# signal: 워커 프로세스 종료 신호 처리를 위한 라이브러리
+import signal
+# mmap: 워커 프로세스 간 공유 카운터 메모리를 위한 라이브러리
+import mmap
+# time: 워커 재시작 간격 및 통계 출력 주기 계산을 위한 라이브러리
+import time
+# stat: 유닉스 도메인 소켓 파일인지 확인하기 위한 라이브러리
+import stat
+# functools: 연결마다 응답 처리 함수의 옵션(vectored)을 고정하기 위한 라이브러리
+import functools
+# subprocess: 무중단 재시작 때 연결 대기 소켓을 물려받을 새 프로세스를 띄우기 위한 라이브러리
+import subprocess
+# select: 새 프로세스의 준비 완료 알림을 제한 시간 안에 기다리기 위한 라이브러리
+import select
+# errno: 다른 서버가 사용 중인 유닉스 도메인 소켓 경로를 알리는 오류 번호
+import errno
+# necho_protocol: 요청/응답 프레이밍 (줄바꿈으로 구분된 JSON)
+from necho_protocol import (FrameBuffer, FrameTooLargeError, RepeatedEchoes, encode_frame,
+                            decode_frame, frame_size, iter_frame_chunks, iter_frame_buffers,
+                            BinaryFrameBuffer, encode_binary_frame, encode_binary_error,
+                            BINARY_HELLO, OP_ECHO, RECV_SIZE, ENCODING_REPEAT, STREAM_CHUNK_SIZE,
+                            IOV_MAX)
+# necho_metrics: 요청 처리 시간 히스토그램과 메트릭 조회 서버
+from necho_metrics import LatencyHistogram, MetricsServer
+# necho_cache: 인코딩된 응답을 재사용하는 바이트 예산 LRU 캐시
+from necho_cache import ResponseCache
+# necho_limit: 클라이언트 IP별 요청 수/응답 바이트/연결 수 토큰 버킷
+from necho_limit import ClientLimiter, DEFAULT_BURST
+# necho_timer: 연결의 idle/read/write 시간 제한을 확인하는 해시 타이머 휠
+from necho_timer import ConnectionReaper, PHASE_IDLE, PHASE_READ, PHASE_WRITE, TIMEOUT_REASONS
+# necho_tuning: 백로그와 TCP 소켓 옵션 프로필 (다른 서버들과 공용)
+from necho_tuning import (tune_listen_socket, tune_connection, describe_tuning, add_tuning_arguments,
+                          tuning_from_args)
+# necho_log: 백그라운드 스레드에서 출력하는 레벨별 로거
+from necho_log import (log, setup_logging, shutdown_logging, sample_request, log_payloads,
+                       LOG_LEVELS, LOG_FORMATS)
+
+# 지원하는 처리 엔진 목록
+ENGINES = ('thread', 'pool', 'asyncio')
+
+# 서버 카운터 이름 (stats 배열의 인덱스 순서와 같음)
+# active: 현재 처리 중인 연결 수 (누적값이 아닌 현재값)
+# errors: 에러 응답 수 합계 - 종류별로 json_errors(JSON 형식 오류), validation_errors(n/message 검사),
+#         limit_errors(max_n/max_response_bytes 초과), frame_errors(요청 프레임 크기 초과)로 나뉨
+# bytes_in / bytes_out: 수신/송신 바이트 수
+# latency_us: 요청 처리 시간의 합 (마이크로초)
+# rejected: 대기 큐가 가득 차 거절한 연결 수 (pool 엔진)
+# queued: 대기 큐를 거쳐 처리를 시작한 연결 수 (pool 엔진)
+# queue_wait_us: 연결이 대기 큐에서 기다린 시간의 합 (마이크로초, pool 엔진)
+# cache_hits / cache_misses / cache_evictions: 응답 캐시 적중/실패/제거 수 (--cache-bytes)
+# rate_limited: 클라이언트별 초당 요청 수/응답 바이트 제한으로 거절한 요청 수 (--rate-limit, --byte-limit)
+# conn_limited: 클라이언트별 동시 연결 수 제한으로 거절한 연결 수 (--conn-limit)
+# idle_timeouts / read_timeouts / write_timeouts: 시간 제한으로 끊은 연결 수 (단계별, necho_timer의 PHASE 순서)
+STAT_NAMES = ('connections', 'active', 'requests', 'errors',
+              'json_errors', 'validation_errors', 'limit_errors', 'frame_errors',
+              'bytes_in', 'bytes_out', 'latency_us', 'rejected', 'queued', 'queue_wait_us',
+              'cache_hits', 'cache_misses', 'cache_evictions', 'rate_limited', 'conn_limited',
+              'idle_timeouts', 'read_timeouts', 'write_timeouts')
+(STAT_CONNECTIONS, STAT_ACTIVE, STAT_REQUESTS, STAT_ERRORS,
+ STAT_JSON_ERRORS, STAT_VALIDATION_ERRORS, STAT_LIMIT_ERRORS, STAT_FRAME_ERRORS,
+ STAT_BYTES_IN, STAT_BYTES_OUT, STAT_LATENCY_US,
+ STAT_REJECTED, STAT_QUEUED, STAT_QUEUE_WAIT_US,
+ STAT_CACHE_HITS, STAT_CACHE_MISSES, STAT_CACHE_EVICTIONS,
+ STAT_RATE_LIMITED, STAT_CONN_LIMITED,
+ STAT_IDLE_TIMEOUTS, STAT_READ_TIMEOUTS, STAT_WRITE_TIMEOUTS) = range(len(STAT_NAMES))
+
+# 요청 프레임 하나의 최대 크기 (바이트) - 구분자 없이 끝없이 쌓이는 데이터를 막기 위함
+MAX_REQUEST_SIZE = 1024 * 1024
+
+# pool 엔진이 대기 큐가 가득 찼을 때 보내는 응답 (미리 인코딩해 두고 재사용)
+BUSY_RESPONSE = encode_frame({
+    'status': 'error',
+    'message': '서버가 바쁩니다. 잠시 후 다시 시도하세요.',
+    'busy': True
+})
+
+# 클라이언트별 초당 요청 수/응답 바이트 제한을 넘은 요청에 보내는 응답 (JSON, 바이너리)
+RATE_LIMITED_MESSAGE = '요청이 너무 많습니다. 잠시 후 다시 시도하세요.'
+RATE_LIMITED_RESPONSE = encode_frame({
+    'status': 'error',
+    'message': RATE_LIMITED_MESSAGE,
+    'rate_limited': True
+})
+BINARY_RATE_LIMITED_RESPONSE = encode_binary_error(RATE_LIMITED_MESSAGE)
+
+# 클라이언트별 동시 연결 수 제한을 넘은 연결에 보내는 응답
+# (요청 제한의 rate_limited와 구분 - 다시 시도하기 전에 기존 연결을 닫아야 함)
+CONNECTION_LIMITED_RESPONSE = encode_frame({
+    'status': 'error',
+    'message': '이 주소의 연결이 너무 많습니다. 기존 연결을 닫은 뒤 다시 시도하세요.',
+    'too_many_connections': True
+})
+
+# systemd 소켓 활성화에서 물려받은 첫 번째 파일 디스크립터 번호 (sd_listen_fds()와 같음)
+SD_LISTEN_FDS_START = 3
+# 스레드 엔진의 accept()가 self.running을 확인하러 깨어나는 간격 (초)
+ACCEPT_TIMEOUT = 0.5
+# 재시작할 때 새 프로세스가 준비를 마치기를 기다리는 최대 시간 (초)
+READY_TIMEOUT = 10.0
+# 수락을 멈춘 뒤 처리 중인 연결이 끝나기를 기다리는 기본 최대 시간 (초)
+DRAIN_TIMEOUT = 30.0
+# 처리 중인 연결 수를 다시 확인하는 간격 (초)
+DRAIN_POLL_INTERVAL = 0.1
+# 남은 유닉스 도메인 소켓 파일인지 확인하는 연결 시도의 제한 시간 (초)
+UNIX_PROBE_TIMEOUT = 1.0
+# 재시작할 때 이전 값을 지우고 새로 채우는 명령줄 옵션
+HANDOFF_OPTIONS = ('--listen-fd', '--ready-fd')
+
+
+def bind_unix_socket(path, backlog=5):
+    """
+    유닉스 도메인 소켓을 만들어 경로에 바인딩하고 연결 대기를 시작하는 함수
+    
+    이전 실행이 비정상 종료되어 소켓 파일이 남아 있으면 bind()가 실패하므로,
+    그 경로가 소켓 파일이고 연결해 보아 거절될 때(ECONNREFUSED - 연결을 받는 프로세스가 없음)만
+    남은 파일로 보고 지운 뒤 다시 만듭니다 (일반 파일과 실행 중인 서버의 소켓 파일은 지우지 않음).
+    
+    Args:
+        path (str): 소켓 파일 경로
+        backlog (int): 연결 대기열 크기
+    
+    Returns:
+        socket.socket: 연결 대기 중인 AF_UNIX 서버 소켓
+    
+    Raises:
+        OSError: 다른 서버가 이 경로에서 연결을 받고 있는 경우 (errno.EADDRINUSE) 또는 바인딩 실패
+    """
+    try:
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            # 대기열이 가득 찬 서버에 연결이 막히지 않도록 제한 시간 설정 (시간 초과도 사용 중으로 판단)
+            probe.settimeout(UNIX_PROBE_TIMEOUT)
+            try:
+                probe.connect(path)
+            except ConnectionRefusedError:
+                # 연결을 받는 프로세스가 없음 - 이전 실행이 남긴 파일
+                os.unlink(path)
+            except socket.timeout:
+                raise OSError(errno.EADDRINUSE, f"다른 서버가 사용 중인 유닉스 도메인 소켓입니다: {path}") from None
+            else:
+                raise OSError(errno.EADDRINUSE, f"다른 서버가 사용 중인 유닉스 도메인 소켓입니다: {path}")
+            finally:
+                probe.close()
+    except FileNotFoundError:
+        pass
+    server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server_socket.bind(path)
+        server_socket.listen(backlog)
+    except OSError:
+        server_socket.close()
+        raise
+    return server_socket
+
+
+def sendmsg_all(sock, buffers):
+    """
+    버퍼 목록을 sendmsg()로 모두 보내는 함수 (블로킹 소켓용)
+    
+    버퍼들을 하나로 이어 붙이지 않고 IOV_MAX개씩 그대로 커널에 넘깁니다.
+    일부만 전송되면 보낸 만큼 건너뛰고 남은 부분부터 다시 보냅니다.
+    
+    Args:
+        sock (socket.socket): 연결된 소켓
+        buffers (list): bytes 또는 memoryview 목록 (같은 버퍼가 여러 번 들어 있어도 됨)
+    
+    Returns:
+        int: 보낸 바이트 수
+    """
+    views = [memoryview(buffer) for buffer in buffers if len(buffer)]
+    total = 0
+    start = 0
+    while start < len(views):
+        sent = sock.sendmsg(views[start:start + IOV_MAX])
+        total += sent
+        # 다 보낸 버퍼는 건너뛰고, 일부만 보낸 버퍼는 남은 부분만 남김
+        while sent:
+            size = views[start].nbytes
+            if sent < size:
+                views[start] = views[start][sent:]
+                break
+            sent -= size
+            start += 1
+    return total
+
+
+def limit_key(client_address):
+    """
+    클라이언트별 제한에 사용할 키(IP 주소)를 돌려주는 함수
+    
+    Args:
+        client_address: accept()나 peername이 돌려준 주소 (TCP는 튜플, 유닉스 도메인 소켓은 문자열)
+    
+    Returns:
+        str: IP 주소 (유닉스 도메인 소켓 연결은 같은 호스트이므로 None - 제한하지 않음)
+    """
+    return client_address[0] if isinstance(client_address, tuple) else None
+
+
+def reject_connection(client_socket, response):
+    """
+    미리 인코딩한 에러 응답을 한 번만 보내고 연결을 닫는 함수
+    
+    느린 클라이언트 때문에 accept 루프가 막히지 않도록 논블로킹으로 보내며,
+    송신 버퍼에 다 들어가지 않으면 나머지는 버립니다.
+    
+    Args:
+        client_socket: 거절할 클라이언트 소켓
+        response (bytes): 보낼 응답 프레임
+    """
+    try:
+        client_socket.setblocking(False)
+        client_socket.send(response)
+    except OSError:
+        pass
+    finally:
+        client_socket.close()
+
+
+def systemd_listen_fds():
+    """
+    systemd 소켓 활성화로 물려받은 파일 디스크립터 번호 목록을 돌려주는 함수
+    
+    LISTEN_PID가 이 프로세스일 때만 LISTEN_FDS개의 디스크립터(3번부터)를 사용하고,
+    자식 프로세스에 잘못 전달되지 않도록 환경 변수를 지웁니다.
+    
+    Returns:
+        list: 파일 디스크립터 번호 목록 (소켓 활성화가 아니면 빈 목록)
+    """
+    try:
+        pid = int(os.environ.get('LISTEN_PID', ''))
+        count = int(os.environ.get('LISTEN_FDS', ''))
+    except ValueError:
+        return []
+    for name in ('LISTEN_PID', 'LISTEN_FDS', 'LISTEN_FDNAMES'):
+        os.environ.pop(name, None)
+    if pid != os.getpid():
+        return []
+    return list(range(SD_LISTEN_FDS_START, SD_LISTEN_FDS_START + count))
+
+
+def adopt_listen_socket(fd):
+    """
+    물려받은 파일 디스크립터를 소켓 객체로 감싸는 함수
+    
+    주소 체계(AF_INET, AF_UNIX 등)와 종류는 디스크립터에서 알아냅니다.
+    
+    Args:
+        fd (int): 연결 대기 중인 소켓의 파일 디스크립터
+    
+    Returns:
+        socket.socket: 서버 소켓
+    
+    Raises:
+        OSError: fd가 열린 소켓이 아닌 경우
+        ValueError: 연결 대기(listen) 중인 TCP 스트림 소켓이 아닌 경우
+    """
+    sock = socket.socket(fileno=fd)
+    if (sock.type != socket.SOCK_STREAM
+            or not sock.getsockopt(socket.SOL_SOCKET, socket.SO_ACCEPTCONN)):
+        sock.detach()
+        raise ValueError(f"연결 대기 중인 스트림 소켓이 아닙니다: fd {fd}")
+    return sock
+
+
+def successor_argv(argv, listen_fds, ready_fd):
+    """
+    재시작할 새 프로세스의 명령줄을 만드는 함수
+    
+    현재 명령줄에서 이전 재시작이 붙인 --listen-fd/--ready-fd를 지우고 새 값을 붙입니다.
+    
+    Args:
+        argv (list): 현재 프로세스의 명령줄 (sys.argv)
+        listen_fds (list): 물려줄 서버 소켓의 파일 디스크립터 번호
+        ready_fd (int): 새 프로세스가 준비 완료를 알릴 파이프의 쓰기 쪽 디스크립터
+    
+    Returns:
+        list: subprocess에 넘길 명령줄 (파이썬 실행 파일 포함)
+    """
+    args = []
+    skip = False
+    for arg in argv:
+        if skip:
+            skip = False
+            continue
+        if arg.split('=', 1)[0] in HANDOFF_OPTIONS:
+            # '--listen-fd 3' 형식이면 다음 인자(값)도 함께 지움
+            skip = '=' not in arg
+            continue
+        args.append(arg)
+    for fd in listen_fds:
+        args += ['--listen-fd', str(fd)]
+    args += ['--ready-fd', str(ready_fd)]
+    return [sys.executable] + args
+
+
+def spawn_successor(listen_sockets, argv=None, timeout=READY_TIMEOUT):
+    """
+    서버 소켓을 물려받는 새 프로세스를 띄우고 준비를 마칠 때까지 기다리는 함수
+    
+    소켓은 파일 디스크립터 상속(pass_fds)으로 같은 번호 그대로 전달되므로
+    두 프로세스가 커널의 같은 연결 대기열을 공유하고, 그 사이에 들어온 연결도 사라지지 않습니다.
+    새 프로세스는 연결을 받기 직전에 파이프로 한 바이트를 보내 준비 완료를 알립니다.
+    
+    Args:
+        listen_sockets (list): 물려줄 서버 소켓 목록
+        argv (list): 현재 프로세스의 명령줄 (기본값: None - sys.argv)
+        timeout (float): 준비 완료를 기다리는 최대 시간 (초)
+    
+    Returns:
+        subprocess.Popen: 준비를 마친 새 프로세스
+    
+    Raises:
+        OSError: 새 프로세스를 실행하지 못한 경우
+        RuntimeError: 새 프로세스가 시간 안에 준비를 마치지 못하고 종료되거나 응답이 없는 경우
+    """
+    fds = [sock.fileno() for sock in listen_sockets]
+    read_fd, write_fd = os.pipe()
+    try:
+        child = subprocess.Popen(successor_argv(argv if argv is not None else sys.argv, fds, write_fd),
+                                 pass_fds=fds + [write_fd])
+    except OSError:
+        os.close(read_fd)
+        raise
+    finally:
+        # 쓰기 쪽은 새 프로세스만 가지고 있어야 그 프로세스가 죽었을 때 EOF를 받을 수 있음
+        os.close(write_fd)
+    try:
+        ready, _, _ = select.select([read_fd], [], [], timeout)
+        if not ready or os.read(read_fd, 1) != b'1':
+            child.kill()
+            child.wait()
+            raise RuntimeError(f"새 프로세스(PID {child.pid})가 준비를 마치지 못했습니다.")
+    finally:
+        os.close(read_fd)
+    return child
 
 
 class NEchoServer:
@@ -26,7 +401,13 @@ class NEchoServer:
     각 클라이언트를 별도의 스레드에서 처리합니다.
     """
     
-    def __init__(self, host='0.0.0.0', port=5000, max_connections=5):
+    def __init__(self, host='0.0.0.0', port=5000, max_connections=5, engine='thread',
+                 reuse_port=False, stats=None, max_n=None, max_response_bytes=None,
+                 pool_size=32, queue_size=64, latency=None, metrics_port=None,
+                 unix_path=None, unix_socket=None, vectored_send=True, cache_bytes=None,
+                 listen_fds=None, ready_fd=None, drain_timeout=DRAIN_TIMEOUT,
+                 rate_limit=None, byte_limit=None, conn_limit=None, rate_burst=DEFAULT_BURST,
+                 idle_timeout=None, read_timeout=None, write_timeout=None, tuning=None):
         """
         서버 초기화 메서드
         
@@ -36,153 +417,1239 @@ class NEchoServer:
             host (str): 서버가 바인딩할 주소 (기본값: '0.0.0.0' - 모든 인터페이스)
             port (int): 서버가 사용할 포트 번호 (기본값: 5000)
             max_connections (int): 동시에 대기할 수 있는 최대 연결 수 (기본값: 5)
+            engine (str): 처리 엔진 - 'thread', 'pool', 'asyncio' 중 하나 (기본값: 'thread')
+            reuse_port (bool): SO_REUSEPORT 사용 여부 - 여러 프로세스가 같은 포트를 공유 (기본값: False)
+            stats: 카운터를 기록할 배열 (기본값: None - 새 리스트 생성)
+                   워커 모드에서는 감독 프로세스와 공유하는 메모리가 전달됩니다.
+            max_n (int): 허용하는 최대 에코 횟수 (기본값: None - 제한 없음)
+            max_response_bytes (int): 허용하는 최대 응답 크기 (바이트, 기본값: None - 제한 없음)
+            pool_size (int): pool 엔진의 작업 스레드 수 (기본값: 32)
+            queue_size (int): pool 엔진에서 처리를 기다릴 수 있는 최대 연결 수 (기본값: 64)
+            latency (LatencyHistogram): 요청 처리 시간을 기록할 히스토그램 (기본값: None - 새로 생성)
+            metrics_port (int): 메트릭 조회 포트 번호 (기본값: None - 메트릭 서버 없음)
+            unix_path (str): TCP와 함께 연결을 받을 유닉스 도메인 소켓 경로 (기본값: None - TCP만 사용)
+            unix_socket: 이미 바인딩된 유닉스 도메인 서버 소켓 (기본값: None - unix_path에 새로 바인딩)
+                         워커 모드에서는 감독 프로세스가 만든 소켓을 모든 워커가 함께 사용합니다.
+            vectored_send (bool): thread/pool 엔진에서 큰 echoes 응답을 sendmsg()로 보낼지 여부 (기본값: True)
+                                  sendmsg()가 없는 플랫폼(Windows)에서는 항상 sendall()을 사용합니다.
+            cache_bytes (int): JSON 응답 캐시의 바이트 예산 (기본값: None - 캐시 사용 안 함)
+                               워커 모드에서는 워커마다 이 크기의 캐시를 따로 가집니다.
+            listen_fds (list): 바인딩 대신 그대로 사용할 서버 소켓의 파일 디스크립터 (기본값: None)
+                               재시작한 이전 프로세스나 systemd 소켓 활성화가 넘겨준 소켓이며,
+                               AF_UNIX 소켓은 유닉스 도메인 소켓으로, 나머지는 TCP 소켓으로 사용합니다.
+            ready_fd (int): 연결을 받기 시작할 때 한 바이트를 써서 알릴 파이프 디스크립터 (기본값: None)
+            drain_timeout (float): 재시작 후 처리 중인 연결을 기다리는 최대 시간 (초, 기본값: 30)
+            rate_limit (float): 클라이언트 IP당 초당 요청 수 (기본값: None - 제한 없음)
+            byte_limit (float): 클라이언트 IP당 초당 응답 바이트 (기본값: None - 제한 없음)
+            conn_limit (int): 클라이언트 IP당 동시 연결 수 (기본값: None - 제한 없음)
+            rate_burst (float): 한꺼번에 허용하는 요청/바이트 양 (초 단위, 기본값: 1.0)
+                                워커 모드에서는 워커마다 제한을 따로 셉니다.
+            idle_timeout (float): 요청 없이 연결을 유지할 수 있는 최대 시간 (초, 기본값: None - 제한 없음)
+            read_timeout (float): 요청의 첫 바이트부터 프레임이 완성될 때까지의 최대 시간 (초, 기본값: None)
+            write_timeout (float): 응답 조각 하나를 보내는 최대 시간 (초, 기본값: None)
+            tuning (dict): 서버 소켓 튜닝 설정 - necho_tuning.load_tuning()의 결과 (기본값: None - 바꾸지 않음)
+                           backlog 항목이 있으면 max_connections 대신 연결 대기열 크기로 사용합니다.
+                           물려받은 서버 소켓(listen_fds)에는 이전 프로세스의 설정이 그대로 유지됩니다.
         """
+        if engine not in ENGINES:
+            raise ValueError(f"지원하지 않는 엔진입니다: {engine} (가능: {', '.join(ENGINES)})")
         self.host = host  # 서버 주소 저장
         self.port = port  # 포트 번호 저장
-        self.max_connections = max_connections  # 최대 연결 대기 수 저장
+        self.tuning = tuning or {}  # 소켓 튜닝 설정 저장 (바꿀 항목만)
+        # 최대 연결 대기 수 저장 (튜닝 설정의 백로그가 우선)
+        self.max_connections = self.tuning.get('backlog') or max_connections
+        self.engine = engine  # 처리 엔진 저장
+        self.reuse_port = reuse_port  # SO_REUSEPORT 사용 여부 저장
+        self.max_n = max_n  # 최대 에코 횟수 저장
+        self.max_response_bytes = max_response_bytes  # 최대 응답 크기 저장
+        self.pool_size = pool_size  # pool 엔진 작업 스레드 수 저장
+        self.queue_size = queue_size  # pool 엔진 대기 큐 크기 저장
+        self._pool_queue = None  # pool 엔진의 연결 대기 큐 (pool 엔진에서만 사용)
+        # 연결/요청/오류 카운터 (STAT_NAMES 순서)
+        self.stats = stats if stats is not None else [0] * len(STAT_NAMES)
+        # 처리 중인 연결 수(STAT_ACTIVE)를 여러 스레드가 함께 바꾸므로 읽고-고치고-쓰는 동안 잠금
+        self._active_lock = threading.Lock()
+        # 요청 처리 시간 히스토그램 (마이크로초)
+        self.latency = latency if latency is not None else LatencyHistogram()
+        self.metrics_port = metrics_port  # 메트릭 조회 포트 저장
+        self.metrics_server = None  # 메트릭 조회 서버 (metrics_port가 있을 때만 생성)
         self.server_socket = None  # 서버 소켓 객체 (아직 생성 전)
+        self.unix_path = unix_path  # 유닉스 도메인 소켓 경로 저장
+        self.unix_socket = unix_socket  # 유닉스 도메인 서버 소켓 (전달받지 않았으면 시작할 때 생성)
+        self._owns_unix_path = False  # 이 서버가 소켓 파일을 만들었는지 (종료할 때 지울지 결정)
+        # 큰 echoes 응답을 버퍼 목록 + sendmsg()로 보낼지 여부
+        self.vectored_send = vectored_send and hasattr(socket.socket, 'sendmsg')
+        # 같은 요청 프레임의 인코딩된 응답을 재사용하는 LRU 캐시 (cache_bytes가 있을 때만)
+        self.cache = ResponseCache(cache_bytes) if cache_bytes else None
+        # 클라이언트 IP별 토큰 버킷 표 (제한을 하나라도 줬을 때만)
+        self.limiter = (ClientLimiter(rate_limit, byte_limit, conn_limit, burst=rate_burst)
+                        if rate_limit or byte_limit or conn_limit else None)
+        # 시간 제한이 지난 연결을 끊는 타이머 휠 (제한을 하나라도 줬을 때만)
+        self.reaper = (ConnectionReaper(idle_timeout, read_timeout, write_timeout)
+                       if idle_timeout or read_timeout or write_timeout else None)
+        self.listen_fds = list(listen_fds or ())  # 물려받은 서버 소켓 디스크립터 저장
+        self.ready_fd = ready_fd  # 준비 완료 알림 파이프 저장
+        self.drain_timeout = drain_timeout  # 재시작 후 연결 정리 대기 시간 저장
+        self._restarting = False  # 재시작(소켓 인계)을 진행 중인지
+        self._handed_off = False  # 새 프로세스에 소켓을 넘기고 정리 중인지
         self.running = False  # 서버 실행 상태 플래그
-        
+        self._loop = None  # asyncio 엔진의 이벤트 루프 (asyncio 엔진에서만 사용)
+        self._stop_event = None  # asyncio 엔진 종료 신호
+        self._async_server = None  # asyncio 엔진의 TCP 서버 (소켓 인계에 사용)
+    
     def start(self):
         """
         서버를 시작하는 메서드
         
+        설정된 엔진에 따라 스레드 기반(thread, pool) 또는 asyncio 기반으로 서버를 실행합니다.
+        metrics_port가 설정되어 있으면 메트릭 조회 서버를 먼저 시작합니다.
+        """
+        if self.metrics_port is not None:
+            self.metrics_server = MetricsServer(self.metrics, port=self.metrics_port)
+            self.metrics_server.start()
+        if self.engine == 'asyncio':
+            self.start_asyncio()
+        else:
+            self.start_threaded()
+    
+    def start_threaded(self):
+        """
+        스레드 엔진(thread, pool)으로 서버를 시작하는 메서드
+        
         서버 소켓을 생성하고, 포트에 바인딩한 후 클라이언트 연결을 수락합니다.
-        들어오는 각 클라이언트 연결을 별도의 스레드에서 처리합니다.
+        thread 엔진은 들어오는 각 클라이언트 연결을 별도의 스레드에서 처리하고,
+        pool 엔진은 연결을 대기 큐에 넣어 고정된 수의 작업 스레드가 처리하게 합니다.
+        물려받은 서버 소켓(listen_fds)이 있으면 바인딩하지 않고 그 소켓에서 바로 수락합니다.
         """
         try:
-            # TCP/IP 소켓 생성
-            # AF_INET: IPv4 주소 체계 사용
-            # SOCK_STREAM: TCP 프로토콜 사용 (안정적인 연결 지향 통신)
-            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._adopt_listen_fds()
+            if self.server_socket is None:
+                # TCP/IP 소켓 생성
+                # AF_INET: IPv4 주소 체계 사용
+                # SOCK_STREAM: TCP 프로토콜 사용 (안정적인 연결 지향 통신)
+                self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             
-            # SO_REUSEADDR 옵션 설정
-            # 서버 종료 후 즉시 재시작할 수 있도록 포트 재사용 허용
-            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                # SO_REUSEADDR 옵션 설정
+                # 서버 종료 후 즉시 재시작할 수 있도록 포트 재사용 허용
+                self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             
-            # 소켓을 특정 주소와 포트에 바인딩
-            # (host, port) 튜플 형태로 주소 전달
-            self.server_socket.bind((self.host, self.port))
+                # SO_REUSEPORT 옵션 설정 (워커 모드)
+                # 여러 프로세스가 같은 포트에 바인딩하고, 커널이 연결을 분배
+                if self.reuse_port:
+                    self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            
+                # 소켓을 특정 주소와 포트에 바인딩
+                # (host, port) 튜플 형태로 주소 전달
+                self.server_socket.bind((self.host, self.port))
+            
+                # 튜닝 옵션 설정 (수신 버퍼와 TCP_FASTOPEN은 listen 전에 설정해야 모든 연결에 적용됨)
+                self._tune_listen_socket(self.server_socket)
+                
+                # 연결 대기 시작
+                # max_connections: 동시에 대기할 수 있는 최대 연결 요청 수
+                self.server_socket.listen(self.max_connections)
             
-            # 연결 대기 시작
-            # max_connections: 동시에 대기할 수 있는 최대 연결 요청 수
-            self.server_socket.listen(self.max_connections)
+            # accept()가 주기적으로 깨어나 종료/재시작 여부(self.running)를 확인하도록 제한 시간 설정
+            # (논블로킹 모드이므로 소켓을 나눠 가진 다른 프로세스가 asyncio 엔진이어도 막히지 않음)
+            self.server_socket.settimeout(ACCEPT_TIMEOUT)
             self.running = True  # 서버 실행 상태를 True로 설정
             
-            print(f"[서버 시작] {self.host}:{self.port}")
-            print(f"[대기 중] 클라이언트 연결을 기다립니다...")
+            if self.engine == 'pool':
+                self._start_pool()
+            
+            # 시간 제한이 지난 연결은 별도 스레드 하나가 tick마다 정리
+            if self.reaper is not None:
+                reaper_thread = threading.Thread(target=self._reap_loop, name='necho-reaper')
+                reaper_thread.daemon = True
+                reaper_thread.start()
+            
+            log.info("[서버 시작] %s:%s", self.host, self.port)
+            
+            # 유닉스 도메인 소켓은 별도 스레드에서 같은 방식으로 연결 수락
+            if self._open_unix_socket():
+                self.unix_socket.settimeout(ACCEPT_TIMEOUT)
+                unix_thread = threading.Thread(target=self._accept_loop, args=(self.unix_socket,),
+                                               name='necho-unix-accept')
+                unix_thread.daemon = True
+                unix_thread.start()
+            log.info("[대기 중] 클라이언트 연결을 기다립니다...")
+            self._notify_ready()
             
             # 메인 루프: 클라이언트 연결 수락
-            while self.running:
-                try:
-                    # 클라이언트 연결 대기 및 수락
-                    # accept()는 블로킹 함수로, 연결이 올 때까지 대기
-                    # 반환값: (클라이언트 소켓, 클라이언트 주소)
-                    client_socket, client_address = self.server_socket.accept()
-                    print(f"[연결] 클라이언트 접속: {client_address}")
-                    
-                    # 새로운 스레드를 생성하여 클라이언트 처리
-                    # 이렇게 하면 여러 클라이언트를 동시에 처리할 수 있음
-                    client_thread = threading.Thread(
-                        target=self.handle_client,  # 실행할 함수
-                        args=(client_socket, client_address)  # 함수에 전달할 인자
-                    )
-                    # daemon=True: 메인 스레드 종료 시 함께 종료
-                    client_thread.daemon = True
-                    client_thread.start()  # 스레드 시작
-                    
-                except OSError:
-                    # 소켓이 닫혔을 때 발생하는 예외 처리
-                    break
+            self._accept_loop(self.server_socket)
+            
+            # 새 프로세스에 소켓을 넘겼으면 처리 중인 연결이 끝나기를 기다림
+            if self._handed_off:
+                self.drain()
                     
         except Exception as e:
             # 서버 시작 중 발생한 예외 처리
-            print(f"[오류] 서버 시작 실패: {e}")
+            log.error("[오류] 서버 시작 실패: %s", e)
         finally:
             # 어떤 경우든 서버 종료 처리
             self.stop()
+    
+    def _open_unix_socket(self):
+        """
+        unix_path가 설정되어 있으면 유닉스 도메인 서버 소켓을 준비하는 메서드
+        
+        Returns:
+            bool: 유닉스 도메인 소켓을 사용하면 True
+        """
+        if self.unix_socket is None and self.unix_path:
+            self.unix_socket = bind_unix_socket(self.unix_path, self.max_connections)
+            self._owns_unix_path = True
+        if self.unix_socket is None:
+            return False
+        log.info("[서버 시작] unix:%s", self.unix_path)
+        return True
+    
+    def _tune_listen_socket(self, sock):
+        """
+        새로 만든 TCP 서버 소켓에 튜닝 옵션을 설정하고 결과를 기록하는 메서드
+        
+        Args:
+            sock: TCP 서버 소켓 (asyncio 엔진에서는 server.sockets의 소켓)
+        """
+        if not self.tuning:
+            return
+        unsupported = tune_listen_socket(sock, self.tuning)
+        log.info("[튜닝] %s", describe_tuning(self.tuning))
+        if unsupported:
+            log.warning("[튜닝] 이 플랫폼에서 설정할 수 없는 옵션: %s", ", ".join(unsupported))
+    
+    def _adopt_listen_fds(self):
+        """
+        물려받은 파일 디스크립터(listen_fds)를 서버 소켓으로 사용하는 메서드
+        
+        AF_UNIX 소켓은 unix_socket으로, 나머지는 server_socket으로 사용하며
+        주소와 포트는 소켓에서 읽어 옵니다. 물려받은 유닉스 소켓 파일은 만든 쪽이 관리하므로 지우지 않습니다.
+        """
+        for fd in self.listen_fds:
+            sock = adopt_listen_socket(fd)
+            if sock.family == socket.AF_UNIX:
+                self.unix_socket = sock
+                self.unix_path = sock.getsockname()
+            else:
+                self.server_socket = sock
+                self.host, self.port = sock.getsockname()[:2]
+            log.info("[소켓 인계] 물려받은 fd %d: %s", fd, sock.getsockname())
+        self.listen_fds = []
+    
+    def _notify_ready(self):
+        """
+        연결을 받을 준비가 끝났음을 이전 프로세스에 알리는 메서드 (ready_fd가 있을 때만)
+        """
+        if self.ready_fd is None:
+            return
+        try:
+            os.write(self.ready_fd, b'1')
+        except OSError as e:
+            log.warning("[소켓 인계] 준비 완료 알림 실패: %s", e)
+        finally:
+            os.close(self.ready_fd)
+            self.ready_fd = None
+    
+    def _listen_sockets(self):
+        """
+        새 프로세스에 물려줄 서버 소켓 목록을 반환하는 메서드
+        
+        Returns:
+            list: TCP 서버 소켓과 (있으면) 유닉스 도메인 서버 소켓
+        """
+        if self._async_server is not None:
+            sockets = list(self._async_server.sockets)
+        else:
+            sockets = [self.server_socket]
+        if self.unix_socket is not None:
+            sockets.append(self.unix_socket)
+        return sockets
+    
+    def request_restart(self):
+        """
+        무중단 재시작을 시작하는 메서드 (SIGHUP 시그널 핸들러에서 호출)
+        
+        새 프로세스가 준비될 때까지 기다리는 동안에도 연결을 계속 받도록
+        인계 작업은 별도의 스레드에서 실행합니다. 이미 진행 중이면 무시합니다.
+        """
+        if self._restarting or not self.running:
+            return
+        self._restarting = True
+        thread = threading.Thread(target=self.hand_off, name='necho-handoff')
+        thread.daemon = True
+        thread.start()
+    
+    def hand_off(self, argv=None):
+        """
+        서버 소켓을 새 프로세스에 물려주고 이 프로세스는 수락을 멈추는 메서드
+        
+        1. 메트릭 포트를 닫음 (새 프로세스가 같은 포트에 바인딩하도록)
+        2. 서버 소켓을 물려받은 새 프로세스를 띄우고 준비 완료 알림을 기다림
+        3. 수락을 멈추고 (self.running = False) 처리 중인 연결 정리를 시작
+        
+        연결 대기열은 두 프로세스가 공유하므로 어느 순간에도 포트가 닫히지 않아 연결 실패가 없습니다.
+        새 프로세스가 준비에 실패하면 이 프로세스가 그대로 연결을 계속 받습니다.
+        
+        Args:
+            argv (list): 새 프로세스의 명령줄 (기본값: None - 현재 프로세스와 같음)
+        
+        Returns:
+            bool: 소켓을 넘겼으면 True
+        """
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+        try:
+            child = spawn_successor(self._listen_sockets(), argv)
+        except (OSError, RuntimeError) as e:
+            log.error("[재시작 실패] %s - 이 프로세스가 계속 연결을 받습니다.", e)
+            if self.metrics_server is not None:
+                self.metrics_server.start()
+            self._restarting = False
+            return False
+        log.info("[재시작] 새 프로세스(PID %d)가 연결을 받기 시작함 - 수락을 멈추고 연결 %d개를 정리합니다.",
+                 child.pid, self._in_flight())
+        self._handed_off = True
+        # 유닉스 소켓 파일은 새 프로세스가 계속 사용하므로 종료할 때 지우지 않음
+        self._owns_unix_path = False
+        self.running = False
+        if self._loop is not None:
+            # asyncio 엔진: 이벤트 루프에서 서버를 닫고 연결 정리를 시작하도록 알림
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+        return True
+    
+    def _in_flight(self):
+        """
+        아직 끝나지 않은 연결 수 (처리 중 + pool 엔진 대기 큐)
+        """
+        queued = self._pool_queue.qsize() if self._pool_queue is not None else 0
+        return self.stats[STAT_ACTIVE] + queued
+    
+    def _add_active(self, delta):
+        """
+        처리 중인 연결 수(STAT_ACTIVE)를 delta만큼 바꾸는 메서드
+        
+        thread/pool 엔진에서는 연결마다 다른 스레드가 같은 카운터를 바꾸므로, 잠금 없이 += / -=를 하면
+        갱신을 잃어 drain()이 기다리는 0에 도달하지 못하거나 값이 음수가 될 수 있습니다
+        (워커 모드의 공유 카운터는 부호 없는 'Q' memoryview라서 음수를 쓰면 ValueError).
+        """
+        with self._active_lock:
+            self.stats[STAT_ACTIVE] += delta
+    
+    def drain(self):
+        """
+        처리 중인 연결이 모두 끝나거나 drain_timeout이 지날 때까지 기다리는 메서드 (스레드 엔진)
+        
+        수락을 멈춘 뒤에는 각 연결이 받은 요청까지만 응답하고 닫으므로,
+        요청 없이 연결만 유지하는 클라이언트가 없으면 곧 0이 됩니다.
+        
+        Returns:
+            bool: 시간 안에 모든 연결이 끝났으면 True
+        """
+        deadline = time.monotonic() + self.drain_timeout
+        # 방금 수락한 연결이 카운터를 올릴 시간을 주기 위해 한 번은 먼저 기다림
+        time.sleep(DRAIN_POLL_INTERVAL)
+        while self._in_flight() > 0 and time.monotonic() < deadline:
+            time.sleep(DRAIN_POLL_INTERVAL)
+        return self._drained()
+    
+    async def _drain_async(self):
+        """
+        drain()의 asyncio 엔진용 코루틴 (이벤트 루프를 막지 않고 기다림)
+        """
+        deadline = time.monotonic() + self.drain_timeout
+        await asyncio.sleep(DRAIN_POLL_INTERVAL)
+        while self._in_flight() > 0 and time.monotonic() < deadline:
+            await asyncio.sleep(DRAIN_POLL_INTERVAL)
+        return self._drained()
+    
+    def _drained(self):
+        """
+        연결 정리 결과를 로그로 남기는 메서드
+        
+        Returns:
+            bool: 남은 연결이 없으면 True
+        """
+        remaining = self._in_flight()
+        if remaining:
+            log.warning("[인계 완료] %.0f초 안에 끝나지 않은 연결 %d개를 닫습니다.",
+                        self.drain_timeout, remaining)
+            return False
+        log.info("[인계 완료] 처리 중인 연결이 모두 끝났습니다.")
+        return True
+    
+    def _accept_loop(self, server_socket):
+        """
+        스레드 엔진(thread, pool)에서 서버 소켓 하나의 연결을 계속 수락하는 메서드
+        
+        TCP 소켓은 메인 스레드가, 유닉스 도메인 소켓은 별도의 스레드가 이 메서드를 실행합니다.
+        
+        Args:
+            server_socket: 연결을 수락할 서버 소켓 (AF_INET 또는 AF_UNIX)
+        """
+        while self.running:
+            try:
+                # 클라이언트 연결 대기 및 수락
+                # accept()는 블로킹 함수로, 연결이 올 때까지 대기
+                # 반환값: (클라이언트 소켓, 클라이언트 주소)
+                client_socket, client_address = server_socket.accept()
+                if server_socket.family != socket.AF_INET:
+                    # 유닉스 도메인 소켓의 클라이언트 주소는 빈 문자열이므로 로그용 이름 사용
+                    client_address = client_address or f"unix:{self.unix_path}"
+                self.stats[STAT_CONNECTIONS] += 1
+                log.info("[연결] 클라이언트 접속: %s", client_address)
+                if not self._admit(client_socket, client_address):
+                    continue
+                
+                if self._pool_queue is not None:
+                    # pool 엔진: 작업 스레드가 처리하도록 대기 큐에 넣음
+                    self._submit_to_pool(client_socket, client_address)
+                    continue
+                
+                # 새로운 스레드를 생성하여 클라이언트 처리
+                # 이렇게 하면 여러 클라이언트를 동시에 처리할 수 있음
+                client_thread = threading.Thread(
+                    target=self.handle_client,  # 실행할 함수
+                    args=(client_socket, client_address)  # 함수에 전달할 인자
+                )
+                # daemon=True: 메인 스레드 종료 시 함께 종료
+                client_thread.daemon = True
+                client_thread.start()  # 스레드 시작
+            
+            except socket.timeout:
+                # 제한 시간마다 깨어나 self.running 확인 (종료 또는 재시작 인계)
+                continue
+            except OSError:
+                # 소켓이 닫혔을 때 발생하는 예외 처리
+                break
+    
+    def _admit(self, client_socket, client_address):
+        """
+        클라이언트별 동시 연결 수 제한을 확인하는 메서드 (스레드 엔진의 accept 루프에서 호출)
+        
+        제한을 넘으면 스레드를 만들지 않고 미리 인코딩한 에러 응답을 보낸 뒤 연결을 닫습니다.
+        허용한 연결은 handle_client()가 끝날 때 _release()로 연결 수를 돌려놓습니다.
+        
+        Args:
+            client_socket: 클라이언트와 통신하는 소켓 객체
+            client_address: 클라이언트의 주소
+        
+        Returns:
+            bool: 연결을 처리해도 되면 True
+        """
+        key = limit_key(client_address) if self.limiter is not None else None
+        if key is None or self.limiter.connect(key):
+            return True
+        self.stats[STAT_CONN_LIMITED] += 1
+        log.warning("[거절] 클라이언트 연결 수 제한 초과: %s", client_address)
+        reject_connection(client_socket, CONNECTION_LIMITED_RESPONSE)
+        return False
+    
+    def _release(self, client_address):
+        """
+        _admit()이 허용한 연결이 끝났을 때 클라이언트의 연결 수를 줄이는 메서드
+        
+        Args:
+            client_address: 클라이언트의 주소
+        """
+        key = limit_key(client_address) if self.limiter is not None else None
+        if key is not None:
+            self.limiter.disconnect(key)
+    
+    def _byte_limit_key(self, client_address):
+        """
+        보낸 응답 바이트를 제한 표에 기록할 키 (초당 응답 바이트 제한이 없으면 None)
+        """
+        if self.limiter is None or not self.limiter.bytes_per_sec:
+            return None
+        return limit_key(client_address)
+    
+    def _reap(self):
+        """
+        시간 제한이 지난 연결을 끊고 단계별 카운터에 기록하는 메서드
+        
+        끊긴 연결의 recv/send가 깨어나 각 연결 처리 코드가 평소처럼 정리합니다.
+        """
+        reaped = self.reaper.expire()
+        if not reaped:
+            return
+        for phase in reaped:
+            self.stats[STAT_IDLE_TIMEOUTS + phase] += 1
+        log.info("[시간 초과] 연결 %d개 정리 (%s)", len(reaped),
+                 ", ".join(f"{reason} {reaped.count(phase)}"
+                           for phase, reason in enumerate(TIMEOUT_REASONS) if phase in reaped))
+    
+    def _reap_loop(self):
+        """
+        스레드 엔진(thread, pool)에서 tick마다 _reap()을 호출하는 스레드가 실행하는 메서드
+        
+        재시작 인계 후 연결을 정리하는 동안에도 계속 확인합니다.
+        """
+        while self.running or self._handed_off:
+            time.sleep(self.reaper.tick)
+            self._reap()
+    
+    async def _reap_async(self):
+        """
+        asyncio 엔진에서 tick마다 _reap()을 호출하는 코루틴 (연결마다 타이머를 두지 않음)
+        """
+        while True:
+            await asyncio.sleep(self.reaper.tick)
+            self._reap()
+    
+    def _start_pool(self):
+        """
+        pool 엔진의 대기 큐와 작업 스레드를 만드는 메서드
+        
+        작업 스레드 수(pool_size)와 대기 큐 크기(queue_size)가 고정되어 있으므로
+        연결이 한꺼번에 몰려도 스레드와 메모리가 끝없이 늘어나지 않습니다.
+        """
+        self._pool_queue = queue.Queue(maxsize=self.queue_size)
+        for i in range(self.pool_size):
+            worker = threading.Thread(target=self._pool_worker, name=f'necho-pool-{i}')
+            worker.daemon = True
+            worker.start()
+        log.info("[스레드 풀] 작업 스레드 %d개, 대기 큐 %d개", self.pool_size, self.queue_size)
+    
+    def _submit_to_pool(self, client_socket, client_address):
+        """
+        수락한 연결을 pool 엔진의 대기 큐에 넣는 메서드
+        
+        큐가 가득 차 있으면 기다리지 않고 미리 인코딩해 둔 "busy" 에러를 보낸 뒤
+        연결을 닫습니다 (admission control). 이렇게 하면 과부하 상태에서도
+        accept 루프가 막히지 않고, 클라이언트는 즉시 재시도 여부를 판단할 수 있습니다.
+        
+        Args:
+            client_socket: 클라이언트와 통신하는 소켓 객체
+            client_address: 클라이언트의 IP 주소와 포트 튜플
+        """
+        try:
+            self._pool_queue.put_nowait((client_socket, client_address, time.monotonic()))
+        except queue.Full:
+            self.stats[STAT_REJECTED] += 1
+            log.warning("[거절] 대기 큐가 가득 참: %s", client_address)
+            reject_connection(client_socket, BUSY_RESPONSE)
+            self._release(client_address)
+    
+    def _pool_worker(self):
+        """
+        pool 엔진의 작업 스레드가 실행하는 메서드
+        
+        대기 큐에서 연결을 하나씩 꺼내 handle_client()로 처리하고,
+        큐에서 기다린 시간을 카운터에 기록합니다.
+        """
+        while True:
+            client_socket, client_address, enqueued_at = self._pool_queue.get()
+            self.stats[STAT_QUEUED] += 1
+            self.stats[STAT_QUEUE_WAIT_US] += int((time.monotonic() - enqueued_at) * 1_000_000)
+            self.handle_client(client_socket, client_address)
+    
+    def pool_stats(self):
+        """
+        pool 엔진의 대기 큐 상태와 카운터를 반환하는 메서드
+        
+        Returns:
+            dict: queue_depth(현재 대기 중인 연결 수), rejected(거절 수),
+                  queued(처리 시작 수), avg_wait_ms(평균 대기 시간)
+        """
+        queued = self.stats[STAT_QUEUED]
+        return {
+            'queue_depth': self._pool_queue.qsize() if self._pool_queue is not None else 0,
+            'rejected': self.stats[STAT_REJECTED],
+            'queued': queued,
+            'avg_wait_ms': self.stats[STAT_QUEUE_WAIT_US] / queued / 1000 if queued else 0.0,
+        }
+    
+    def cache_stats(self):
+        """
+        응답 캐시의 현재 크기와 카운터를 반환하는 메서드
+        
+        Returns:
+            dict: entries(항목 수), bytes(사용 중인 바이트), max_bytes(예산),
+                  hits(적중), misses(실패), evictions(제거), hit_rate(적중률)
+        """
+        hits, misses = self.stats[STAT_CACHE_HITS], self.stats[STAT_CACHE_MISSES]
+        return {
+            'entries': len(self.cache) if self.cache is not None else 0,
+            'bytes': self.cache.size if self.cache is not None else 0,
+            'max_bytes': self.cache.max_bytes if self.cache is not None else 0,
+            'hits': hits,
+            'misses': misses,
+            'evictions': self.stats[STAT_CACHE_EVICTIONS],
+            'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+        }
+    
+    def limit_stats(self):
+        """
+        클라이언트별 제한 표의 크기와 거절 카운터를 반환하는 메서드
+        
+        Returns:
+            dict: clients(표에 있는 클라이언트 수), rate_limited(거절한 요청 수),
+                  conn_limited(거절한 연결 수)
+        """
+        return {
+            'clients': len(self.limiter) if self.limiter is not None else 0,
+            'rate_limited': self.stats[STAT_RATE_LIMITED],
+            'conn_limited': self.stats[STAT_CONN_LIMITED],
+        }
+    
+    def timeout_stats(self):
+        """
+        시간 제한으로 확인 중인 연결 수와 단계별로 끊은 연결 수를 반환하는 메서드
+        
+        Returns:
+            dict: watched(타이머 휠에 있는 연결 수), idle_timeouts, read_timeouts, write_timeouts
+        """
+        return {
+            'watched': len(self.reaper) if self.reaper is not None else 0,
+            'idle_timeouts': self.stats[STAT_IDLE_TIMEOUTS],
+            'read_timeouts': self.stats[STAT_READ_TIMEOUTS],
+            'write_timeouts': self.stats[STAT_WRITE_TIMEOUTS],
+        }
+    
+    def metrics(self):
+        """
+        메트릭 조회 서버가 사용할 현재 카운터와 히스토그램을 반환하는 메서드
+        
+        Returns:
+            tuple: (카운터 이름 -> 값 딕셔너리, LatencyHistogram)
+        """
+        return dict(zip(STAT_NAMES, self.stats)), self.latency
             
     def handle_client(self, client_socket, client_address):
         """
         개별 클라이언트의 요청을 처리하는 메서드
         
         이 메서드는 별도의 스레드에서 실행되어 한 클라이언트의 모든 요청을 처리합니다.
-        클라이언트로부터 데이터를 받아 파싱하고, N-Echo 처리 후 응답을 전송합니다.
+        클라이언트로부터 데이터를 받아 프레임 단위로 나누고, N-Echo 처리 후 응답을 전송합니다.
         
         Args:
             client_socket: 클라이언트와 통신하는 소켓 객체
             client_address: 클라이언트의 IP 주소와 포트 튜플
         """
+        # 연결마다 하나씩 사용하는 증분 수신 버퍼 (첫 데이터로 JSON/바이너리를 정한 뒤 만듦)
+        buffer = None
+        head = b''  # 프로토콜을 정하기 전까지 받은 데이터
+        stats = self.stats
+        # 초당 응답 바이트 제한을 쓰면 보낸 만큼 클라이언트의 바이트 토큰을 씀
+        byte_key = self._byte_limit_key(client_address)
+        # 시간 제한을 쓰면 타이머 휠에 등록 (시간이 지나면 shutdown()으로 막혀 있는 recv/send를 깨움)
+        watch = (self.reaper.watch(functools.partial(client_socket.shutdown, socket.SHUT_RDWR))
+                 if self.reaper is not None else None)
+        self._add_active(1)
         try:
             # 클라이언트가 연결을 유지하는 동안 계속 요청 처리
             while True:
                 # 클라이언트로부터 데이터 수신
-                # 최대 4096바이트까지 받음
-                data = client_socket.recv(4096).decode('utf-8')
+                # 요청이 여러 번에 나뉘어 오거나 여러 요청이 한 번에 올 수 있음
+                data = client_socket.recv(RECV_SIZE)
+                stats[STAT_BYTES_IN] += len(data)
                 
                 # 데이터가 없으면 클라이언트가 연결을 종료한 것
                 if not data:
-                    print(f"[연결 종료] {client_address}")
+                    log.debug("[연결 종료] %s", client_address)
                     break
                 
-                print(f"[수신] {client_address}: {data}")
+                if buffer is None:
+                    # 첫 데이터로 프로토콜 결정 (바이너리면 시작 인사를 돌려보냄)
+                    head += data
+                    negotiated = self.negotiate(head)
+                    if negotiated is None:
+                        if watch is not None and watch.phase != PHASE_READ:
+                            watch.enter(PHASE_READ)
+                        continue
+                    buffer, data, reply = negotiated
+                    if reply:
+                        client_socket.sendall(reply)
+                        stats[STAT_BYTES_OUT] += len(reply)
+                    binary = isinstance(buffer, BinaryFrameBuffer)
+                    if binary:
+                        process = self.process_binary_frames
+                    else:
+                        # 큰 echoes 응답은 sendmsg()에 넘길 버퍼 목록으로 받음 (vectored_send일 때)
+                        process = functools.partial(self.process_frames, vectored=self.vectored_send)
                 
-                # JSON 데이터 파싱 및 처리
                 try:
-                    # JSON 문자열을 딕셔너리로 변환
-                    request = json.loads(data)
-                    
-                    # 요청에서 'n'과 'message' 값 추출
-                    # get() 메서드로 안전하게 값 가져오기 (없으면 기본값 사용)
-                    n = request.get('n', 1)
-                    message = request.get('message', '')
-                    
-                    # 입력값 유효성 검사
-                    # n이 정수이고 양수인지 확인
-                    if not isinstance(n, int) or n <= 0:
-                        response = {
-                            'status': 'error',
-                            'message': 'n은 양의 정수여야 합니다.'
-                        }
-                    # 메시지가 비어있지 않은지 확인
-                    elif not message:
-                        response = {
-                            'status': 'error',
-                            'message': 'message는 비어있을 수 없습니다.'
-                        }
+                    frames = buffer.feed(data)
+                except FrameTooLargeError as e:
+                    # 너무 큰 요청은 에러 응답 후 연결 종료
+                    client_socket.sendall(self.frame_error(e, binary))
+                    break
+                
+                # 이번에 완성된 요청들을 모두 처리하고 응답을 조각 단위로 전송
+                # sendall()/sendmsg()는 송신 버퍼가 찰 때마다 블로킹되므로 느린 클라이언트에 맞춰 속도가 조절됨
+                for chunk in process(frames, client_address):
+                    if watch is not None:
+                        watch.enter(PHASE_WRITE)
+                    if isinstance(chunk, list):
+                        # 버퍼 목록은 이어 붙이지 않고 sendmsg()로 전송
+                        sent = sendmsg_all(client_socket, chunk)
                     else:
-                        # 유효성 검사를 통과하면 N-Echo 응답 생성
-                        # 리스트 컴프리헨션으로 메시지를 n번 반복한 배열 생성
-                        echoes = [message for _ in range(n)]
-                        response = {
-                            'status': 'success',
-                            'n': n,
-                            'echoes': echoes
-                        }
-                        print(f"[응답] {client_address}에게 메시지를 {n}번 전송")
-                        
-                except json.JSONDecodeError:
-                    # JSON 파싱 실패 시 에러 응답 생성
+                        client_socket.sendall(chunk)
+                        sent = len(chunk)
+                    stats[STAT_BYTES_OUT] += sent
+                    if byte_key is not None:
+                        self.limiter.charge(byte_key, sent)
+                
+                if watch is not None:
+                    self._update_watch(watch, frames, buffer)
+                
+                # 서버가 종료 중이면(재시작 인계 포함) 받은 요청까지만 응답하고 연결 종료
+                if not self.running:
+                    break
+        
+        except Exception as e:
+            # 예외 발생 시 에러 메시지 출력
+            log.warning("[오류] 클라이언트 처리 중 오류 (%s): %s", client_address, e)
+        finally:
+            # 모든 경우에 소켓 닫기 (자원 정리)
+            # 닫은 소켓 번호가 재사용되기 전에 타이머 휠에서 먼저 제거
+            if watch is not None:
+                self.reaper.unwatch(watch)
+            client_socket.close()
+            self._add_active(-1)
+            self._release(client_address)
+            log.info("[연결 해제] %s", client_address)
+    
+    @staticmethod
+    def _update_watch(watch, frames, buffer):
+        """
+        받은 요청을 처리한 뒤 연결의 시간 제한 단계를 정하는 메서드
+        
+        받다 만 요청이 남아 있으면 read 단계, 없으면 idle 단계로 바꿉니다.
+        완성된 요청이 없는 동안에는 마감 시각을 늘리지 않으므로, 요청을 한 바이트씩 보내거나
+        빈 줄만 보내 연결을 붙잡아 두는 클라이언트도 시간이 지나면 끊깁니다.
+        
+        Args:
+            watch (ConnectionWatch): 연결의 시간 제한 상태
+            frames (list): 이번에 완성된 요청 프레임
+            buffer: 수신 버퍼 (남은 바이트 수를 len()으로 확인)
+        """
+        phase = PHASE_READ if len(buffer) else PHASE_IDLE
+        if frames or watch.phase != phase:
+            watch.enter(phase)
+    
+    def negotiate(self, head):
+        """
+        연결의 첫 데이터로 프로토콜(JSON 또는 바이너리)을 정하는 메서드
+        
+        데이터가 BINARY_HELLO로 시작하면 바이너리, 그 밖의 데이터는 JSON으로 처리합니다.
+        JSON 요청은 0xFF로 시작할 수 없으므로 기존 클라이언트는 항상 JSON으로 처리됩니다.
+        
+        Args:
+            head (bytes): 지금까지 받은 데이터
+        
+        Returns:
+            tuple: (수신 버퍼, 버퍼에 넣을 나머지 데이터, 클라이언트에게 보낼 응답 바이트)
+                   판별하기에 데이터가 부족하면 None
+        """
+        if len(head) < len(BINARY_HELLO) and BINARY_HELLO.startswith(head):
+            return None
+        if head.startswith(BINARY_HELLO):
+            return BinaryFrameBuffer(max_frame_size=MAX_REQUEST_SIZE), head[len(BINARY_HELLO):], BINARY_HELLO
+        return FrameBuffer(max_frame_size=MAX_REQUEST_SIZE), head, b''
+    
+    def frame_error(self, error, binary=False):
+        """
+        요청 프레임 크기 초과 에러 응답을 만들고 카운터에 기록하는 메서드
+        
+        Args:
+            error (FrameTooLargeError): FrameBuffer가 발생시킨 예외
+            binary (bool): 바이너리 프로토콜 연결인지 여부
+        
+        Returns:
+            bytes: 보낼 에러 응답 프레임
+        """
+        if binary:
+            response = encode_binary_error(str(error))
+        else:
+            response = encode_frame({'status': 'error', 'message': str(error)})
+        self.stats[STAT_ERRORS] += 1
+        self.stats[STAT_FRAME_ERRORS] += 1
+        self.stats[STAT_BYTES_OUT] += len(response)
+        return response
+    
+    def process_frames(self, frames, client_address, vectored=False):
+        """
+        완성된 요청 프레임 여러 개를 차례로 처리하여 응답 조각을 만드는 제너레이터
+        
+        파이프라이닝된 요청들이 한 번에 도착하면 작은 응답들은 순서대로 이어 붙여
+        STREAM_CHUNK_SIZE 정도의 조각으로 모아 보내고, 큰 echoes 응답은 전체를 만들지 않고
+        조각 단위로 인코딩하여 보냅니다. 호출하는 쪽이 조각 하나를 다 보낸 뒤에
+        다음 조각을 만들므로 연결당 메모리 사용량은 n과 관계없이 일정합니다.
+        
+        응답 캐시를 사용하면 같은 요청 프레임에 대해 저장해 둔 응답 바이트를
+        파싱/인코딩 없이 그대로 보내고, 캐시에 없던 성공 응답은 인코딩하여 저장합니다.
+        
+        클라이언트별 제한(limiter)을 사용하면 요청 토큰이 모자라거나 응답 바이트 토큰이 빚 상태일 때
+        남은 요청들을 해석하지 않고 미리 인코딩한 에러 응답을 보냅니다 (묶음마다 한 번만 검사).
+        
+        vectored가 True이면 STREAM_CHUNK_SIZE보다 큰 echoes 응답은 bytes 조각 대신
+        같은 블록을 여러 번 참조하는 버퍼 목록(iter_frame_buffers)으로 돌려주므로,
+        호출하는 쪽이 sendmsg()로 보내면 응답 크기만큼의 사용자 공간 복사가 생기지 않습니다.
+        
+        요청마다 처리를 시작한 시각부터 응답의 마지막 조각을 만든 시각까지를
+        처리 시간 히스토그램에 기록합니다 (큰 응답은 앞 조각들의 전송 시간 포함).
+        
+        Args:
+            frames (list): 구분자를 제외한 요청 프레임(bytes) 목록
+            client_address: 클라이언트의 주소 (로그 출력용)
+            vectored (bool): 큰 echoes 응답을 버퍼 목록으로 돌려줄지 여부 (기본값: False)
+        
+        Yields:
+            bytes 또는 list: 요청 순서대로 이어지는 응답 조각 (list는 sendmsg()용 버퍼 목록)
+        """
+        pending = []
+        pending_size = 0
+        stats, latency, cache = self.stats, self.latency, self.cache
+        frames, rejected = self.limit_frames(frames, client_address)
+        byte_key = self._byte_limit_key(client_address) if len(frames) > 1 else None
+        for index, frame in enumerate(frames):
+            if index and byte_key is not None and self.limiter.in_debt(byte_key):
+                # 앞의 응답으로 응답 바이트 토큰이 빚이 되면 남은 요청은 해석하지 않고 거절
+                stats[STAT_RATE_LIMITED] += len(frames) - index
+                rejected += len(frames) - index
+                break
+            started = time.perf_counter_ns()
+            # 요청 로그는 N개 중 1개만 기록 (기본적으로 요청 내용 대신 크기만 기록)
+            sampled = sample_request()
+            if sampled:
+                log.info("[수신] %s: %s", client_address,
+                         frame.decode('utf-8', 'replace') if log_payloads() else f"{len(frame)}바이트")
+            # 캐시 적중: 요청 파싱과 응답 인코딩 없이 저장해 둔 응답 바이트를 그대로 전송
+            encoded = cache.get(frame) if cache is not None else None
+            if encoded is not None:
+                stats[STAT_REQUESTS] += 1
+                stats[STAT_CACHE_HITS] += 1
+                if sampled:
+                    log.info("[응답] %s에게 캐시된 응답 전송 (%d바이트)", client_address, len(encoded))
+                echoes = None
+            else:
+                # 요청을 처리하여 응답 딕셔너리 생성 후 프레임 조각으로 변환
+                response = self.process_request(frame, client_address)
+                if sampled and response['status'] == 'success':
+                    log.info("[응답] %s에게 메시지를 %d번 전송%s", client_address, response['n'],
+                             " (repeat 인코딩)" if 'encoding' in response else "")
+                if cache is not None:
+                    stats[STAT_CACHE_MISSES] += 1
+                    encoded = self.cache_response(frame, response)
+                echoes = response.get('echoes')
+            if encoded is not None:
+                # 인코딩된 응답 하나 (캐시 적중 또는 방금 캐시에 저장한 응답)
+                pending.append(encoded)
+                pending_size += len(encoded)
+                if pending_size >= STREAM_CHUNK_SIZE:
+                    yield b''.join(pending)
+                    pending = []
+                    pending_size = 0
+            elif (vectored and isinstance(echoes, RepeatedEchoes)
+                    and echoes.n * len(echoes.message) >= STREAM_CHUNK_SIZE):
+                # 먼저 모아 둔 작은 응답들을 보낸 뒤 큰 응답은 버퍼 목록 그대로 전달
+                if pending:
+                    yield b''.join(pending)
+                    pending = []
+                    pending_size = 0
+                yield from iter_frame_buffers(response)
+            else:
+                for chunk in iter_frame_chunks(response):
+                    pending.append(chunk)
+                    pending_size += len(chunk)
+                    if pending_size >= STREAM_CHUNK_SIZE:
+                        yield b''.join(pending)
+                        pending = []
+                        pending_size = 0
+            elapsed_us = (time.perf_counter_ns() - started) // 1000
+            stats[STAT_LATENCY_US] += elapsed_us
+            latency.record(elapsed_us)
+        if rejected:
+            # 제한에 걸린 요청들은 묶음의 뒤쪽이므로 응답 순서대로 맨 뒤에 붙임
+            pending.append(RATE_LIMITED_RESPONSE * rejected)
+        if pending:
+            yield b''.join(pending)
+    
+    def limit_frames(self, frames, client_address):
+        """
+        한 번에 도착한 요청 프레임들 중 클라이언트별 요청 수 제한 안에서 처리할 프레임을 고르는 메서드
+        
+        요청 묶음마다 제한 표를 한 번만 조회하며, 제한에 걸린 요청은 해석하지 않습니다.
+        
+        Args:
+            frames (list): 요청 프레임 목록
+            client_address: 클라이언트의 주소
+        
+        Returns:
+            tuple: (처리할 앞쪽 프레임 목록, 거절할 뒤쪽 요청 수)
+        """
+        limiter = self.limiter
+        if limiter is None or not (limiter.requests_per_sec or limiter.bytes_per_sec):
+            return frames, 0
+        key = limit_key(client_address)
+        if key is None:
+            return frames, 0
+        allowed = limiter.allow(key, len(frames))
+        rejected = len(frames) - allowed
+        if rejected:
+            self.stats[STAT_RATE_LIMITED] += rejected
+            frames = frames[:allowed]
+        return frames, rejected
+    
+    def cache_response(self, frame, response):
+        """
+        성공 응답을 인코딩하여 응답 캐시에 저장하는 메서드
+        
+        에러 응답과 캐시 항목 최대 크기(max_entry_bytes)보다 큰 응답은 저장하지 않으며,
+        큰 응답은 크기만 계산하고 인코딩하지 않습니다 (스트리밍/벡터 전송으로 보냄).
+        
+        Args:
+            frame (bytes): 요청 프레임 (캐시 키)
+            response (dict): process_request()가 만든 응답
+        
+        Returns:
+            bytes: 저장한 인코딩 결과 (저장하지 않았으면 None)
+        """
+        cache = self.cache
+        if response['status'] != 'success' or len(frame) + frame_size(response) > cache.max_entry_bytes:
+            return None
+        encoded = b''.join(iter_frame_chunks(response))
+        self.stats[STAT_CACHE_EVICTIONS] += cache.put(frame, encoded)
+        return encoded
+    
+    def process_binary_frames(self, frames, client_address):
+        """
+        바이너리 프로토콜 요청 프레임 여러 개를 차례로 처리하여 응답 조각을 만드는 제너레이터
+        
+        JSON 파싱과 문자열 디코딩/인코딩 없이, 요청의 메시지 바이트를 그대로 응답 본문으로 사용합니다.
+        응답은 메시지를 한 번만 담으므로("repeat" 인코딩과 같음) 크기가 n과 관계없이 일정합니다.
+        
+        Args:
+            frames (list): BinaryFrameBuffer가 돌려준 BinaryFrame 목록
+            client_address: 클라이언트의 주소 (로그 출력용)
+        
+        Yields:
+            bytes: 요청 순서대로 이어지는 응답 조각
+        """
+        pending = []
+        pending_size = 0
+        stats, latency = self.stats, self.latency
+        frames, rejected = self.limit_frames(frames, client_address)
+        for frame in frames:
+            started = time.perf_counter_ns()
+            stats[STAT_REQUESTS] += 1
+            sampled = sample_request()
+            if sampled:
+                log.info("[수신] %s: 바이너리 op=%d n=%d, %d바이트", client_address,
+                         frame.op, frame.n, len(frame.body))
+            if frame.op != OP_ECHO:
+                problem = ('지원하지 않는 요청입니다.', STAT_VALIDATION_ERRORS)
+            else:
+                problem = self.check_request(frame.n, frame.body)
+            if problem is None:
+                response = encode_binary_frame(frame.n, frame.body)
+                if sampled:
+                    log.info("[응답] %s에게 메시지를 %d번 전송 (바이너리)", client_address, frame.n)
+            else:
+                message, error_stat = problem
+                response = encode_binary_error(message, frame.op)
+                stats[STAT_ERRORS] += 1
+                stats[error_stat] += 1
+            pending.append(response)
+            pending_size += len(response)
+            if pending_size >= STREAM_CHUNK_SIZE:
+                yield b''.join(pending)
+                pending = []
+                pending_size = 0
+            elapsed_us = (time.perf_counter_ns() - started) // 1000
+            stats[STAT_LATENCY_US] += elapsed_us
+            latency.record(elapsed_us)
+        if rejected:
+            pending.append(BINARY_RATE_LIMITED_RESPONSE * rejected)
+        if pending:
+            yield b''.join(pending)
+    
+    def check_request(self, n, message):
+        """
+        에코 횟수와 메시지를 검사하는 메서드 (JSON과 바이너리 프로토콜 공용)
+        
+        Args:
+            n: 에코 횟수
+            message: 에코할 메시지 (str 또는 bytes)
+        
+        Returns:
+            tuple: 문제가 있으면 (에러 메시지, 종류별 카운터 인덱스), 없으면 None
+        """
+        # n이 정수이고 양수인지 확인
+        if not isinstance(n, int) or n <= 0:
+            return 'n은 양의 정수여야 합니다.', STAT_VALIDATION_ERRORS
+        # 메시지가 비어있지 않은지 확인
+        if not message:
+            return 'message는 비어있을 수 없습니다.', STAT_VALIDATION_ERRORS
+        # 서버에 설정된 최대 에코 횟수를 넘지 않는지 확인
+        if self.max_n is not None and n > self.max_n:
+            return f'n은 {self.max_n} 이하여야 합니다.', STAT_LIMIT_ERRORS
+        return None
+    
+    def process_request(self, data, client_address):
+        """
+        요청 문자열 하나를 처리하여 응답 딕셔너리를 만드는 메서드
+        
+        스레드 엔진과 asyncio 엔진이 같은 프로토콜을 제공하도록
+        JSON 파싱과 유효성 검사, N-Echo 응답 생성을 한 곳에서 담당합니다.
+        
+        Args:
+            data (bytes): 클라이언트가 보낸 JSON 요청 (프레임 하나)
+            client_address: 클라이언트의 주소
+        
+        Returns:
+            dict: 클라이언트에게 보낼 응답 딕셔너리
+        """
+        self.stats[STAT_REQUESTS] += 1
+        error_stat = STAT_VALIDATION_ERRORS  # 에러 응답일 때 함께 증가시킬 종류별 카운터
+        
+        # JSON 데이터 파싱 및 처리
+        try:
+            # JSON 문자열을 딕셔너리로 변환
+            request = decode_frame(data)
+            if not isinstance(request, dict):
+                raise ValueError("요청은 JSON 객체여야 합니다.")
+            
+            # 요청에서 'n'과 'message' 값 추출
+            # get() 메서드로 안전하게 값 가져오기 (없으면 기본값 사용)
+            n = request.get('n', 1)
+            message = request.get('message', '')
+            
+            # 입력값 유효성 검사 (n은 양의 정수, message는 비어있지 않음, max_n 이하)
+            problem = self.check_request(n, message)
+            if problem is not None:
+                error_message, error_stat = problem
+                response = {
+                    'status': 'error',
+                    'message': error_message
+                }
+            elif request.get('encoding') == ENCODING_REPEAT:
+                # 압축 응답을 요청한 클라이언트: 메시지를 한 번만 보내고 n으로 반복 표현
+                # 응답 크기와 생성 비용이 n과 무관하게 일정함
+                response = {
+                    'status': 'success',
+                    'n': n,
+                    'message': message,
+                    'encoding': ENCODING_REPEAT
+                }
+            else:
+                # 유효성 검사를 통과하면 N-Echo 응답 생성
+                # 리스트를 만들지 않고 RepeatedEchoes로 표현 - 전송할 때 조각 단위로 인코딩됨
+                response = {
+                    'status': 'success',
+                    'n': n,
+                    'echoes': RepeatedEchoes(message, n)
+                }
+                # 응답 크기가 서버에 설정된 최대 크기를 넘지 않는지 확인 (인코딩 없이 계산)
+                if (self.max_response_bytes is not None
+                        and frame_size(response) > self.max_response_bytes):
+                    error_stat = STAT_LIMIT_ERRORS
                     response = {
                         'status': 'error',
-                        'message': 'JSON 형식이 올바르지 않습니다.'
+                        'message': f'응답 크기가 최대 허용 크기({self.max_response_bytes}바이트)를 넘습니다.'
                     }
+        
+        except ValueError:
+            # JSON 파싱 실패 시 에러 응답 생성 (UTF-8 디코딩 실패 포함)
+            error_stat = STAT_JSON_ERRORS
+            response = {
+                'status': 'error',
+                'message': 'JSON 형식이 올바르지 않습니다.'
+            }
+        
+        if response['status'] == 'error':
+            self.stats[STAT_ERRORS] += 1
+            self.stats[error_stat] += 1
+        return response
+    
+    def start_asyncio(self):
+        """
+        asyncio 엔진으로 서버를 시작하는 메서드
+        
+        스레드를 만들지 않고 하나의 이벤트 루프에서 모든 연결을 처리합니다.
+        연결당 비용이 스레드 스택 대신 작은 코루틴 객체와 버퍼뿐이므로
+        수천~수만 개의 동시 연결을 다룰 수 있습니다.
+        """
+        try:
+            asyncio.run(self._serve_asyncio())
+        except Exception as e:
+            # 서버 시작 중 발생한 예외 처리
+            log.error("[오류] 서버 시작 실패: %s", e)
+        finally:
+            self.running = False
+            self._loop = None
+            log.info("[서버 종료]")
+    
+    async def _serve_asyncio(self):
+        """
+        asyncio 서버를 열고 종료 신호가 올 때까지 대기하는 코루틴
+        """
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        
+        self._adopt_listen_fds()
+        if self.server_socket is not None:
+            # 물려받은 서버 소켓에서 바로 연결 수락 (바인딩하지 않음)
+            server = await asyncio.start_server(self.handle_client_async, sock=self.server_socket,
+                                                backlog=self.max_connections)
+        else:
+            # asyncio.start_server가 소켓 생성, 바인딩, listen을 모두 처리
+            # reuse_address=True: SO_REUSEADDR 옵션과 동일
+            server = await asyncio.start_server(
+                self.handle_client_async,
+                self.host,
+                self.port,
+                backlog=self.max_connections,
+                reuse_address=True,
+                reuse_port=self.reuse_port or None
+            )
+            # 튜닝 옵션 설정 (Linux는 listen 이후에 설정해도 이후 수락하는 연결에 적용됨)
+            for sock in server.sockets:
+                self._tune_listen_socket(sock)
+        self._async_server = server
+        self.running = True  # 서버 실행 상태를 True로 설정
+        
+        log.info("[서버 시작] %s:%s (asyncio 엔진)", self.host, self.port)
+        
+        # 유닉스 도메인 소켓도 같은 연결 처리 코루틴으로 연결 수락
+        unix_server = None
+        if self._open_unix_socket():
+            unix_server = await asyncio.start_unix_server(self.handle_client_async, sock=self.unix_socket)
+        log.info("[대기 중] 클라이언트 연결을 기다립니다...")
+        self._notify_ready()
+        # 시간 제한이 지난 연결은 태스크 하나가 tick마다 정리
+        reap_task = asyncio.create_task(self._reap_async()) if self.reaper is not None else None
+        
+        try:
+            async with server:
+                # stop() 또는 hand_off()가 호출될 때까지 대기
+                await self._stop_event.wait()
+                if self._handed_off:
+                    # 새 프로세스에 소켓을 넘겼으면 수락을 멈추고 처리 중인 연결이 끝나기를 기다림
+                    # (server.close()를 먼저 하면 이미 수락했지만 아직 서버에 등록되지 않은 연결이
+                    #  끊기므로, 소켓 감시만 해제하고 서버는 연결 정리가 끝난 뒤 닫음)
+                    sockets = list(server.sockets)
+                    if unix_server is not None:
+                        sockets += unix_server.sockets
+                    for sock in sockets:
+                        self._loop.remove_reader(sock.fileno())
+                    await self._drain_async()
+        finally:
+            if reap_task is not None:
+                reap_task.cancel()
+            if unix_server is not None:
+                unix_server.close()
+    
+    async def handle_client_async(self, reader, writer):
+        """
+        asyncio 엔진에서 개별 클라이언트의 요청을 처리하는 코루틴
+        
+        handle_client()와 같은 프로토콜을 제공하지만,
+        recv/send 대신 StreamReader/StreamWriter를 사용하여 이벤트 루프를 막지 않습니다.
+        
+        Args:
+            reader (asyncio.StreamReader): 클라이언트로부터 데이터를 읽는 스트림
+            writer (asyncio.StreamWriter): 클라이언트에게 데이터를 쓰는 스트림
+        """
+        # 유닉스 도메인 소켓 연결은 상대 주소가 빈 문자열이므로 로그용 이름 사용
+        client_address = writer.get_extra_info('peername') or f"unix:{self.unix_path}"
+        stats = self.stats
+        stats[STAT_CONNECTIONS] += 1
+        log.info("[연결] 클라이언트 접속: %s", client_address)
+        key = limit_key(client_address) if self.limiter is not None else None
+        if key is not None and not self.limiter.connect(key):
+            # 클라이언트별 동시 연결 수 초과: 미리 인코딩한 에러 응답을 보내고 바로 닫음
+            stats[STAT_CONN_LIMITED] += 1
+            log.warning("[거절] 클라이언트 연결 수 제한 초과: %s", client_address)
+            writer.write(CONNECTION_LIMITED_RESPONSE)
+            try:
+                # 에러 응답을 다 보낸 뒤 닫음 (한 줄이므로 보통 바로 끝남)
+                await writer.drain()
+            except OSError:
+                pass
+            finally:
+                writer.close()
+            return
+        self._add_active(1)
+        if self.tuning:
+            # asyncio가 켜는 TCP_NODELAY처럼 서버 소켓에서 물려받지 못하는 옵션을 다시 설정
+            tune_connection(writer.get_extra_info('socket'), self.tuning)
+        byte_key = self._byte_limit_key(client_address)
+        # 시간 제한을 쓰면 타이머 휠에 등록 (시간이 지나면 transport.abort()로 대기 중인 read/drain을 깨움)
+        watch = self.reaper.watch(writer.transport.abort) if self.reaper is not None else None
+        buffer = None  # 첫 데이터로 JSON/바이너리를 정한 뒤 만드는 수신 버퍼
+        head = b''  # 프로토콜을 정하기 전까지 받은 데이터
+        try:
+            # 클라이언트가 연결을 유지하는 동안 계속 요청 처리
+            while True:
+                # 클라이언트로부터 데이터 수신
+                data = await reader.read(RECV_SIZE)
+                stats[STAT_BYTES_IN] += len(data)
                 
-                # 응답을 JSON 문자열로 변환
-                # ensure_ascii=False: 한글 등 유니코드 문자를 그대로 유지
-                response_data = json.dumps(response, ensure_ascii=False)
+                # 데이터가 없으면 클라이언트가 연결을 종료한 것
+                if not data:
+                    log.debug("[연결 종료] %s", client_address)
+                    break
                 
-                # UTF-8로 인코딩하여 클라이언트에게 전송
-                client_socket.send(response_data.encode('utf-8'))
+                if buffer is None:
+                    # 스레드 엔진과 같은 방식으로 프로토콜 결정
+                    head += data
+                    negotiated = self.negotiate(head)
+                    if negotiated is None:
+                        if watch is not None and watch.phase != PHASE_READ:
+                            watch.enter(PHASE_READ)
+                        continue
+                    buffer, data, reply = negotiated
+                    if reply:
+                        writer.write(reply)
+                        stats[STAT_BYTES_OUT] += len(reply)
+                    binary = isinstance(buffer, BinaryFrameBuffer)
+                    process = self.process_binary_frames if binary else self.process_frames
+                
+                try:
+                    frames = buffer.feed(data)
+                except FrameTooLargeError as e:
+                    # 너무 큰 요청은 에러 응답 후 연결 종료
+                    writer.write(self.frame_error(e, binary))
+                    await writer.drain()
+                    break
                 
+                # 스레드 엔진과 동일한 방식으로 요청 처리
+                # 조각마다 송신 버퍼가 비워질 때까지 대기 (흐름 제어)
+                for chunk in process(frames, client_address):
+                    if watch is not None:
+                        watch.enter(PHASE_WRITE)
+                    writer.write(chunk)
+                    stats[STAT_BYTES_OUT] += len(chunk)
+                    if byte_key is not None:
+                        self.limiter.charge(byte_key, len(chunk))
+                    await writer.drain()
+                
+                if watch is not None:
+                    self._update_watch(watch, frames, buffer)
+                
+                # 서버가 종료 중이면 받은 요청까지만 응답하고 연결 종료
+                if not self.running:
+                    break
+        
+        except asyncio.CancelledError:
+            # 서버 종료로 태스크가 취소된 경우 - 예외를 다시 올리지 않고 조용히 정리
+            # (다시 올리면 asyncio가 종료 중에 CancelledError 트레이스백을 출력함)
+            log.debug("[연결 취소] %s", client_address)
         except Exception as e:
             # 예외 발생 시 에러 메시지 출력
-            print(f"[오류] 클라이언트 처리 중 오류 ({client_address}): {e}")
+            log.warning("[오류] 클라이언트 처리 중 오류 (%s): %s", client_address, e)
         finally:
-            # 모든 경우에 소켓 닫기 (자원 정리)
-            client_socket.close()
-            print(f"[연결 해제] {client_address}")
-            
+            # 모든 경우에 연결 닫기 (자원 정리)
+            if watch is not None:
+                self.reaper.unwatch(watch)
+            writer.close()
+            self._add_active(-1)
+            if key is not None:
+                self.limiter.disconnect(key)
+            log.info("[연결 해제] %s", client_address)
+    
     def stop(self):
         """
         서버를 종료하는 메서드
@@ -191,10 +1658,301 @@ class NEchoServer:
         안전하게 서버를 종료합니다.
         """
         self.running = False  # 서버 실행 플래그를 False로 설정
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+        if self.unix_socket is not None and self._owns_unix_path:
+            # 직접 만든 소켓 파일은 지워서 다음 실행에 남지 않게 함
+            # (워커 모드에서는 감독 프로세스가 지움)
+            self.unix_socket.close()
+            try:
+                os.unlink(self.unix_path)
+            except OSError:
+                pass
+            self._owns_unix_path = False
+        if self._loop is not None:
+            # asyncio 엔진: 다른 스레드(시그널 처리 등)에서도 안전하게 종료 신호 전달
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+            return
         if self.server_socket:
             # 서버 소켓이 열려있으면 닫기
             self.server_socket.close()
-            print("[서버 종료]")
+            log.info("[서버 종료]")
+
+
+class WorkerSupervisor:
+    """
+    멀티 프로세스 워커 감독 클래스
+    
+    워커 프로세스 N개를 fork하여 각각 SO_REUSEPORT로 같은 포트에서 NEchoServer를 실행합니다.
+    파이썬 서버는 GIL 때문에 프로세스 하나당 코어 하나만 사용하므로,
+    워커를 코어 수만큼 띄우면 처리량이 코어 수에 비례해 늘어납니다.
+    
+    - 워커가 비정상 종료되면 같은 슬롯에 새 워커를 다시 fork합니다.
+    - 각 워커의 카운터와 처리 시간 히스토그램은 fork 전에 만든 공유 메모리(mmap)에 기록되며,
+      감독 프로세스가 이를 합산하여 주기적으로 출력하고 메트릭 포트로 제공합니다.
+    - unix_path가 있으면 감독 프로세스가 유닉스 도메인 소켓을 한 번만 만들고,
+      모든 워커가 물려받은 같은 소켓에서 연결을 수락합니다 (SO_REUSEPORT는 TCP에만 해당).
+    """
+    
+    # 워커가 시작 직후 반복해서 죽을 때 재시작 사이에 기다리는 시간 (초)
+    RESTART_DELAY = 1.0
+    
+    def __init__(self, workers, report_interval=10.0, metrics_port=None, **server_options):
+        """
+        감독 객체 초기화 메서드
+        
+        Args:
+            workers (int): 실행할 워커 프로세스 수
+            report_interval (float): 합산 통계를 출력하는 주기 (초, 0이면 출력하지 않음)
+            metrics_port (int): 합산 메트릭 조회 포트 번호 (기본값: None - 메트릭 서버 없음)
+            **server_options: 각 워커의 NEchoServer에 그대로 전달할 설정
+                              (host, port, max_connections, engine, max_n 등)
+        """
+        if workers < 1:
+            raise ValueError("workers는 1 이상이어야 합니다.")
+        self.workers = workers
+        self.server_options = server_options
+        self.host = server_options.get('host', '0.0.0.0')
+        self.port = server_options.get('port', 5000)
+        self.engine = server_options.get('engine', 'thread')
+        self.unix_path = server_options.get('unix_path')
+        self.unix_socket = None  # 모든 워커가 함께 쓰는 유닉스 도메인 서버 소켓
+        self.report_interval = report_interval
+        self.metrics_port = metrics_port
+        self.metrics_server = None  # 합산 메트릭 조회 서버 (metrics_port가 있을 때만 생성)
+        self.running = False
+        self.pids = {}  # 워커 PID -> 슬롯 번호
+        self.started_at = [0.0] * workers  # 슬롯별 마지막 시작 시각
+        self.restarts = 0  # 워커 재시작 횟수
+        # 종료된 워커의 카운터와 히스토그램 누적값 (재시작해도 합계가 줄지 않도록 보관)
+        self.retired = [0] * len(STAT_NAMES)
+        self.retired_latency = LatencyHistogram()
+        # 워커별 카운터 공유 메모리
+        # (슬롯마다 STAT_NAMES 개수의 카운터 + 히스토그램 구간 수만큼의 64비트 정수)
+        self._width = len(STAT_NAMES) + LatencyHistogram.BUCKETS
+        self._shared = mmap.mmap(-1, workers * self._width * 8)
+        self._counters = memoryview(self._shared).cast('Q')
+    
+    def worker_stats(self, slot):
+        """
+        특정 워커 슬롯의 카운터를 공유 메모리에서 읽어오는 메서드
+        
+        Args:
+            slot (int): 워커 슬롯 번호
+        
+        Returns:
+            memoryview: 해당 슬롯의 카운터 배열 (STAT_NAMES 순서)
+        """
+        start = slot * self._width
+        return self._counters[start:start + len(STAT_NAMES)]
+    
+    def worker_latency(self, slot):
+        """
+        특정 워커 슬롯의 처리 시간 히스토그램을 공유 메모리 위에 만드는 메서드
+        
+        Args:
+            slot (int): 워커 슬롯 번호
+        
+        Returns:
+            LatencyHistogram: 해당 슬롯의 구간별 횟수를 공유 메모리에 기록하는 히스토그램
+        """
+        start = slot * self._width + len(STAT_NAMES)
+        return LatencyHistogram(self._counters[start:start + LatencyHistogram.BUCKETS])
+    
+    def aggregate_stats(self):
+        """
+        모든 워커(종료된 워커 포함)의 카운터를 합산하는 메서드
+        
+        Returns:
+            dict: 카운터 이름 -> 합계
+        """
+        totals = list(self.retired)
+        for slot in range(self.workers):
+            for i, value in enumerate(self.worker_stats(slot)):
+                totals[i] += value
+        return dict(zip(STAT_NAMES, totals))
+    
+    def aggregate_latency(self):
+        """
+        모든 워커(종료된 워커 포함)의 처리 시간 히스토그램을 합산하는 메서드
+        
+        Returns:
+            LatencyHistogram: 합산된 히스토그램
+        """
+        totals = LatencyHistogram(list(self.retired_latency.counts))
+        for slot in range(self.workers):
+            totals.merge(self.worker_latency(slot))
+        return totals
+    
+    def metrics(self):
+        """
+        메트릭 조회 서버가 사용할 합산 카운터와 히스토그램을 반환하는 메서드
+        """
+        return self.aggregate_stats(), self.aggregate_latency()
+    
+    def _spawn(self, slot):
+        """
+        슬롯 하나에 워커 프로세스를 fork하는 메서드
+        
+        자식 프로세스는 NEchoServer를 실행하고, 서버가 끝나면 즉시 종료합니다.
+        
+        Args:
+            slot (int): 워커 슬롯 번호
+        """
+        # fork 전에 출력 버퍼를 비워 자식 프로세스에서 같은 내용이 중복 출력되지 않도록 함
+        # (로그 출력 스레드는 자식 프로세스에서 necho_log가 다시 만듦)
+        sys.stdout.flush()
+        pid = os.fork()
+        if pid == 0:
+            # 자식 프로세스: 감독 프로세스의 시그널 핸들러를 기본값으로 되돌림
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            if hasattr(signal, 'SIGHUP'):
+                # 프로세스 그룹 전체에 보낸 SIGHUP으로 워커가 종료되지 않도록 무시 (재시작은 지원하지 않음)
+                signal.signal(signal.SIGHUP, signal.SIG_IGN)
+            if self.metrics_server is not None:
+                # 메트릭 포트는 감독 프로세스만 사용하므로 물려받은 소켓을 닫음
+                self.metrics_server.server_socket.close()
+            exit_code = 0
+            try:
+                server = NEchoServer(reuse_port=True, stats=self.worker_stats(slot),
+                                     latency=self.worker_latency(slot), unix_socket=self.unix_socket,
+                                     **self.server_options)
+                server.start()
+            except BaseException:
+                exit_code = 1
+            finally:
+                # 부모의 finally 블록이나 atexit 처리가 자식에서 실행되지 않도록 즉시 종료
+                # (큐에 남은 로그는 직접 출력한 뒤 종료)
+                shutdown_logging()
+                sys.stdout.flush()
+                os._exit(exit_code)
+        
+        self.pids[pid] = slot
+        self.started_at[slot] = time.monotonic()
+        log.info("[워커 시작] 슬롯 %d, PID %d", slot, pid)
+    
+    def _retire(self, slot):
+        """
+        종료된 워커의 카운터를 누적값으로 옮기고 슬롯을 0으로 초기화하는 메서드
+        
+        active(현재 연결 수)는 누적값이 아니므로 옮기지 않고 0으로만 만듭니다.
+        """
+        counters = self.worker_stats(slot)
+        for i, value in enumerate(counters):
+            if i != STAT_ACTIVE:
+                self.retired[i] += value
+            counters[i] = 0
+        latency = self.worker_latency(slot)
+        self.retired_latency.merge(latency)
+        for i in range(LatencyHistogram.BUCKETS):
+            latency.counts[i] = 0
+    
+    def _handle_signal(self, signum, frame):
+        """
+        SIGTERM/SIGINT를 받으면 감독 루프를 멈추는 시그널 핸들러
+        """
+        self.running = False
+    
+    def _handle_hangup(self, signum, frame):
+        """
+        SIGHUP을 받으면 지원하지 않는다는 경고만 남기는 시그널 핸들러 (워커는 그대로 계속 실행)
+        """
+        log.warning("[소켓 인계] 무중단 재시작은 워커 모드에서 지원하지 않습니다 - SIGHUP을 무시합니다.")
+    
+    def start(self):
+        """
+        워커를 모두 띄우고, 종료될 때까지 워커 상태를 감시하는 메서드
+        
+        죽은 워커는 다시 띄우고, report_interval마다 합산 통계를 출력합니다.
+        SIGTERM 또는 Ctrl+C를 받으면 모든 워커에 SIGTERM을 보내고 종료를 기다립니다.
+        SIGHUP(무중단 재시작)은 워커 모드에서 지원하지 않으므로 경고만 남기고 무시합니다.
+        """
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        signal.signal(signal.SIGINT, self._handle_signal)
+        if hasattr(signal, 'SIGHUP'):
+            # 기본 동작(종료)으로 감독 프로세스만 죽고 워커가 감독 없이 남지 않도록 핸들러 등록
+            signal.signal(signal.SIGHUP, self._handle_hangup)
+        self.running = True
+        
+        log.info("[감독 시작] %s:%s, 워커 %d개 (%s 엔진)", self.host, self.port, self.workers, self.engine)
+        if self.metrics_port is not None:
+            self.metrics_server = MetricsServer(self.metrics, port=self.metrics_port)
+            self.metrics_server.start()
+        if self.unix_path:
+            # fork 전에 만들어 두면 모든 워커가 같은 소켓을 물려받음
+            backlog = ((self.server_options.get('tuning') or {}).get('backlog')
+                       or self.server_options.get('max_connections', 5))
+            try:
+                self.unix_socket = bind_unix_socket(self.unix_path, backlog)
+            except OSError as e:
+                # 다른 서버가 사용 중인 경로 등 - 워커를 띄우지 않고 종료 (남의 소켓 파일은 지우지 않음)
+                log.error("[오류] 감독 시작 실패: %s", e)
+                self.stop()
+                return
+            log.info("[감독 시작] unix:%s", self.unix_path)
+        for slot in range(self.workers):
+            self._spawn(slot)
+        
+        next_report = time.monotonic() + self.report_interval
+        try:
+            while self.running:
+                # 종료된 워커가 있는지 확인 (블로킹하지 않음)
+                try:
+                    pid, status = os.waitpid(-1, os.WNOHANG)
+                except ChildProcessError:
+                    pid, status = 0, 0
+                if pid in self.pids:
+                    slot = self.pids.pop(pid)
+                    self._retire(slot)
+                    if not self.running:
+                        break
+                    log.warning("[워커 종료] 슬롯 %d, PID %d, 상태 %d - 재시작합니다.", slot, pid, status)
+                    # 시작 직후 다시 죽는 경우 잠시 대기하여 재시작 폭주를 막음
+                    if time.monotonic() - self.started_at[slot] < self.RESTART_DELAY:
+                        time.sleep(self.RESTART_DELAY)
+                    self.restarts += 1
+                    self._spawn(slot)
+                    continue
+                
+                if self.report_interval and time.monotonic() >= next_report:
+                    totals = self.aggregate_stats()
+                    p99_ms = self.aggregate_latency().percentile(99) / 1000
+                    log.info("[통계] 워커 %d개, 재시작 %d회, p99=%.2fms, %s", len(self.pids), self.restarts, p99_ms,
+                             ", ".join(f"{name}={value}" for name, value in totals.items()))
+                    next_report = time.monotonic() + self.report_interval
+                
+                time.sleep(0.2)
+        finally:
+            self.stop()
+    
+    def stop(self):
+        """
+        모든 워커에 SIGTERM을 보내고 종료를 기다리는 메서드
+        """
+        self.running = False
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+        for pid in list(self.pids):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in list(self.pids):
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+            self._retire(self.pids.pop(pid))
+        if self.unix_socket is not None:
+            self.unix_socket.close()
+            self.unix_socket = None
+            try:
+                os.unlink(self.unix_path)
+            except OSError:
+                pass
+        totals = self.aggregate_stats()
+        log.info("[감독 종료] %s", ", ".join(f"{name}={value}" for name, value in totals.items()))
 
 
 def main():
@@ -204,20 +1962,120 @@ def main():
     명령줄 인자로 포트 번호를 받아 서버를 생성하고 시작합니다.
     Ctrl+C를 누르면 서버가 안전하게 종료됩니다.
     """
-    # 명령줄 인자로 포트 지정 가능
+    # 명령줄 인자 처리
     # 첫 번째 인자: 포트 번호 (없으면 기본값 5000)
-    port = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    # --engine: 처리 엔진 선택 (thread 또는 asyncio)
+    parser = argparse.ArgumentParser(description='N-Echo TCP/IP 서버')
+    parser.add_argument('port', nargs='?', type=int, default=5000,
+                        help='서버 포트 번호 (기본값: 5000)')
+    parser.add_argument('--engine', choices=ENGINES, default='thread',
+                        help='처리 엔진 (기본값: thread)')
+    parser.add_argument('--pool-size', type=int, default=32,
+                        help='pool 엔진의 작업 스레드 수 (기본값: 32)')
+    parser.add_argument('--queue-size', type=int, default=64,
+                        help='pool 엔진의 연결 대기 큐 크기 (기본값: 64)')
+    parser.add_argument('--max-n', type=int, default=None,
+                        help='허용하는 최대 에코 횟수 (기본값: 제한 없음)')
+    parser.add_argument('--max-response-bytes', type=int, default=None,
+                        help='허용하는 최대 응답 크기(바이트) (기본값: 제한 없음)')
+    parser.add_argument('--cache-bytes', type=int, default=None,
+                        help='JSON 응답 캐시의 바이트 예산 - 같은 요청에 인코딩된 응답을 재사용 (기본값: 사용 안 함)')
+    parser.add_argument('--rate-limit', type=float, default=None, metavar='N',
+                        help='클라이언트 IP당 초당 요청 수 - 넘는 요청은 처리하지 않고 에러 응답 (기본값: 제한 없음)')
+    parser.add_argument('--byte-limit', type=float, default=None, metavar='BYTES',
+                        help='클라이언트 IP당 초당 응답 바이트 (기본값: 제한 없음)')
+    parser.add_argument('--conn-limit', type=int, default=None, metavar='N',
+                        help='클라이언트 IP당 동시 연결 수 - 넘는 연결은 에러 응답 후 닫음 (기본값: 제한 없음)')
+    parser.add_argument('--rate-burst', type=float, default=DEFAULT_BURST, metavar='SEC',
+                        help='--rate-limit/--byte-limit에서 한꺼번에 허용하는 양 (초 단위, 기본값: 1.0)')
+    parser.add_argument('--idle-timeout', type=float, default=None, metavar='SEC',
+                        help='요청 없이 연결을 유지할 수 있는 최대 시간(초) - 넘으면 연결을 끊음 (기본값: 제한 없음)')
+    parser.add_argument('--read-timeout', type=float, default=None, metavar='SEC',
+                        help='요청의 첫 바이트부터 요청이 완성될 때까지의 최대 시간(초) (기본값: 제한 없음)')
+    parser.add_argument('--write-timeout', type=float, default=None, metavar='SEC',
+                        help='응답 조각 하나를 보내는 최대 시간(초) - 응답을 읽지 않는 클라이언트용 (기본값: 제한 없음)')
+    parser.add_argument('--no-sendmsg', action='store_true',
+                        help='큰 echoes 응답도 조각마다 sendall()로 전송 (기본값: thread/pool 엔진은 sendmsg() 사용)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='워커 프로세스 수 - 2 이상이면 SO_REUSEPORT 멀티 프로세스 모드 (기본값: 1)')
+    parser.add_argument('--unix', default=None, metavar='PATH',
+                        help='TCP와 함께 연결을 받을 유닉스 도메인 소켓 경로 (예: /tmp/necho.sock)')
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help='메트릭 조회 포트 - Prometheus 텍스트 형식, 127.0.0.1에서만 접속 (기본값: 사용 안 함)')
+    parser.add_argument('--listen-fd', type=int, action='append', default=None, metavar='FD',
+                        help='바인딩 대신 물려받은 서버 소켓 디스크립터를 사용 (여러 번 지정 가능, '
+                             '기본값: systemd 소켓 활성화의 LISTEN_FDS가 있으면 그 소켓)')
+    parser.add_argument('--ready-fd', type=int, default=None, metavar='FD',
+                        help='연결을 받기 시작하면 한 바이트를 써서 알릴 파이프 (재시작할 때 내부적으로 사용)')
+    parser.add_argument('--drain-timeout', type=float, default=DRAIN_TIMEOUT,
+                        help='SIGHUP 재시작 후 처리 중인 연결을 기다리는 최대 시간(초) (기본값: 30)')
+    parser.add_argument('--log-level', choices=list(LOG_LEVELS), default='info',
+                        help='로그 레벨 (기본값: info)')
+    parser.add_argument('--log-sample', type=int, default=100,
+                        help='요청 로그를 N개 중 1개만 기록 - 1이면 모두, 0이면 기록 안 함 (기본값: 100)')
+    parser.add_argument('--log-payloads', action='store_true',
+                        help='요청 로그에 요청 내용(페이로드)을 포함 (기본값: 크기만 기록)')
+    parser.add_argument('--log-format', choices=LOG_FORMATS, default='plain',
+                        help='로그 형식 - plain 또는 json (기본값: plain)')
+    add_tuning_arguments(parser)
+    args = parser.parse_args()
+    try:
+        # 소켓 튜닝 설정 (--tuning 프로필 위에 항목별 옵션을 덮어씀)
+        tuning = tuning_from_args(args)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    # 물려받은 서버 소켓 (--listen-fd 또는 systemd 소켓 활성화)
+    listen_fds = args.listen_fd or systemd_listen_fds()
+    if listen_fds and args.workers > 1:
+        parser.error('물려받은 소켓(--listen-fd, LISTEN_FDS)은 단일 프로세스 모드에서만 사용할 수 있습니다.')
     
-    # NEchoServer 객체 생성
+    # 로거 설정 (출력은 백그라운드 스레드가 담당)
+    setup_logging(args.log_level, sample=args.log_sample, payloads=args.log_payloads,
+                  fmt=args.log_format)
+    
+    # 서버 설정 (단일 프로세스와 워커 모드 공용)
     # host='0.0.0.0': 모든 네트워크 인터페이스에서 연결 수락
-    server = NEchoServer(host='0.0.0.0', port=port)
+    server_options = {
+        'host': '0.0.0.0',
+        'port': args.port,
+        'engine': args.engine,
+        'max_n': args.max_n,
+        'max_response_bytes': args.max_response_bytes,
+        'pool_size': args.pool_size,
+        'queue_size': args.queue_size,
+        'unix_path': args.unix,
+        'vectored_send': not args.no_sendmsg,
+        'cache_bytes': args.cache_bytes,
+        'rate_limit': args.rate_limit,
+        'byte_limit': args.byte_limit,
+        'conn_limit': args.conn_limit,
+        'rate_burst': args.rate_burst,
+        'idle_timeout': args.idle_timeout,
+        'read_timeout': args.read_timeout,
+        'write_timeout': args.write_timeout,
+        'tuning': tuning,
+    }
+    
+    if args.workers > 1:
+        # 멀티 프로세스 모드: 감독 프로세스가 워커를 관리
+        # (종료 신호 처리도 감독 객체가 담당)
+        WorkerSupervisor(args.workers, metrics_port=args.metrics_port, **server_options).start()
+        return
+    
+    # NEchoServer 객체 생성
+    server = NEchoServer(metrics_port=args.metrics_port, listen_fds=listen_fds,
+                         ready_fd=args.ready_fd, drain_timeout=args.drain_timeout, **server_options)
+    
+    # SIGHUP: 서버 소켓을 새 프로세스에 물려주는 무중단 재시작 (SIGHUP이 없는 Windows 제외)
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, lambda signum, frame: server.request_restart())
     
     try:
         # 서버 시작 (블로킹 호출 - 서버가 종료될 때까지 여기서 대기)
         server.start()
     except KeyboardInterrupt:
         # Ctrl+C를 눌러 프로그램을 중단했을 때
-        print("\n[중단] Ctrl+C 감지")
+        log.info("[중단] Ctrl+C 감지")
         server.stop()
 
 
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+AsyncNEchoClient 테스트 (Python)
+연결 슬롯 선택이 동시 요청을 모든 연결에 나누는지 확인
+
+실행:
+    python3 -m pytest -q test_necho_async.py
+    python3 -m unittest test_necho_async
+"""
+
+# asyncio: 테스트용 N-Echo 서버와 동시 요청
+import asyncio
+# unittest: 표준 라이브러리 테스트 프레임워크 (pytest로도 실행 가능)
+import unittest
+# necho_async: 테스트 대상 클라이언트
+from necho_async import AsyncNEchoClient
+# necho_protocol: 테스트 서버의 요청/응답 프레이밍
+from necho_protocol import FrameBuffer, encode_frame, decode_frame, RECV_SIZE
+
+
+class AsyncNEchoClientSlotTest(unittest.IsolatedAsyncioTestCase):
+    """
+    connections=N일 때 요청이 연결 슬롯에 나뉘는지 확인하는 테스트
+    """
+    
+    async def asyncSetUp(self):
+        self.accepted = 0  # 서버가 수락한 연결 수
+        self.server = await asyncio.start_server(self._serve, '127.0.0.1', 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+    
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+    
+    async def _serve(self, reader, writer):
+        """
+        요청마다 echoes 배열 응답을 보내는 최소 N-Echo 서버
+        """
+        self.accepted += 1
+        buffer = FrameBuffer()
+        try:
+            while True:
+                data = await reader.read(RECV_SIZE)
+                if not data:
+                    break
+                for frame in buffer.feed(data):
+                    request = decode_frame(frame)
+                    writer.write(encode_frame({'status': 'success', 'n': request['n'],
+                                               'echoes': [request['message']] * request['n']}))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    async def test_concurrent_first_requests_spread_across_slots(self):
+        # connect()를 호출하지 않고 동시에 보낸 첫 요청들이 모든 슬롯을 연결해야 함
+        client = AsyncNEchoClient('127.0.0.1', self.port, connections=4)
+        try:
+            responses = await asyncio.gather(*(client.send_request(1, f'msg{i}') for i in range(50)))
+            self.assertEqual([response['echoes'][0] for response in responses],
+                             [f'msg{i}' for i in range(50)])
+            self.assertEqual([conn is not None and not conn.closed for conn in client._slots], [True] * 4)
+            # 슬롯마다 연결은 한 번만 (같은 슬롯을 두 코루틴이 중복 연결하지 않음)
+            self.assertEqual(self.accepted, 4)
+        finally:
+            await client.close()
+    
+    async def test_reconnects_spread_after_close(self):
+        # 연결을 모두 닫은 뒤 동시에 들어온 요청도 다시 모든 슬롯에 나뉘어야 함
+        client = AsyncNEchoClient('127.0.0.1', self.port, connections=3)
+        try:
+            await client.connect()
+            await client.close()
+            await asyncio.gather(*(client.send_request(2, 'again') for _ in range(30)))
+            self.assertEqual([conn is not None and not conn.closed for conn in client._slots], [True] * 3)
+            self.assertEqual(self.accepted, 6)
+        finally:
+            await client.close()
+    
+    async def test_single_slot_connects_once(self):
+        # 슬롯이 하나면 동시 요청이 모두 같은 연결을 기다려서 사용
+        client = AsyncNEchoClient('127.0.0.1', self.port)
+        try:
+            await asyncio.gather(*(client.send_request(1, 'one') for _ in range(20)))
+            self.assertEqual(self.accepted, 1)
+        finally:
+            await client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
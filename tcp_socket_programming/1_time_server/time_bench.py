@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Time 서버 벤치마크 - TCP/IP 소켓 프로그래밍
+Time 서버에 짧은 연결을 반복해서 맺어 초당 처리 가능한 시간 조회 수를 측정하는 프로그램
+
+논블로킹 소켓과 selectors를 사용해 항상 C개의 연결이 진행 중이도록 유지합니다.
+연결 하나는 connect -> 메시지 수신 -> 서버가 연결을 닫으면 close 순서로 끝나고,
+끝나는 즉시 새 연결을 시작합니다.
+
+--udp 옵션을 주면 UDP 모드 서버에 소켓 하나로 C개의 요청 데이터그램을 보내 두고,
+응답을 하나 받을 때마다 요청을 하나 더 보냅니다.
+
+사용 예:
+    python3 time_bench.py 127.0.0.1 9001 -c 64 -d 10
+    python3 time_bench.py 127.0.0.1 9001 -c 64 -d 10 --udp
+"""
+
+import socket
+import argparse
+import selectors
+import time
+import errno
+from collections import OrderedDict
+
+def run_time_bench(host='127.0.0.1', port=9001, concurrency=64, duration=10.0, timeout=3.0):
+    """
+    Time 서버에 duration초 동안 부하를 주고 결과를 반환
+    
+    Args:
+        host: 서버 주소
+        port: 서버 포트 번호
+        concurrency: 동시에 진행할 연결 수
+        duration: 측정 시간 (초)
+        timeout: 연결 하나의 제한 시간 (초) - 서버 대기열이 넘쳐 응답이 오지 않는 연결을 실패로 처리
+    
+    Returns:
+        dict: ok(성공), errors(실패), timeouts(시간 초과), elapsed(마지막 성공까지 걸린 초), sample(받은 메시지 하나)
+    """
+    selector = selectors.DefaultSelector()
+    address = (host, port)
+    results = {'ok': 0, 'errors': 0, 'timeouts': 0, 'elapsed': 0.0, 'sample': b''}
+    pending = OrderedDict()  # 진행 중인 연결 -> 시작 시각 (오래된 순)
+    
+    def start_connection():
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        code = sock.connect_ex(address)
+        if code not in (0, errno.EINPROGRESS):
+            sock.close()
+            results['errors'] += 1
+            return False
+        # 연결이 완료되면 서버가 바로 메시지를 보내므로 읽기 이벤트만 기다림
+        selector.register(sock, selectors.EVENT_READ, bytearray())
+        pending[sock] = time.perf_counter()
+        return True
+    
+    def finish_connection(sock):
+        selector.unregister(sock)
+        del pending[sock]
+        sock.close()
+    
+    started = time.perf_counter()
+    deadline = started + duration
+    for _ in range(concurrency):
+        start_connection()
+    
+    while pending:
+        for key, _ in selector.select(timeout=0.5):
+            sock, received = key.fileobj, key.data
+            try:
+                data = sock.recv(1024)
+            except (BlockingIOError, InterruptedError):
+                continue
+            except OSError:
+                data = None
+            if data:
+                received += data
+                continue
+            
+            # 서버가 연결을 닫음 (data == b'') 또는 오류 (data is None)
+            finish_connection(sock)
+            if data is not None and received:
+                results['ok'] += 1
+                results['elapsed'] = time.perf_counter() - started
+                if not results['sample']:
+                    results['sample'] = bytes(received)
+            else:
+                results['errors'] += 1
+            
+            # 측정 시간이 남았으면 새 연결 시작
+            if time.perf_counter() < deadline:
+                start_connection()
+        
+        # 제한 시간을 넘긴 연결 정리 (가장 오래된 것부터 확인)
+        now = time.perf_counter()
+        while pending:
+            sock, started_at = next(iter(pending.items()))
+            if now - started_at < timeout:
+                break
+            finish_connection(sock)
+            results['timeouts'] += 1
+            if now < deadline:
+                start_connection()
+    
+    selector.close()
+    return results
+
+def run_time_bench_udp(host='127.0.0.1', port=9001, concurrency=64, duration=10.0, timeout=3.0, request=b''):
+    """
+    UDP 모드 Time 서버에 duration초 동안 부하를 주고 결과를 반환
+    
+    응답이 timeout초 동안 하나도 오지 않으면 남은 요청은 유실된 것으로 보고
+    측정 시간이 남았으면 그만큼 다시 보냅니다.
+    
+    Args:
+        host: 서버 주소
+        port: 서버 포트 번호
+        concurrency: 동시에 응답을 기다릴 요청 수
+        duration: 측정 시간 (초)
+        timeout: 응답이 없을 때 유실로 판단하는 시간 (초)
+        request: 요청 데이터그램 내용 (b'ns'이면 나노초 포함 응답)
+    
+    Returns:
+        dict: ok(성공), errors(실패), timeouts(유실), elapsed(마지막 성공까지 걸린 초), sample(받은 메시지 하나)
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.connect((host, port))
+    sock.setblocking(False)
+    selector = selectors.DefaultSelector()
+    selector.register(sock, selectors.EVENT_READ)
+    results = {'ok': 0, 'errors': 0, 'timeouts': 0, 'elapsed': 0.0, 'sample': b''}
+    
+    def send_requests(count):
+        sent = 0
+        for _ in range(count):
+            try:
+                sock.send(request)
+                sent += 1
+            except OSError:
+                results['errors'] += 1
+        return sent
+    
+    started = time.perf_counter()
+    deadline = started + duration
+    outstanding = send_requests(concurrency)
+    last_reply = started
+    
+    while outstanding:
+        if selector.select(timeout=0.5):
+            # 도착한 응답을 모두 읽고 받은 만큼 다시 요청
+            replies = 0
+            while True:
+                try:
+                    data = sock.recv(1024)
+                except (BlockingIOError, InterruptedError):
+                    break
+                except OSError:
+                    # 서버 포트가 닫혀 있다는 ICMP 오류
+                    results['errors'] += 1
+                    outstanding -= 1
+                    continue
+                replies += 1
+                if not results['sample']:
+                    results['sample'] = data
+            now = time.perf_counter()
+            if replies:
+                results['ok'] += replies
+                results['elapsed'] = now - started
+                last_reply = now
+            outstanding -= replies
+            if now < deadline:
+                outstanding += send_requests(concurrency - outstanding)
+            continue
+        
+        # 응답이 끊기면 남은 요청은 유실로 처리
+        now = time.perf_counter()
+        if now - last_reply >= timeout:
+            results['timeouts'] += outstanding
+            outstanding = 0
+            if now < deadline:
+                outstanding = send_requests(concurrency)
+                last_reply = now
+    
+    selector.close()
+    sock.close()
+    return results
+
+if __name__ == "__main__":
+    # 명령줄 인자 처리
+    parser = argparse.ArgumentParser(description='Time 서버 벤치마크')
+    parser.add_argument('host', nargs='?', default='127.0.0.1', help='서버 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('port', nargs='?', type=int, default=9001, help='서버 포트 번호 (기본값: 9001)')
+    parser.add_argument('-c', '--concurrency', type=int, default=64, help='동시 연결 수 (기본값: 64)')
+    parser.add_argument('-d', '--duration', type=float, default=10.0, help='측정 시간(초) (기본값: 10)')
+    parser.add_argument('-t', '--timeout', type=float, default=3.0, help='연결별 제한 시간(초) (기본값: 3)')
+    parser.add_argument('--udp', action='store_true', help='UDP 모드 서버 측정')
+    parser.add_argument('--ns', action='store_true', help='나노초 포함 응답 요청 (--udp와 함께 사용)')
+    args = parser.parse_args()
+    
+    if args.udp:
+        request = b'ns' if args.ns else b''
+        results = run_time_bench_udp(args.host, args.port, args.concurrency, args.duration, args.timeout, request)
+    else:
+        results = run_time_bench(args.host, args.port, args.concurrency, args.duration, args.timeout)
+    
+    print("=" * 60)
+    print(f"[Time 벤치마크] 대상: {args.host}:{args.port} ({'UDP' if args.udp else 'TCP'})")
+    print(f"[Time 벤치마크] 동시 연결: {args.concurrency}, 측정 시간: {args.duration:g}초")
+    print(f"[Time 벤치마크] 성공: {results['ok']}건, 실패: {results['errors']}건, 시간 초과: {results['timeouts']}건")
+    rate = results['ok'] / results['elapsed'] if results['elapsed'] else 0.0
+    print(f"[Time 벤치마크] 처리량: {rate:.0f}건/초")
+    if results['sample']:
+        sample = results['sample'][8:] if args.udp and args.ns else results['sample']
+        print(f"[Time 벤치마크] 수신 예: {sample.decode('utf-8', 'replace')}")
+    print("=" * 60)
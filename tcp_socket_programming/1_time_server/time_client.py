@@ -3,10 +3,21 @@
 """
 Time 클라이언트 - TCP/IP 소켓 프로그래밍
 Time 서버에 접속하여 현재 시간을 받아오는 클라이언트
+
+--udp 옵션을 주면 UDP 모드 서버(time_server.py --udp)에 데이터그램으로 시간을 요청합니다.
+--ns 옵션을 함께 주면 나노초 단위 서버 시간과 왕복 시간, 시계 차이 추정값도 출력합니다.
 """
 
 import socket
-import sys
+import argparse
+import struct
+import time
+
+# 고해상도 시간 요청 데이터그램 내용 (time_server.py의 NS_REQUEST와 같아야 함)
+NS_REQUEST = b'ns'
+
+# 고해상도 응답의 앞부분 - epoch 나노초 (부호 없는 64비트, 네트워크 바이트 순서)
+NS_HEADER = struct.Struct('!Q')
 
 def connect_time_server(host='127.0.0.1', port=9001):
     """
@@ -43,7 +54,7 @@ def connect_time_server(host='127.0.0.1', port=9001):
         print("=" * 60)
         print("[Time 클라이언트] 연결 종료")
         print("=" * 60)
-        
+    
     except ConnectionRefusedError:
         print(f"[오류] 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
         print(f"       주소: {host}:{port}")
@@ -54,14 +65,88 @@ def connect_time_server(host='127.0.0.1', port=9001):
     finally:
         client_socket.close()
 
+def query_time_server_udp(host='127.0.0.1', port=9001, ns=False, timeout=1.0, retries=3):
+    """
+    UDP 모드 Time 서버에 데이터그램으로 시간 요청하기
+    
+    UDP는 데이터그램이 사라질 수 있으므로 timeout초 안에 응답이 없으면 다시 요청합니다.
+    
+    Args:
+        host: 서버 주소
+        port: 서버 포트 번호
+        ns: True이면 나노초 단위 시간을 함께 요청
+        timeout: 응답 대기 시간 (초)
+        retries: 최대 요청 횟수
+    """
+    # UDP 소켓 생성
+    client_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    client_socket.settimeout(timeout)
+    request = NS_REQUEST if ns else b''
+    
+    try:
+        print("=" * 60)
+        print(f"[Time 클라이언트] UDP 시간 요청: {host}:{port}")
+        print("=" * 60)
+        
+        # connect()로 상대 주소를 고정하면 다른 주소에서 온 데이터그램은 받지 않음
+        client_socket.connect((host, port))
+        
+        for attempt in range(1, retries + 1):
+            sent_ns = time.time_ns()
+            client_socket.send(request)
+            try:
+                data = client_socket.recv(1024)
+            except socket.timeout:
+                print(f"[경고] {timeout:g}초 안에 응답이 없습니다. ({attempt}/{retries})")
+                continue
+            received_ns = time.time_ns()
+            
+            print(f"[수신 메시지]")
+            if ns and len(data) >= NS_HEADER.size:
+                server_ns, = NS_HEADER.unpack_from(data)
+                # 서버가 시간을 읽은 시점을 왕복 구간의 가운데로 가정하여 시계 차이 추정
+                round_trip_ns = received_ns - sent_ns
+                offset_ns = server_ns - (sent_ns + round_trip_ns // 2)
+                print(f"  {data[NS_HEADER.size:].decode('utf-8')}")
+                print(f"  서버 시간(epoch 나노초): {server_ns}")
+                print(f"  왕복 시간: {round_trip_ns / 1e6:.3f}ms, 시계 차이(서버 - 클라이언트): {offset_ns / 1e6:+.3f}ms")
+            else:
+                print(f"  {data.decode('utf-8')}")
+            print()
+            break
+        else:
+            print("[오류] 서버로부터 응답을 받지 못했습니다. 서버가 UDP 모드로 실행 중인지 확인하세요.")
+            print(f"       주소: {host}:{port}")
+        
+        print("=" * 60)
+        print("[Time 클라이언트] 종료")
+        print("=" * 60)
+    
+    except ConnectionRefusedError:
+        # 이전 요청에 대해 포트가 닫혀 있다는 ICMP 응답을 받은 경우
+        print(f"[오류] 서버가 응답하지 않습니다. 서버가 UDP 모드로 실행 중인지 확인하세요.")
+        print(f"       주소: {host}:{port}")
+    
+    except Exception as e:
+        print(f"[오류] 클라이언트 오류: {e}")
+    
+    finally:
+        client_socket.close()
+
 if __name__ == "__main__":
     # 명령줄 인자 처리
-    if len(sys.argv) >= 2:
-        host = sys.argv[1]
-        port = int(sys.argv[2]) if len(sys.argv) >= 3 else 9001
-    else:
-        host = '127.0.0.1'
-        port = 9001
+    # 첫 번째 인자: 서버 주소 (기본값: 127.0.0.1), 두 번째 인자: 포트 번호 (기본값: 9001)
+    parser = argparse.ArgumentParser(description='Time 클라이언트')
+    parser.add_argument('host', nargs='?', default='127.0.0.1', help='서버 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('port', nargs='?', type=int, default=9001, help='서버 포트 번호 (기본값: 9001)')
+    parser.add_argument('--udp', action='store_true', help='UDP 모드 서버에 데이터그램으로 요청')
+    parser.add_argument('--ns', action='store_true', help='나노초 단위 서버 시간도 요청 (--udp와 함께 사용)')
+    parser.add_argument('--timeout', type=float, default=1.0, help='UDP 응답 대기 시간(초) (기본값: 1)')
+    parser.add_argument('--retries', type=int, default=3, help='UDP 최대 요청 횟수 (기본값: 3)')
+    args = parser.parse_args()
     
-    connect_time_server(host, port)
+    if args.udp or args.ns:
+        query_time_server_udp(args.host, args.port, args.ns, args.timeout, args.retries)
+    else:
+        connect_time_server(args.host, args.port)
 
@@ -3,19 +3,88 @@
 """
 Time 서버 - TCP/IP 소켓 프로그래밍
 현재 시간을 클라이언트에게 전송하는 서버
+
+--fast 옵션을 주면 고속 모드로 실행합니다.
+  - 보낼 메시지를 초 단위로 한 번만 만들어 두고(캐시) 같은 초의 모든 연결에 재사용
+  - 논블로킹 서버 소켓에서 대기 중인 연결을 한 번에 모두 수락하여 바로 전송 후 종료
+  - 연결마다 출력하지 않고 주기적으로 처리량만 출력
+
+--udp 옵션을 주면 UDP 요청/응답 모드로 실행합니다.
+  - 연결 수립/종료 없이 요청 데이터그램 하나에 응답 데이터그램 하나로 시간 전송
+  - 요청 내용이 b'ns'이면 epoch 나노초(8바이트, 네트워크 바이트 순서) + 시간 메시지를 전송
+  - 그 외의 요청(빈 데이터그램 포함)에는 기존과 같은 시간 메시지만 전송
 """
 
 import socket
 import datetime
 import sys
+import argparse
+import selectors
+import time
+import struct
+
+# 시간 메시지 형식
+TIME_FORMAT = "%Y년 %m월 %d일 %H시 %M분 %S초"
+
+# UDP 모드에서 고해상도 시간을 요청하는 데이터그램 내용
+NS_REQUEST = b'ns'
+
+# 고해상도 응답의 앞부분 - epoch 나노초 (부호 없는 64비트, 네트워크 바이트 순서)
+NS_HEADER = struct.Struct('!Q')
+
+# UDP 요청 데이터그램을 받을 버퍼 크기 (요청은 짧으므로 넘는 부분은 버려짐)
+UDP_RECV_SIZE = 64
+
+def format_time_message(current_time):
+    """
+    클라이언트에게 보낼 시간 메시지 생성
+    
+    Args:
+        current_time: datetime 객체
+    
+    Returns:
+        str: 전송할 메시지
+    """
+    time_str = current_time.strftime(TIME_FORMAT)
+    return f"서버 현재 시간: {time_str}"
 
-def start_time_server(host='0.0.0.0', port=9001):
+class TimeMessageCache:
+    """
+    초 단위로 인코딩된 시간 메시지를 캐시하는 클래스
+    
+    메시지는 초 단위까지만 표시하므로 같은 초 안의 연결은 모두 같은 바이트를 받습니다.
+    초가 바뀔 때만 strftime()과 encode()를 다시 호출합니다.
+    """
+    
+    __slots__ = ('second', 'payload')
+    
+    def __init__(self):
+        self.second = None  # 캐시된 메시지의 시각 (epoch 초)
+        self.payload = b''  # 캐시된 메시지 (UTF-8 바이트)
+    
+    def get(self, second=None):
+        """
+        현재 초의 메시지 바이트 반환 (초가 바뀌었으면 새로 생성)
+        
+        Args:
+            second: 메시지를 만들 시각 (epoch 초, 기본값: None - 현재 시각)
+        """
+        if second is None:
+            second = int(time.time())
+        if second != self.second:
+            current_time = datetime.datetime.fromtimestamp(second)
+            self.payload = format_time_message(current_time).encode('utf-8')
+            self.second = second
+        return self.payload
+
+def start_time_server(host='0.0.0.0', port=9001, backlog=5):
     """
     Time 서버 시작
     
     Args:
         host: 서버 주소 (0.0.0.0은 모든 네트워크 인터페이스에서 수신)
         port: 포트 번호
+        backlog: 연결 대기열 크기 (접속이 한꺼번에 몰리면 넘친 연결은 SYN 재전송 후에야 연결됨)
     """
     # TCP 소켓 생성
     server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -27,8 +96,8 @@ def start_time_server(host='0.0.0.0', port=9001):
         # 소켓을 주소와 바인딩
         server_socket.bind((host, port))
         
-        # 연결 대기 (최대 5개 대기열)
-        server_socket.listen(5)
+        # 연결 대기 (최대 backlog개 대기열)
+        server_socket.listen(backlog)
         
         print("=" * 60)
         print(f"[Time 서버] 서버 시작: {host}:{port}")
@@ -49,15 +118,14 @@ def start_time_server(host='0.0.0.0', port=9001):
             try:
                 # 현재 시간 가져오기
                 current_time = datetime.datetime.now()
-                time_str = current_time.strftime("%Y년 %m월 %d일 %H시 %M분 %S초")
                 
                 # 전송할 메시지 생성
-                message = f"서버 현재 시간: {time_str}"
+                message = format_time_message(current_time)
                 
                 # 클라이언트에게 시간 전송
-                client_socket.send(message.encode('utf-8'))
+                client_socket.sendall(message.encode('utf-8'))
                 print(f"[전송] {message}")
-                
+            
             except Exception as e:
                 print(f"[오류] 클라이언트 처리 중 오류 발생: {e}")
             
@@ -81,8 +149,202 @@ def start_time_server(host='0.0.0.0', port=9001):
         server_socket.close()
         print("[Time 서버] 서버 소켓 종료 완료")
 
+def start_time_server_fast(host='0.0.0.0', port=9001, backlog=4096, report_interval=5.0):
+    """
+    Time 서버 시작 (고속 모드)
+    
+    서버 소켓을 논블로킹으로 두고, 연결이 들어왔다는 알림을 받으면
+    accept()가 BlockingIOError를 낼 때까지 대기 중인 연결을 모두 처리합니다.
+    연결마다 하는 일은 accept, 캐시된 메시지 send, close 세 가지뿐입니다.
+    
+    Args:
+        host: 서버 주소 (0.0.0.0은 모든 네트워크 인터페이스에서 수신)
+        port: 포트 번호
+        backlog: 연결 대기열 크기 (짧은 시간에 몰리는 연결을 버리지 않도록 크게 설정)
+        report_interval: 처리량 출력 주기 (초, 0이면 출력하지 않음)
+    """
+    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    selector = selectors.DefaultSelector()
+    cache = TimeMessageCache()
+    connection_count = 0
+    error_count = 0
+    
+    try:
+        server_socket.bind((host, port))
+        server_socket.listen(backlog)
+        server_socket.setblocking(False)
+        selector.register(server_socket, selectors.EVENT_READ)
+        
+        print("=" * 60)
+        print(f"[Time 서버] 서버 시작: {host}:{port} (고속 모드)")
+        print(f"[Time 서버] 클라이언트 연결 대기 중...")
+        print(f"[Time 서버] 종료하려면 Ctrl+C를 누르세요")
+        print("=" * 60)
+        print()
+        
+        accept = server_socket.accept
+        last_report = time.monotonic()
+        last_count = 0
+        
+        while True:
+            # 연결이 들어오거나 출력 주기가 될 때까지 대기
+            if selector.select(timeout=report_interval or None):
+                payload = cache.get()
+                # 대기 중인 연결을 모두 처리 (연결마다 select를 다시 호출하지 않음)
+                while True:
+                    try:
+                        client_socket, _ = accept()
+                    except (BlockingIOError, InterruptedError):
+                        break
+                    except OSError:
+                        # 파일 디스크립터 부족 등 - 이번 연결만 건너뜀
+                        error_count += 1
+                        break
+                    try:
+                        # 새 소켓의 송신 버퍼는 비어 있으므로 짧은 메시지는 한 번에 들어감
+                        client_socket.send(payload)
+                    except OSError:
+                        error_count += 1
+                    client_socket.close()
+                    connection_count += 1
+            
+            # 처리량 출력 (연결마다가 아니라 주기적으로 한 줄만)
+            if report_interval:
+                now = time.monotonic()
+                if now - last_report >= report_interval:
+                    rate = (connection_count - last_count) / (now - last_report)
+                    if connection_count != last_count:
+                        print(f"[통계] 초당 {rate:.0f}건, 누적 {connection_count}건, 오류 {error_count}건")
+                    last_report, last_count = now, connection_count
+    
+    except KeyboardInterrupt:
+        print("\n" + "=" * 60)
+        print("[Time 서버] 서버를 종료합니다...")
+        print(f"[Time 서버] 총 {connection_count}개의 연결을 처리했습니다. (오류 {error_count}건)")
+        print("=" * 60)
+    
+    except Exception as e:
+        print(f"[오류] 서버 오류: {e}")
+        sys.exit(1)
+    
+    finally:
+        selector.close()
+        server_socket.close()
+        print("[Time 서버] 서버 소켓 종료 완료")
+
+def start_time_server_udp(host='0.0.0.0', port=9001, batch=256, report_interval=5.0):
+    """
+    Time 서버 시작 (UDP 모드)
+    
+    요청 데이터그램 하나에 응답 데이터그램 하나를 보냅니다.
+    읽기 알림을 한 번 받을 때마다 최대 batch개의 데이터그램을 연속으로 읽고 응답하므로,
+    요청이 몰리면 select 호출 한 번으로 여러 요청을 처리합니다.
+    
+    Args:
+        host: 서버 주소 (0.0.0.0은 모든 네트워크 인터페이스에서 수신)
+        port: 포트 번호
+        batch: select 한 번에 처리할 최대 데이터그램 수
+        report_interval: 처리량 출력 주기 (초, 0이면 출력하지 않음)
+    """
+    server_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    selector = selectors.DefaultSelector()
+    cache = TimeMessageCache()
+    request_count = 0
+    error_count = 0
+    
+    try:
+        server_socket.bind((host, port))
+        server_socket.setblocking(False)
+        selector.register(server_socket, selectors.EVENT_READ)
+        
+        print("=" * 60)
+        print(f"[Time 서버] 서버 시작: {host}:{port} (UDP 모드)")
+        print(f"[Time 서버] 요청 대기 중... (b'ns' 요청 시 나노초 시간 포함)")
+        print(f"[Time 서버] 종료하려면 Ctrl+C를 누르세요")
+        print("=" * 60)
+        print()
+        
+        # 요청 내용을 받을 버퍼 하나를 모든 요청이 공유
+        buffer = bytearray(UDP_RECV_SIZE)
+        view = memoryview(buffer)
+        recvfrom_into = server_socket.recvfrom_into
+        sendto = server_socket.sendto
+        pack_ns = NS_HEADER.pack
+        last_report = time.monotonic()
+        last_count = 0
+        
+        while True:
+            # 요청이 들어오거나 출력 주기가 될 때까지 대기
+            if selector.select(timeout=report_interval or None):
+                for _ in range(batch):
+                    try:
+                        size, client_address = recvfrom_into(buffer)
+                    except (BlockingIOError, InterruptedError):
+                        break
+                    except OSError:
+                        # 이전 응답에 대한 ICMP 오류(포트 닫힘 등)가 보고된 경우
+                        error_count += 1
+                        continue
+                    request_count += 1
+                    try:
+                        if view[:size] == NS_REQUEST:
+                            now_ns = time.time_ns()
+                            # 나노초와 같은 초의 메시지를 붙여 전송
+                            sendto(pack_ns(now_ns) + cache.get(now_ns // 1_000_000_000), client_address)
+                        else:
+                            sendto(cache.get(), client_address)
+                    except OSError:
+                        # 송신 버퍼가 가득 찬 경우 등 - UDP이므로 이번 응답은 버림
+                        error_count += 1
+            
+            # 처리량 출력 (요청마다가 아니라 주기적으로 한 줄만)
+            if report_interval:
+                now = time.monotonic()
+                if now - last_report >= report_interval:
+                    rate = (request_count - last_count) / (now - last_report)
+                    if request_count != last_count:
+                        print(f"[통계] 초당 {rate:.0f}건, 누적 {request_count}건, 오류 {error_count}건")
+                    last_report, last_count = now, request_count
+    
+    except KeyboardInterrupt:
+        print("\n" + "=" * 60)
+        print("[Time 서버] 서버를 종료합니다...")
+        print(f"[Time 서버] 총 {request_count}개의 요청을 처리했습니다. (오류 {error_count}건)")
+        print("=" * 60)
+    
+    except Exception as e:
+        print(f"[오류] 서버 오류: {e}")
+        sys.exit(1)
+    
+    finally:
+        selector.close()
+        server_socket.close()
+        print("[Time 서버] 서버 소켓 종료 완료")
+
 if __name__ == "__main__":
-    # 명령줄 인자에서 포트 번호 가져오기 (기본값: 9001)
-    port = int(sys.argv[1]) if len(sys.argv) > 1 else 9001
-    start_time_server(port=port)
+    # 명령줄 인자 처리
+    # 첫 번째 인자: 포트 번호 (기본값: 9001)
+    parser = argparse.ArgumentParser(description='Time 서버')
+    parser.add_argument('port', nargs='?', type=int, default=9001, help='포트 번호 (기본값: 9001)')
+    parser.add_argument('--fast', action='store_true',
+                        help='고속 모드 - 초 단위 메시지 캐시, 논블로킹 일괄 accept, 주기적 통계 출력')
+    parser.add_argument('--udp', action='store_true',
+                        help='UDP 모드 - 요청 데이터그램마다 시간 응답 (b\'ns\' 요청 시 나노초 포함)')
+    parser.add_argument('--backlog', type=int, default=None,
+                        help='TCP 연결 대기열 크기 (기본값: 기본 모드 5, 고속 모드 4096)')
+    args = parser.parse_args()
+    if args.backlog is not None and args.backlog < 1:
+        parser.error("--backlog는 1 이상이어야 합니다")
+    
+    # 대기열 크기를 주지 않으면 모드별 기본값 사용
+    options = {'backlog': args.backlog} if args.backlog else {}
+    
+    if args.udp:
+        start_time_server_udp(port=args.port)
+    elif args.fast:
+        start_time_server_fast(port=args.port, **options)
+    else:
+        start_time_server(port=args.port, **options)
 
@@ -3,18 +3,42 @@
 """
 Echo 서버 - TCP/IP 소켓 프로그래밍
 클라이언트가 보낸 메시지를 그대로 돌려주는 서버
+
+기본 모드는 한 클라이언트와의 대화가 끝나야 다음 클라이언트를 받습니다.
+--concurrent 옵션을 주면 selectors(Linux에서는 epoll) 기반 논블로킹 이벤트 루프 하나에서
+모든 연결을 동시에 처리합니다. 입력이 없는 연결은 소켓과 작은 상태 객체만 차지하므로
+대부분 유휴 상태인 수천 개의 연결을 적은 메모리로 유지할 수 있습니다.
 """
 
 import socket
 import sys
+import argparse
+import selectors
+import time
+from collections import OrderedDict
+
+# 종료 요청 메시지
+QUIT_COMMANDS = (b'quit', b'exit')
+
+# 응답 앞에 붙이는 문자열과 종료 인사 (한 번만 인코딩)
+ECHO_PREFIX = "Echo: ".encode('utf-8')
+GOODBYE_MESSAGE = "Echo 서버 연결을 종료합니다. 안녕히 가세요!".encode('utf-8')
+
+# 한 번의 recv()로 읽을 최대 바이트 수 (동시 모드에서는 모든 연결이 수신 버퍼 하나를 공유)
+RECV_SIZE = 65536
+
+# 클라이언트가 읽지 않아 쌓인 응답이 이 크기를 넘으면 그 연결의 입력을 잠시 읽지 않음
+MAX_OUTBOX_SIZE = 256 * 1024
 
-def start_echo_server(host='0.0.0.0', port=9002):
+def start_echo_server(host='0.0.0.0', port=9002, backlog=5, nodelay=False):
     """
     Echo 서버 시작
     
     Args:
         host: 서버 주소 (0.0.0.0은 모든 네트워크 인터페이스에서 수신)
         port: 포트 번호
+        backlog: 연결 대기열 크기 (접속이 한꺼번에 몰리면 넘친 연결은 SYN 재전송 후에야 연결됨)
+        nodelay: True이면 TCP_NODELAY를 켜서 짧은 응답을 바로 전송
     """
     # TCP 소켓 생성
     server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -26,11 +50,17 @@ def start_echo_server(host='0.0.0.0', port=9002):
         # 소켓을 주소와 바인딩
         server_socket.bind((host, port))
         
-        # 연결 대기 (최대 5개 대기열)
-        server_socket.listen(5)
+        # 짧은 응답을 Nagle 알고리즘으로 모으지 않고 바로 전송 (수락한 연결 소켓이 옵션을 물려받음)
+        if nodelay:
+            server_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        
+        # 연결 대기 (최대 backlog개 대기열)
+        server_socket.listen(backlog)
         
         print("=" * 60)
         print(f"[Echo 서버] 서버 시작: {host}:{port}")
+        if nodelay:
+            print(f"[Echo 서버] TCP_NODELAY 사용")
         print(f"[Echo 서버] 클라이언트 연결 대기 중...")
         print(f"[Echo 서버] 종료하려면 Ctrl+C를 누르세요")
         print("=" * 60)
@@ -63,15 +93,15 @@ def start_echo_server(host='0.0.0.0', port=9002):
                     # 'quit' 또는 'exit' 메시지 확인
                     if received_message.lower().strip() in ['quit', 'exit']:
                         print(f"[수신 #{message_count}] 종료 요청: {received_message}")
-                        response = "Echo 서버 연결을 종료합니다. 안녕히 가세요!"
-                        client_socket.send(response.encode('utf-8'))
+                        # sendall(): 송신 버퍼가 부족해도 메시지를 끝까지 전송
+                        client_socket.sendall(GOODBYE_MESSAGE)
                         break
                     
                     print(f"[수신 #{message_count}] {received_message}")
                     
                     # 받은 메시지를 그대로 돌려보냄 (Echo)
                     echo_message = f"Echo: {received_message}"
-                    client_socket.send(echo_message.encode('utf-8'))
+                    client_socket.sendall(echo_message.encode('utf-8'))
                     print(f"[전송 #{message_count}] {echo_message}")
                 
                 print(f"[통계] 총 {message_count}개의 메시지를 처리했습니다.")
@@ -99,8 +129,225 @@ def start_echo_server(host='0.0.0.0', port=9002):
         server_socket.close()
         print("[Echo 서버] 서버 소켓 종료 완료")
 
+class EchoConnection:
+    """
+    동시 모드에서 연결 하나의 상태
+    
+    수신한 데이터는 바로 응답으로 바꾸므로 연결마다 수신 버퍼를 따로 두지 않고,
+    아직 보내지 못한 응답(outbox)만 연결별로 보관합니다. 유휴 연결의 outbox는 비어 있습니다.
+    """
+    
+    __slots__ = ('outbox', 'closing', 'last_active', 'message_count')
+    
+    def __init__(self):
+        self.outbox = bytearray()  # 아직 보내지 못한 응답 (송신 버퍼)
+        self.closing = False  # 종료 요청을 받았는지 (응답을 다 보내면 연결 종료)
+        self.last_active = time.monotonic()  # 마지막 수신 시각 (유휴 시간 초과 판단)
+        self.message_count = 0  # 처리한 메시지 수
+
+def close_connection(selector, connections, sock):
+    """
+    연결을 닫고 선택자와 연결 목록에서 제거
+    
+    Args:
+        selector: 연결을 감시하는 selectors 객체
+        connections: 소켓 -> EchoConnection (마지막 수신 순서로 정렬된 OrderedDict)
+        sock: 닫을 클라이언트 소켓
+    """
+    connections.pop(sock, None)
+    try:
+        selector.unregister(sock)
+    except (KeyError, ValueError):
+        pass
+    sock.close()
+
+def flush_connection(selector, connections, sock, conn):
+    """
+    연결에 쌓인 응답을 보낼 수 있는 만큼 보내고, 감시할 이벤트를 다시 설정
+    
+    논블로킹 send()는 송신 버퍼에 들어간 만큼만 보내고 보낸 바이트 수를 반환하므로,
+    보내지 못한 뒷부분은 outbox에 남겨 두었다가 소켓이 쓰기 가능해지면(EVENT_WRITE) 이어서 보냅니다.
+    
+    Args:
+        selector: 연결을 감시하는 selectors 객체
+        connections: 소켓 -> EchoConnection
+        sock: 클라이언트 소켓
+        conn: 해당 소켓의 EchoConnection
+    """
+    outbox = conn.outbox
+    if outbox:
+        try:
+            sent = sock.send(outbox)
+            del outbox[:sent]
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError:
+            close_connection(selector, connections, sock)
+            return
+    
+    if not outbox and conn.closing:
+        # 종료 인사까지 모두 보냈으면 연결 종료
+        close_connection(selector, connections, sock)
+        return
+    
+    # 보낼 데이터가 남아 있으면 쓰기 이벤트도 감시
+    # 클라이언트가 응답을 읽지 않아 많이 쌓였으면 더 이상 입력을 읽지 않음 (흐름 제어)
+    events = 0
+    if len(outbox) < MAX_OUTBOX_SIZE and not conn.closing:
+        events |= selectors.EVENT_READ
+    if outbox:
+        events |= selectors.EVENT_WRITE
+    if selector.get_key(sock).events != events:
+        selector.modify(sock, events, conn)
+
+def start_echo_server_concurrent(host='0.0.0.0', port=9002, max_connections=10000, idle_timeout=300.0,
+                                 backlog=1024, nodelay=False):
+    """
+    Echo 서버 시작 (동시 모드)
+    
+    하나의 스레드에서 selectors로 모든 연결을 감시하며, 데이터가 도착한 연결만 처리합니다.
+    입력을 기다리는 클라이언트가 있어도 다른 클라이언트의 메시지는 바로 에코됩니다.
+    
+    Args:
+        host: 서버 주소 (0.0.0.0은 모든 네트워크 인터페이스에서 수신)
+        port: 포트 번호
+        max_connections: 동시에 유지할 수 있는 최대 연결 수 (넘으면 바로 연결 종료)
+        idle_timeout: 수신 없이 연결을 유지하는 최대 시간 (초, 넘으면 연결 종료, 0이면 제한 없음)
+        backlog: 연결 대기열 크기
+        nodelay: True이면 TCP_NODELAY를 켜서 짧은 응답을 바로 전송
+    """
+    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    selector = selectors.DefaultSelector()
+    # 마지막 수신이 오래된 순서로 정렬된 연결 목록 (유휴 연결을 앞에서부터 정리)
+    connections = OrderedDict()
+    # 모든 연결이 함께 쓰는 수신 버퍼 (recv_into로 복사 없이 읽음)
+    recv_buffer = bytearray(RECV_SIZE)
+    recv_view = memoryview(recv_buffer)
+    connection_count = 0
+    message_count = 0
+    expired_count = 0
+    
+    try:
+        server_socket.bind((host, port))
+        if nodelay:
+            server_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # 접속이 한꺼번에 몰려도 대기열이 넘치지 않도록 큰 백로그 사용
+        server_socket.listen(backlog)
+        server_socket.setblocking(False)
+        selector.register(server_socket, selectors.EVENT_READ, None)
+        
+        print("=" * 60)
+        print(f"[Echo 서버] 서버 시작: {host}:{port} (동시 모드, 최대 {max_connections}개 연결)")
+        if nodelay:
+            print(f"[Echo 서버] TCP_NODELAY 사용")
+        print(f"[Echo 서버] 클라이언트 연결 대기 중...")
+        print(f"[Echo 서버] 종료하려면 Ctrl+C를 누르세요")
+        print("=" * 60)
+        print()
+        
+        while True:
+            for key, events in selector.select(timeout=1.0):
+                if key.data is None:
+                    # 서버 소켓: 대기 중인 연결을 모두 수락
+                    while True:
+                        try:
+                            client_socket, client_address = server_socket.accept()
+                        except (BlockingIOError, InterruptedError):
+                            break
+                        if len(connections) >= max_connections:
+                            client_socket.close()
+                            continue
+                        client_socket.setblocking(False)
+                        connection_count += 1
+                        conn = EchoConnection()
+                        connections[client_socket] = conn
+                        selector.register(client_socket, selectors.EVENT_READ, conn)
+                    continue
+                
+                sock, conn = key.fileobj, key.data
+                if events & selectors.EVENT_READ:
+                    try:
+                        size = sock.recv_into(recv_buffer)
+                    except (BlockingIOError, InterruptedError):
+                        size = None
+                    except OSError:
+                        size = 0
+                    if size == 0:
+                        # 클라이언트가 연결을 종료함
+                        close_connection(selector, connections, sock)
+                        continue
+                    if size:
+                        conn.last_active = time.monotonic()
+                        connections.move_to_end(sock)
+                        conn.message_count += 1
+                        message_count += 1
+                        data = recv_view[:size]
+                        if bytes(data).strip().lower() in QUIT_COMMANDS:
+                            conn.outbox += GOODBYE_MESSAGE
+                            conn.closing = True
+                        else:
+                            # 받은 메시지를 그대로 돌려보냄 (Echo)
+                            conn.outbox += ECHO_PREFIX
+                            conn.outbox += data
+                
+                flush_connection(selector, connections, sock, conn)
+            
+            # 수신 없이 idle_timeout이 지난 연결 정리 (가장 오래된 연결부터 확인)
+            if idle_timeout:
+                deadline = time.monotonic() - idle_timeout
+                while connections:
+                    sock, conn = next(iter(connections.items()))
+                    if conn.last_active > deadline:
+                        break
+                    expired_count += 1
+                    close_connection(selector, connections, sock)
+    
+    except KeyboardInterrupt:
+        print("\n" + "=" * 60)
+        print("[Echo 서버] 서버를 종료합니다...")
+        print(f"[Echo 서버] 총 {connection_count}개의 연결, {message_count}개의 메시지를 처리했습니다.")
+        print(f"[Echo 서버] 유휴 시간 초과로 닫은 연결: {expired_count}개, 열려 있던 연결: {len(connections)}개")
+        print("=" * 60)
+    
+    except Exception as e:
+        print(f"[오류] 서버 오류: {e}")
+        sys.exit(1)
+    
+    finally:
+        for sock in list(connections):
+            close_connection(selector, connections, sock)
+        selector.close()
+        server_socket.close()
+        print("[Echo 서버] 서버 소켓 종료 완료")
+
 if __name__ == "__main__":
-    # 명령줄 인자에서 포트 번호 가져오기 (기본값: 9002)
-    port = int(sys.argv[1]) if len(sys.argv) > 1 else 9002
-    start_echo_server(port=port)
+    # 명령줄 인자 처리
+    # 첫 번째 인자: 포트 번호 (기본값: 9002)
+    parser = argparse.ArgumentParser(description='Echo 서버')
+    parser.add_argument('port', nargs='?', type=int, default=9002, help='포트 번호 (기본값: 9002)')
+    parser.add_argument('--concurrent', action='store_true',
+                        help='모든 연결을 동시에 처리하는 동시 모드 (selectors 논블로킹 이벤트 루프)')
+    parser.add_argument('--max-connections', type=int, default=10000,
+                        help='동시 모드의 최대 동시 연결 수 (기본값: 10000)')
+    parser.add_argument('--idle-timeout', type=float, default=300.0,
+                        help='동시 모드에서 수신 없이 연결을 유지하는 최대 시간(초), 0이면 제한 없음 (기본값: 300)')
+    parser.add_argument('--backlog', type=int, default=None,
+                        help='연결 대기열 크기 (기본값: 기본 모드 5, 동시 모드 1024)')
+    parser.add_argument('--nodelay', action='store_true',
+                        help='TCP_NODELAY - 짧은 에코 응답을 모으지 않고 바로 전송')
+    args = parser.parse_args()
+    if args.backlog is not None and args.backlog < 1:
+        parser.error("--backlog는 1 이상이어야 합니다")
+    
+    # 대기열 크기를 주지 않으면 모드별 기본값 사용
+    options = {'nodelay': args.nodelay}
+    if args.backlog:
+        options['backlog'] = args.backlog
+    
+    if args.concurrent:
+        start_echo_server_concurrent(port=args.port, max_connections=args.max_connections,
+                                     idle_timeout=args.idle_timeout, **options)
+    else:
+        start_echo_server(port=args.port, **options)
 
@@ -3,11 +3,133 @@
 """
 Number 서버 - TCP/IP 소켓 프로그래밍
 숫자 맞추기 게임 서버 (1~100 사이의 랜덤 숫자를 맞추는 게임)
+
+기본 모드는 한 번에 한 명씩 게임을 진행합니다.
+--concurrent 옵션을 주면 selectors 기반 이벤트 루프 하나에서 여러 게임을 동시에 진행합니다.
+게임마다 GameSession 객체 하나(정답, 시도 횟수, 보낼 데이터)만 사용하므로
+스레드 없이 수천 개의 게임을 작은 메모리로 처리할 수 있습니다.
 """
 
 import socket
 import sys
 import random
+import argparse
+import selectors
+import time
+from collections import OrderedDict
+
+# 게임당 최대 시도 횟수
+MAX_ATTEMPTS = 10
+
+# 게임 결과 종류 (GameSession.play()의 반환값)
+RESULT_INVALID = 'invalid'  # 숫자가 아닌 입력
+RESULT_UP = 'up'            # 정답이 더 큼
+RESULT_DOWN = 'down'        # 정답이 더 작음
+RESULT_WIN = 'win'          # 정답
+RESULT_LOSE = 'lose'        # 기회를 모두 사용
+RESULT_QUIT = 'quit'        # 포기
+
+# 게임이 끝나는 결과
+FINISHED_RESULTS = (RESULT_WIN, RESULT_LOSE, RESULT_QUIT)
+
+# 환영 메시지 (모든 게임이 같은 내용이므로 한 번만 인코딩)
+WELCOME_MESSAGE = (
+    "========================================\n"
+    "   숫자 맞추기 게임에 오신 것을 환영합니다!\n"
+    "========================================\n"
+    "규칙:\n"
+    "  - 1부터 100 사이의 숫자를 맞춰보세요.\n"
+    f"  - 기회는 {MAX_ATTEMPTS}번 있습니다.\n"
+    "  - 'quit'를 입력하면 포기합니다.\n"
+    "========================================\n"
+).encode('utf-8')
+
+# 동시 게임 수가 최대치에 도달했을 때 보내는 메시지
+BUSY_MESSAGE = "[알림] 진행 중인 게임이 너무 많습니다. 잠시 후 다시 접속해주세요.\n".encode('utf-8')
+
+# 입력 없이 오래 기다린 게임을 끝낼 때 보내는 메시지
+IDLE_MESSAGE = "\n[알림] 입력 시간이 초과되어 게임을 종료합니다.\n".encode('utf-8')
+
+# 클라이언트가 읽지 않아 쌓인 응답이 이 크기를 넘으면 그 게임의 입력을 잠시 읽지 않음
+MAX_OUTBOX_SIZE = 64 * 1024
+
+class GameSession:
+    """
+    숫자 맞추기 게임 한 판의 상태
+    
+    __slots__를 사용해 게임당 메모리를 수십 바이트 수준으로 줄였습니다.
+    동시 모드에서는 보내지 못한 응답(outbox)과 마지막 입력 시각도 함께 보관합니다.
+    """
+    
+    __slots__ = ('secret_number', 'attempts', 'outbox', 'finished', 'last_active')
+    
+    def __init__(self):
+        # 1~100 사이의 랜덤 숫자 생성
+        self.secret_number = random.randint(1, 100)
+        self.attempts = 0
+        self.outbox = bytearray()  # 아직 보내지 못한 응답 (동시 모드)
+        self.finished = False  # 게임이 끝났는지 (응답을 다 보내면 연결 종료)
+        self.last_active = time.monotonic()  # 마지막 입력 시각 (유휴 시간 초과 판단)
+    
+    def play(self, user_input):
+        """
+        입력 한 줄을 처리하여 응답 메시지와 결과를 반환
+        
+        Args:
+            user_input: 클라이언트가 보낸 입력 (앞뒤 공백 제거 전)
+        
+        Returns:
+            tuple: (응답 메시지 문자열, 결과 종류 - RESULT_* 중 하나)
+        """
+        user_input = user_input.strip()
+        secret_number = self.secret_number
+        
+        # 포기 확인
+        if user_input.lower() == 'quit':
+            self.finished = True
+            return f"\n게임을 포기하셨습니다. 정답은 {secret_number}이었습니다.\n", RESULT_QUIT
+        
+        # 숫자 유효성 검사
+        try:
+            guess = int(user_input)
+        except ValueError:
+            return "[오류] 올바른 숫자를 입력해주세요.\n", RESULT_INVALID
+        
+        self.attempts += 1
+        attempts = self.attempts
+        remaining = MAX_ATTEMPTS - attempts
+        
+        if guess == secret_number:
+            # 정답!
+            self.finished = True
+            msg = (
+                f"\n{'='*40}\n"
+                f"🎉 축하합니다! 정답입니다! 🎉\n"
+                f"정답: {secret_number}\n"
+                f"시도 횟수: {attempts}회\n"
+                f"{'='*40}\n"
+            )
+            return msg, RESULT_WIN
+        
+        # 숫자 비교
+        if guess < secret_number:
+            msg = f"[시도 {attempts}/{MAX_ATTEMPTS}] UP! 더 큰 숫자입니다. (남은 기회: {remaining})\n"
+            result = RESULT_UP
+        else:
+            msg = f"[시도 {attempts}/{MAX_ATTEMPTS}] DOWN! 더 작은 숫자입니다. (남은 기회: {remaining})\n"
+            result = RESULT_DOWN
+        
+        if remaining <= 0:
+            # 기회를 모두 사용한 경우 (마지막 힌트와 함께 한 번에 전송)
+            self.finished = True
+            msg += (
+                f"\n{'='*40}\n"
+                f"아쉽습니다! 기회를 모두 사용했습니다.\n"
+                f"정답은 {secret_number}이었습니다.\n"
+                f"{'='*40}\n"
+            )
+            result = RESULT_LOSE
+        return msg, result
 
 def handle_client(client_socket, client_address):
     """
@@ -17,28 +139,15 @@ def handle_client(client_socket, client_address):
         client_socket: 클라이언트 소켓
         client_address: 클라이언트 주소
     """
-    # 1~100 사이의 랜덤 숫자 생성
-    secret_number = random.randint(1, 100)
-    max_attempts = 10
-    attempts = 0
+    session = GameSession()
     
-    print(f"[게임 시작] 정답: {secret_number} (클라이언트에게는 비밀)")
+    print(f"[게임 시작] 정답: {session.secret_number} (클라이언트에게는 비밀)")
     
     # 환영 메시지 전송
-    welcome_msg = (
-        "========================================\n"
-        "   숫자 맞추기 게임에 오신 것을 환영합니다!\n"
-        "========================================\n"
-        "규칙:\n"
-        "  - 1부터 100 사이의 숫자를 맞춰보세요.\n"
-        f"  - 기회는 {max_attempts}번 있습니다.\n"
-        "  - 'quit'를 입력하면 포기합니다.\n"
-        "========================================\n"
-    )
-    client_socket.send(welcome_msg.encode('utf-8'))
+    client_socket.sendall(WELCOME_MESSAGE)
     
     try:
-        while attempts < max_attempts:
+        while not session.finished:
             # 클라이언트로부터 숫자 입력 받기
             data = client_socket.recv(1024)
             
@@ -46,73 +155,34 @@ def handle_client(client_socket, client_address):
                 print(f"[알림] 클라이언트가 연결을 종료했습니다.")
                 break
             
-            user_input = data.decode('utf-8').strip()
+            msg, result = session.play(data.decode('utf-8', 'replace'))
+            client_socket.sendall(msg.encode('utf-8'))
             
-            # 포기 확인
-            if user_input.lower() == 'quit':
-                msg = f"\n게임을 포기하셨습니다. 정답은 {secret_number}이었습니다.\n"
-                client_socket.send(msg.encode('utf-8'))
+            if result == RESULT_QUIT:
                 print(f"[알림] 클라이언트가 게임을 포기했습니다.")
-                break
-            
-            # 숫자 유효성 검사
-            try:
-                guess = int(user_input)
-            except ValueError:
-                msg = "[오류] 올바른 숫자를 입력해주세요.\n"
-                client_socket.send(msg.encode('utf-8'))
+            elif result == RESULT_INVALID:
                 continue
-            
-            attempts += 1
-            remaining = max_attempts - attempts
-            
-            print(f"[시도 {attempts}] 입력: {guess}")
-            
-            # 숫자 비교
-            if guess < secret_number:
-                msg = f"[시도 {attempts}/{max_attempts}] UP! 더 큰 숫자입니다. (남은 기회: {remaining})\n"
-                client_socket.send(msg.encode('utf-8'))
-                print(f"[응답] UP")
-            
-            elif guess > secret_number:
-                msg = f"[시도 {attempts}/{max_attempts}] DOWN! 더 작은 숫자입니다. (남은 기회: {remaining})\n"
-                client_socket.send(msg.encode('utf-8'))
-                print(f"[응답] DOWN")
-            
             else:
-                # 정답!
-                msg = (
-                    f"\n{'='*40}\n"
-                    f"🎉 축하합니다! 정답입니다! 🎉\n"
-                    f"정답: {secret_number}\n"
-                    f"시도 횟수: {attempts}회\n"
-                    f"{'='*40}\n"
-                )
-                client_socket.send(msg.encode('utf-8'))
-                print(f"[게임 종료] 클라이언트가 {attempts}번 만에 정답을 맞췄습니다!")
-                break
-        
-        else:
-            # 기회를 모두 사용한 경우
-            msg = (
-                f"\n{'='*40}\n"
-                f"아쉽습니다! 기회를 모두 사용했습니다.\n"
-                f"정답은 {secret_number}이었습니다.\n"
-                f"{'='*40}\n"
-            )
-            client_socket.send(msg.encode('utf-8'))
-            print(f"[게임 종료] 클라이언트가 기회를 모두 사용했습니다.")
+                print(f"[시도 {session.attempts}] 입력: {data.decode('utf-8', 'replace').strip()}")
+                if result == RESULT_WIN:
+                    print(f"[게임 종료] 클라이언트가 {session.attempts}번 만에 정답을 맞췄습니다!")
+                elif result == RESULT_LOSE:
+                    print(f"[게임 종료] 클라이언트가 기회를 모두 사용했습니다.")
+                else:
+                    print(f"[응답] {result.upper()}")
     
     except Exception as e:
         print(f"[오류] 게임 진행 중 오류 발생: {e}")
 
-def start_number_server(host='0.0.0.0', port=9003):
+def start_number_server(host='0.0.0.0', port=9003, backlog=5, nodelay=False):
     """
     Number 서버 시작
     
     Args:
         host: 서버 주소 (0.0.0.0은 모든 네트워크 인터페이스에서 수신)
         port: 포트 번호
+        backlog: 연결 대기열 크기 (접속이 한꺼번에 몰리면 넘친 연결은 SYN 재전송 후에야 연결됨)
+        nodelay: True이면 TCP_NODELAY를 켜서 짧은 응답을 바로 전송
     """
     # TCP 소켓 생성
     server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -124,11 +194,17 @@ def start_number_server(host='0.0.0.0', port=9003):
         # 소켓을 주소와 바인딩
         server_socket.bind((host, port))
         
-        # 연결 대기 (최대 5개 대기열)
-        server_socket.listen(5)
+        # 짧은 응답을 Nagle 알고리즘으로 모으지 않고 바로 전송 (수락한 연결 소켓이 옵션을 물려받음)
+        if nodelay:
+            server_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        
+        # 연결 대기 (최대 backlog개 대기열)
+        server_socket.listen(backlog)
         
         print("=" * 60)
         print(f"[Number 서버] 서버 시작: {host}:{port}")
+        if nodelay:
+            print(f"[Number 서버] TCP_NODELAY 사용")
         print(f"[Number 서버] 클라이언트 연결 대기 중...")
         print(f"[Number 서버] 종료하려면 Ctrl+C를 누르세요")
         print("=" * 60)
@@ -170,8 +246,211 @@ def start_number_server(host='0.0.0.0', port=9003):
         server_socket.close()
         print("[Number 서버] 서버 소켓 종료 완료")
 
+def close_session(selector, sessions, sock):
+    """
+    게임 연결을 닫고 선택자와 세션 목록에서 제거
+    
+    Args:
+        selector: 연결을 감시하는 selectors 객체
+        sessions: 소켓 -> GameSession (마지막 입력 순서로 정렬된 OrderedDict)
+        sock: 닫을 클라이언트 소켓
+    """
+    sessions.pop(sock, None)
+    try:
+        selector.unregister(sock)
+    except (KeyError, ValueError):
+        pass
+    sock.close()
+
+def flush_session(selector, sessions, sock, session):
+    """
+    세션에 쌓인 응답을 보낼 수 있는 만큼 보내고, 감시할 이벤트를 다시 설정
+    
+    send()는 소켓 송신 버퍼에 들어간 만큼만 보내므로, 남은 부분은 outbox에 두었다가
+    소켓이 쓰기 가능해지면(EVENT_WRITE) 이어서 보냅니다.
+    
+    Args:
+        selector: 연결을 감시하는 selectors 객체
+        sessions: 소켓 -> GameSession
+        sock: 클라이언트 소켓
+        session: 해당 소켓의 GameSession
+    """
+    outbox = session.outbox
+    if outbox:
+        try:
+            sent = sock.send(outbox)
+            del outbox[:sent]
+        except BlockingIOError:
+            pass
+        except OSError:
+            close_session(selector, sessions, sock)
+            return
+    
+    if not outbox and session.finished:
+        # 마지막 응답까지 모두 보냈으면 게임 종료
+        close_session(selector, sessions, sock)
+        return
+    
+    # 보낼 데이터가 남아 있으면 쓰기 이벤트도 감시
+    # 클라이언트가 응답을 읽지 않아 많이 쌓였거나 게임이 끝났으면 더 이상 입력을 읽지 않음
+    events = 0
+    if len(outbox) < MAX_OUTBOX_SIZE and not session.finished:
+        events |= selectors.EVENT_READ
+    if outbox:
+        events |= selectors.EVENT_WRITE
+    if selector.get_key(sock).events != events:
+        selector.modify(sock, events, session)
+
+def start_number_server_concurrent(host='0.0.0.0', port=9003, max_games=10000, idle_timeout=300.0,
+                                   backlog=1024, nodelay=False):
+    """
+    Number 서버 시작 (동시 모드)
+    
+    하나의 스레드에서 selectors로 모든 연결을 감시하며,
+    게임마다 입력이 도착했을 때만 GameSession.play()를 호출하는 상태 기계로 동작합니다.
+    한 플레이어가 입력을 고민하는 동안에도 다른 플레이어의 게임이 계속 진행됩니다.
+    
+    Args:
+        host: 서버 주소 (0.0.0.0은 모든 네트워크 인터페이스에서 수신)
+        port: 포트 번호
+        max_games: 동시에 진행할 수 있는 최대 게임 수 (넘으면 안내 메시지 후 연결 종료)
+        idle_timeout: 입력 없이 기다리는 최대 시간 (초, 넘으면 게임 종료, 0이면 제한 없음)
+        backlog: 연결 대기열 크기
+        nodelay: True이면 TCP_NODELAY를 켜서 짧은 응답을 바로 전송
+    """
+    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    selector = selectors.DefaultSelector()
+    # 마지막 입력이 오래된 순서로 정렬된 세션 목록 (유휴 게임을 앞에서부터 정리)
+    sessions = OrderedDict()
+    game_count = 0
+    
+    try:
+        server_socket.bind((host, port))
+        if nodelay:
+            server_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # 접속이 한꺼번에 몰려도 대기열이 넘치지 않도록 큰 백로그 사용
+        server_socket.listen(backlog)
+        server_socket.setblocking(False)
+        selector.register(server_socket, selectors.EVENT_READ, None)
+        
+        print("=" * 60)
+        print(f"[Number 서버] 서버 시작: {host}:{port} (동시 모드, 최대 {max_games}게임)")
+        if nodelay:
+            print(f"[Number 서버] TCP_NODELAY 사용")
+        print(f"[Number 서버] 클라이언트 연결 대기 중...")
+        print(f"[Number 서버] 종료하려면 Ctrl+C를 누르세요")
+        print("=" * 60)
+        print()
+        
+        while True:
+            for key, events in selector.select(timeout=1.0):
+                if key.data is None:
+                    # 서버 소켓: 대기 중인 연결을 모두 수락
+                    while True:
+                        try:
+                            client_socket, client_address = server_socket.accept()
+                        except (BlockingIOError, InterruptedError):
+                            break
+                        client_socket.setblocking(False)
+                        if len(sessions) >= max_games:
+                            try:
+                                client_socket.send(BUSY_MESSAGE)
+                            except OSError:
+                                pass
+                            client_socket.close()
+                            continue
+                        
+                        game_count += 1
+                        session = GameSession()
+                        session.outbox += WELCOME_MESSAGE
+                        sessions[client_socket] = session
+                        selector.register(client_socket, selectors.EVENT_READ, session)
+                        flush_session(selector, sessions, client_socket, session)
+                    continue
+                
+                sock, session = key.fileobj, key.data
+                if events & selectors.EVENT_READ:
+                    try:
+                        data = sock.recv(1024)
+                    except (BlockingIOError, InterruptedError):
+                        data = None
+                    except OSError:
+                        data = b''
+                    if data == b'':
+                        # 클라이언트가 연결을 종료함
+                        close_session(selector, sessions, sock)
+                        continue
+                    if data:
+                        session.last_active = time.monotonic()
+                        sessions.move_to_end(sock)
+                        # 클라이언트는 입력 하나를 보내고 응답을 기다리므로 recv 한 번이 입력 하나
+                        # (nc처럼 줄바꿈으로 구분해 여러 줄을 보내면 줄마다 처리)
+                        for line in data.decode('utf-8', 'replace').splitlines() or ['']:
+                            msg, result = session.play(line)
+                            session.outbox += msg.encode('utf-8')
+                            if session.finished:
+                                break
+                
+                flush_session(selector, sessions, sock, session)
+            
+            # 입력 없이 idle_timeout이 지난 게임 정리 (가장 오래된 세션부터 확인)
+            if idle_timeout:
+                deadline = time.monotonic() - idle_timeout
+                while sessions:
+                    sock, session = next(iter(sessions.items()))
+                    if session.last_active > deadline:
+                        break
+                    try:
+                        sock.send(IDLE_MESSAGE)
+                    except OSError:
+                        pass
+                    close_session(selector, sessions, sock)
+    
+    except KeyboardInterrupt:
+        print("\n" + "=" * 60)
+        print("[Number 서버] 서버를 종료합니다...")
+        print(f"[Number 서버] 총 {game_count}개의 게임을 진행했습니다. (진행 중 {len(sessions)}개)")
+        print("=" * 60)
+    
+    except Exception as e:
+        print(f"[오류] 서버 오류: {e}")
+        sys.exit(1)
+    
+    finally:
+        for sock in list(sessions):
+            close_session(selector, sessions, sock)
+        selector.close()
+        server_socket.close()
+        print("[Number 서버] 서버 소켓 종료 완료")
+
 if __name__ == "__main__":
-    # 명령줄 인자에서 포트 번호 가져오기 (기본값: 9003)
-    port = int(sys.argv[1]) if len(sys.argv) > 1 else 9003
-    start_number_server(port=port)
+    # 명령줄 인자 처리
+    # 첫 번째 인자: 포트 번호 (기본값: 9003)
+    parser = argparse.ArgumentParser(description='Number 게임 서버')
+    parser.add_argument('port', nargs='?', type=int, default=9003, help='포트 번호 (기본값: 9003)')
+    parser.add_argument('--concurrent', action='store_true',
+                        help='여러 게임을 동시에 진행하는 동시 모드 (selectors 이벤트 루프)')
+    parser.add_argument('--max-games', type=int, default=10000,
+                        help='동시 모드의 최대 동시 게임 수 (기본값: 10000)')
+    parser.add_argument('--idle-timeout', type=float, default=300.0,
+                        help='동시 모드에서 입력을 기다리는 최대 시간(초), 0이면 제한 없음 (기본값: 300)')
+    parser.add_argument('--backlog', type=int, default=None,
+                        help='연결 대기열 크기 (기본값: 기본 모드 5, 동시 모드 1024)')
+    parser.add_argument('--nodelay', action='store_true',
+                        help='TCP_NODELAY - 짧은 게임 응답을 모으지 않고 바로 전송')
+    args = parser.parse_args()
+    if args.backlog is not None and args.backlog < 1:
+        parser.error("--backlog는 1 이상이어야 합니다")
+    
+    # 대기열 크기를 주지 않으면 모드별 기본값 사용
+    options = {'nodelay': args.nodelay}
+    if args.backlog:
+        options['backlog'] = args.backlog
+    
+    if args.concurrent:
+        start_number_server_concurrent(port=args.port, max_games=args.max_games,
+                                       idle_timeout=args.idle_timeout, **options)
+    else:
+        start_number_server(port=args.port, **options)
 